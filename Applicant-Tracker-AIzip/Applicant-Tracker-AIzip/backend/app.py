@@ -0,0 +1,143 @@
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+
+from backend.core import config
+from backend.core.body_limit import BodySizeLimitMiddleware
+from backend.core.assets import AssetManifest, PrecompressedStaticFiles, asset_response
+from backend.core.lifecycle import Deadline, inflight_matches
+from backend.core.read_routing import ReadYourWritesMiddleware
+from backend import coordination
+from backend.database.db import init_db
+from backend.database.replicas import get_replicas
+from backend.services.application_writer import stop_application_writer
+from backend.services.batch_scoring import queue_threads, shutdown_pools
+from backend.services.retention import retention_metrics, start_compaction, stop_compaction
+from backend.services.vocabulary import get_vocabulary, load_vocabulary
+from backend.routers.auth import router as auth_router
+from backend.routers.resumes import router as resumes_router
+from backend.routers.jobs import router as jobs_router
+from backend.routers.match import router as match_router
+from backend.routers.applications import router as applications_router
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(init_db)
+    await run_in_threadpool(load_vocabulary)
+    if get_replicas().replicas and config.SERVER_WORKERS > 1 and config.CACHE_BACKEND == "memory":
+        logger.warning(
+            "Read replicas with %d workers and the memory cache: clients without "
+            "cookies may not read their own writes; set ATS_CACHE_BACKEND",
+            config.SERVER_WORKERS,
+        )
+    coordination.start(worker_threads=queue_threads())
+    start_compaction()
+    yield
+    # The steps below share one graceful timeout between them
+    deadline = Deadline(config.GRACEFUL_SHUTDOWN_SECONDS)
+    await run_in_threadpool(stop_compaction, deadline.remaining())
+    # Requests have finished; flush any batched application writes
+    await run_in_threadpool(stop_application_writer, deadline.remaining())
+    # Stop leasing new tasks; tasks already running are drained below
+    await run_in_threadpool(coordination.stop, deadline.remaining())
+    # Uvicorn has already stopped accepting connections at this point;
+    # wait for matches that are still running before the worker exits.
+    drained = await run_in_threadpool(inflight_matches.drain, deadline.remaining())
+    if not drained:
+        logger.warning(
+            "Shutdown timed out with %d match(es) still in flight",
+            inflight_matches.count,
+        )
+    shutdown_pools()
+    await run_in_threadpool(get_vocabulary().save)
+
+
+def create_app() -> FastAPI:
+    """
+    Builds the ATS application: API routers, system endpoints and the
+    static frontend.
+    """
+    app = FastAPI(title="AI ATS Platform", lifespan=lifespan)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Reject oversized request bodies before they are read into memory
+    app.add_middleware(BodySizeLimitMiddleware, max_bytes=config.MAX_REQUEST_BYTES)
+
+    # Route a client's reads to the primary for a while after it writes
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    # Compress JSON API responses above the size threshold
+    app.add_middleware(GZipMiddleware, minimum_size=config.GZIP_MINIMUM_SIZE)
+
+    # Mount frontend files (fingerprinted, precompressed and cacheable)
+    if config.FRONTEND_DIR.is_dir():
+        manifest = AssetManifest(config.FRONTEND_DIR)
+        app.state.assets = manifest
+        app.mount(
+            "/static",
+            PrecompressedStaticFiles(manifest, max_age=config.STATIC_CACHE_MAX_AGE),
+            name="static",
+        )
+
+        @app.api_route("/", methods=["GET", "HEAD"], include_in_schema=False)
+        def root(request: Request):
+            asset, _ = manifest.lookup("index.html")
+            return asset_response(request, asset, immutable=False, max_age=config.STATIC_CACHE_MAX_AGE)
+    else:
+        @app.get("/", include_in_schema=False)
+        def root():
+            return {"status": "AI ATS backend running"}
+
+    @app.get("/health", tags=["System"])
+    @app.get("/api/health", tags=["System"], include_in_schema=False)
+    def health_check():
+        """
+        Returns the system health status.
+        """
+        return {"status": "ok"}
+
+    @app.get("/info", tags=["System"])
+    def get_info():
+        """
+        Returns application information and enabled features.
+        """
+        return {
+            "app_name": "AI ATS Platform",
+            "version": "1.0.0",
+            "features": [
+                "User Authentication (JWT)",
+                "Resume Ingestion",
+                "Job Description Management",
+                "AI-Powered Keyword Matching",
+                "Application Tracking Workflow"
+            ]
+        }
+
+    @app.get("/metrics", tags=["System"])
+    def get_metrics():
+        """
+        Returns match history retention, compaction and replica metrics.
+        """
+        return {"retention": retention_metrics(), "replicas": get_replicas().status()}
+
+    app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
+    app.include_router(resumes_router, prefix="/resumes", tags=["Resumes"])
+    app.include_router(jobs_router, prefix="/jobs", tags=["Jobs"])
+    app.include_router(match_router, prefix="/match", tags=["Matching"])
+    app.include_router(applications_router, prefix="/applications", tags=["Applications"])
+
+    return app
@@ -0,0 +1,14 @@
+from .cache import CacheBackend, MemoryCache, FileCache
+from .queue import Task, WorkQueue, MemoryWorkQueue, DatabaseWorkQueue
+from .broadcast import Broadcaster, LocalBroadcaster, DatabaseBroadcaster
+from .worker import QueueWorker, register_handler
+from .registry import (
+    configure,
+    get_broadcaster,
+    get_cache,
+    get_queue,
+    invalidate,
+    on_invalidate,
+    start,
+    stop,
+)
@@ -0,0 +1,156 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Set
+
+from sqlalchemy import delete, func, insert, select
+
+from backend.database.db import engine
+from backend.database.models import CoordinationEvent
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[Any], None]
+
+# Events older than this are pruned from the shared log by compaction
+EVENT_RETENTION_SECONDS = 3600
+# Ids below the highest one seen that are checked again on every poll.
+# Postgres assigns ids at INSERT, so an event can commit after events
+# with higher ids were already delivered.
+EVENT_RECHECK_IDS = 1000
+
+
+class Broadcaster:
+    """
+    Publishes messages to every API instance subscribed to a channel,
+    including the publishing one.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, List[Callback]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str, callback: Callback):
+        with self._lock:
+            self._subscribers[channel].append(callback)
+
+    def _deliver(self, channel: str, message: Any):
+        with self._lock:
+            callbacks = list(self._subscribers.get(channel, ()))
+        for callback in callbacks:
+            try:
+                callback(message)
+            except Exception:
+                logger.exception("Subscriber for %s failed", channel)
+
+    def publish(self, channel: str, message: Any):
+        raise NotImplementedError
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class LocalBroadcaster(Broadcaster):
+    """
+    Delivers messages to subscribers in this process immediately.
+    """
+
+    def publish(self, channel: str, message: Any):
+        self._deliver(channel, message)
+
+
+class DatabaseBroadcaster(Broadcaster):
+    """
+    Appends messages to the coordination_events table; each instance polls
+    for events it hasn't delivered among the newest ones. Delivery to other
+    nodes lags by up to one poll interval.
+    """
+
+    def __init__(self, bind=None, poll_seconds: float = 1.0):
+        super().__init__()
+        self.bind = bind or engine
+        self.poll_seconds = poll_seconds
+        self._last_seen = None
+        # Delivered ids within EVENT_RECHECK_IDS of _last_seen
+        self._delivered: Set[int] = set()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def publish(self, channel: str, message: Any):
+        with self.bind.begin() as conn:
+            conn.execute(insert(CoordinationEvent).values(
+                channel=channel,
+                message=json.dumps(message),
+                created_at=time.time(),
+            ))
+
+    def poll(self):
+        """
+        Delivers events published since the previous poll, including ones
+        that committed after events with higher ids. An idle poll is a
+        single SELECT of ids.
+        """
+        with self.bind.connect() as conn:
+            if self._last_seen is None:
+                # Only events published after this instance started matter
+                self._last_seen = conn.execute(
+                    select(func.coalesce(func.max(CoordinationEvent.id), 0))
+                ).scalar_one()
+                self._delivered = set(conn.execute(
+                    select(CoordinationEvent.id)
+                    .where(CoordinationEvent.id > self._last_seen - EVENT_RECHECK_IDS)
+                ).scalars())
+                return
+            ids = conn.execute(
+                select(CoordinationEvent.id)
+                .where(CoordinationEvent.id > self._last_seen - EVENT_RECHECK_IDS)
+            ).scalars()
+            pending = [event_id for event_id in ids if event_id not in self._delivered]
+            rows = []
+            if pending:
+                rows = conn.execute(
+                    select(CoordinationEvent.id, CoordinationEvent.channel, CoordinationEvent.message)
+                    .where(CoordinationEvent.id.in_(pending))
+                    .order_by(CoordinationEvent.id)
+                ).all()
+
+        for row in rows:
+            self._delivered.add(row.id)
+            self._last_seen = max(self._last_seen, row.id)
+            self._deliver(row.channel, json.loads(row.message))
+        if rows:
+            floor = self._last_seen - EVENT_RECHECK_IDS
+            self._delivered = {event_id for event_id in self._delivered if event_id > floor}
+
+    def _run(self):
+        while not self._stop.wait(self.poll_seconds):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Polling coordination events failed")
+
+    def start(self):
+        if self._thread is None:
+            self.poll()
+            self._thread = threading.Thread(target=self._run, name="broadcast-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds * 2)
+            self._thread = None
+
+
+def prune_events(conn, now: float) -> int:
+    """
+    Deletes events older than EVENT_RETENTION_SECONDS. Run by compaction.
+    """
+    return conn.execute(delete(CoordinationEvent).where(
+        CoordinationEvent.created_at < now - EVENT_RETENTION_SECONDS
+    )).rowcount
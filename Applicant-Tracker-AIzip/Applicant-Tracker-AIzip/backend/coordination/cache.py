@@ -0,0 +1,186 @@
+import hashlib
+import os
+import pickle
+import stat
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# Expired entries nobody reads again are dropped at most this often, on a
+# write, so one-off keys don't accumulate forever.
+SWEEP_SECONDS = 60
+
+
+class CacheBackend:
+    """
+    Interface for caches shared by API instances. Values must be picklable.
+    A ttl of None means the entry never expires.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+def _expires_at(ttl: Optional[float]) -> Optional[float]:
+    return None if ttl is None else time.time() + ttl
+
+
+def _expired(expires_at: Optional[float]) -> bool:
+    return expires_at is not None and expires_at <= time.time()
+
+
+class MemoryCache(CacheBackend):
+    """
+    Cache held in this process only.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if _expired(expires_at):
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            if time.time() >= self._next_sweep:
+                self._sweep()
+            self._entries[key] = (value, _expires_at(ttl))
+
+    def _sweep(self):
+        self._entries = {key: entry for key, entry in self._entries.items() if not _expired(entry[1])}
+        self._next_sweep = time.time() + SWEEP_SECONDS
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache(CacheBackend):
+    """
+    Cache stored as one file per key in a directory, shared by every process
+    that can see the directory. Writes go through a temporary file and an
+    atomic rename, so readers never see a partial entry. Stands in for a
+    network cache in tests and single-host deployments.
+
+    Each file starts with the expiry time as an 8-byte double (infinity
+    for none), so sweeping reads only that header, then the pickled value.
+    """
+
+    HEADER = struct.Struct("<d")
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        # Entries are pickles: keep the directory private to this user
+        self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self._check_private(self.directory)
+        self._next_sweep = 0.0
+
+    @staticmethod
+    def _check_private(directory: Path):
+        """
+        Refuses a directory another user could write to. Loading a pickle
+        planted there would run that user's code in this process; mkdir()
+        doesn't check a directory that already existed.
+        """
+        st = os.lstat(directory)
+        if not stat.S_ISDIR(st.st_mode):
+            raise RuntimeError(f"Cache directory {directory} is not a directory (or is a symlink)")
+        if hasattr(os, "getuid") and st.st_uid != os.getuid():
+            raise RuntimeError(f"Cache directory {directory} is owned by another user")
+        if st.st_mode & 0o077:
+            raise RuntimeError(
+                f"Cache directory {directory} is accessible to other users "
+                f"(mode {stat.S_IMODE(st.st_mode):o}); it must be 0700"
+            )
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.entry"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                (expires_at,) = self.HEADER.unpack(f.read(self.HEADER.size))
+                if expires_at > time.time():
+                    return pickle.load(f)
+        except (FileNotFoundError, EOFError, struct.error, pickle.UnpicklingError):
+            return None
+        self.delete(key)
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        if time.time() >= self._next_sweep:
+            self.sweep()
+        expires_at = _expires_at(ttl)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.HEADER.pack(float("inf") if expires_at is None else expires_at))
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def sweep(self) -> int:
+        """
+        Deletes expired entries; returns how many. Every process sharing
+        the directory sweeps. An entry replaced while it was being checked
+        may be deleted, which only costs a cache miss.
+        """
+        now = time.time()
+        self._next_sweep = now + SWEEP_SECONDS
+        removed = 0
+        for path in self.directory.glob("*.entry"):
+            try:
+                with open(path, "rb") as f:
+                    (expires_at,) = self.HEADER.unpack(f.read(self.HEADER.size))
+                if expires_at <= now:
+                    path.unlink()
+                    removed += 1
+            except (FileNotFoundError, struct.error):
+                pass
+        return removed
+
+    def delete(self, key: str):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for path in self.directory.glob("*.entry"):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,244 @@
+import itertools
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, delete, func, or_, select, update
+
+from backend.database.db import engine
+from backend.database.models import WorkItem
+
+# Seconds added per failed attempt before a task becomes visible again
+RETRY_BACKOFF_SECONDS = 5
+
+
+@dataclass
+class Task:
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+class WorkQueue:
+    """
+    Interface for a work queue shared by API instances. A leased task is
+    invisible to other workers until it is completed, failed, or its lease
+    expires (e.g. the node holding it died), after which it is handed out
+    again until max_attempts is reached.
+    """
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], max_attempts: int = 3) -> int:
+        raise NotImplementedError
+
+    def enqueue_many(self, kind: str, payloads: List[Dict[str, Any]], max_attempts: int = 3):
+        for payload in payloads:
+            self.enqueue(kind, payload, max_attempts)
+
+    def lease(self, worker_id: str, lease_seconds: float,
+              kinds: Optional[Sequence[str]] = None) -> Optional[Task]:
+        raise NotImplementedError
+
+    def complete(self, task: Task):
+        raise NotImplementedError
+
+    def fail(self, task: Task, error: str) -> bool:
+        """
+        Records a failed attempt. Returns True if the task will be retried,
+        False if it has exhausted its attempts.
+        """
+        raise NotImplementedError
+
+
+@dataclass
+class _MemoryItem:
+    task: Task
+    available_at: float
+    lease_expires_at: Optional[float] = None
+    dead: bool = False
+
+
+class MemoryWorkQueue(WorkQueue):
+    """
+    Work queue held in this process only.
+    """
+
+    def __init__(self):
+        self._items: Dict[int, _MemoryItem] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], max_attempts: int = 3) -> int:
+        with self._lock:
+            task_id = next(self._ids)
+            task = Task(task_id, kind, payload, attempts=0, max_attempts=max_attempts)
+            self._items[task_id] = _MemoryItem(task, available_at=time.time())
+        return task_id
+
+    def lease(self, worker_id: str, lease_seconds: float,
+              kinds: Optional[Sequence[str]] = None) -> Optional[Task]:
+        now = time.time()
+        with self._lock:
+            for item in self._items.values():
+                if item.dead or (kinds and item.task.kind not in kinds):
+                    continue
+                if item.lease_expires_at is not None and item.lease_expires_at > now:
+                    continue
+                if item.available_at > now:
+                    continue
+                if item.task.attempts >= item.task.max_attempts:
+                    item.dead = True
+                    continue
+                item.task.attempts += 1
+                item.lease_expires_at = now + lease_seconds
+                return item.task
+        return None
+
+    def complete(self, task: Task):
+        with self._lock:
+            self._items.pop(task.id, None)
+
+    def fail(self, task: Task, error: str) -> bool:
+        with self._lock:
+            item = self._items.get(task.id)
+            if item is None:
+                return False
+            item.lease_expires_at = None
+            if task.attempts >= task.max_attempts:
+                item.dead = True
+                return False
+            item.available_at = time.time() + RETRY_BACKOFF_SECONDS * task.attempts
+            return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for item in self._items.values() if not item.dead)
+
+
+class DatabaseWorkQueue(WorkQueue):
+    """
+    Work queue stored in the work_items table. Every node pointing at the
+    same database pulls from one queue; leasing is a conditional UPDATE, so
+    two workers can never hold the same task at once.
+    """
+
+    # Candidates fetched per lease attempt; losers of a race try the next
+    CANDIDATES = 10
+
+    def __init__(self, bind=None):
+        self.bind = bind or engine
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], max_attempts: int = 3) -> int:
+        with self.bind.begin() as conn:
+            result = conn.execute(WorkItem.__table__.insert().values(
+                kind=kind,
+                payload=json.dumps(payload),
+                status="queued",
+                attempts=0,
+                max_attempts=max_attempts,
+                available_at=time.time(),
+            ))
+            return result.inserted_primary_key[0]
+
+    def enqueue_many(self, kind: str, payloads: List[Dict[str, Any]], max_attempts: int = 3):
+        now = time.time()
+        rows = [{
+            "kind": kind,
+            "payload": json.dumps(payload),
+            "status": "queued",
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "available_at": now,
+        } for payload in payloads]
+        if rows:
+            with self.bind.begin() as conn:
+                conn.execute(WorkItem.__table__.insert(), rows)
+
+    @staticmethod
+    def _leasable(now: float):
+        return and_(
+            WorkItem.attempts < WorkItem.max_attempts,
+            or_(
+                and_(WorkItem.status == "queued", WorkItem.available_at <= now),
+                and_(WorkItem.status == "leased", WorkItem.lease_expires_at < now),
+            ),
+        )
+
+    @staticmethod
+    def _expired_final(now: float):
+        # Leased on its last attempt and never completed: the node died
+        return and_(
+            WorkItem.status == "leased",
+            WorkItem.lease_expires_at < now,
+            WorkItem.attempts >= WorkItem.max_attempts,
+        )
+
+    def lease(self, worker_id: str, lease_seconds: float,
+              kinds: Optional[Sequence[str]] = None) -> Optional[Task]:
+        now = time.time()
+        with self.bind.begin() as conn:
+            # Only a read when the queue is idle: polling workers must not
+            # contend for the write lock.
+            query = select(WorkItem.id, WorkItem.attempts, WorkItem.max_attempts)\
+                .where(or_(self._leasable(now), self._expired_final(now)))
+            if kinds:
+                query = query.where(WorkItem.kind.in_(kinds))
+            candidates = conn.execute(query.order_by(WorkItem.id).limit(self.CANDIDATES)).all()
+
+            for candidate in candidates:
+                if candidate.attempts >= candidate.max_attempts:
+                    conn.execute(
+                        update(WorkItem)
+                        .where(WorkItem.id == candidate.id, self._expired_final(now))
+                        .values(status="dead", last_error="Lease expired")
+                    )
+                    continue
+                result = conn.execute(
+                    update(WorkItem)
+                    .where(WorkItem.id == candidate.id, self._leasable(now))
+                    .values(
+                        status="leased",
+                        leased_by=worker_id,
+                        lease_expires_at=now + lease_seconds,
+                        attempts=WorkItem.attempts + 1,
+                    )
+                )
+                if result.rowcount == 1:
+                    row = conn.execute(select(WorkItem).where(WorkItem.id == candidate.id)).mappings().one()
+                    return Task(
+                        id=row["id"],
+                        kind=row["kind"],
+                        payload=json.loads(row["payload"]),
+                        attempts=row["attempts"],
+                        max_attempts=row["max_attempts"],
+                    )
+        return None
+
+    def complete(self, task: Task):
+        with self.bind.begin() as conn:
+            conn.execute(delete(WorkItem).where(WorkItem.id == task.id))
+
+    def fail(self, task: Task, error: str) -> bool:
+        retry = task.attempts < task.max_attempts
+        with self.bind.begin() as conn:
+            conn.execute(
+                update(WorkItem)
+                .where(WorkItem.id == task.id)
+                .values(
+                    status="queued" if retry else "dead",
+                    available_at=time.time() + RETRY_BACKOFF_SECONDS * task.attempts,
+                    lease_expires_at=None,
+                    last_error=error,
+                )
+            )
+        return retry
+
+    def pending_count(self) -> int:
+        with self.bind.connect() as conn:
+            return conn.execute(
+                select(func.count()).select_from(WorkItem)
+                .where(WorkItem.status.in_(["queued", "leased"]))
+            ).scalar_one()
@@ -0,0 +1,120 @@
+import threading
+from typing import Optional
+
+from backend.core import config
+from .broadcast import Broadcaster, DatabaseBroadcaster, LocalBroadcaster
+from .cache import CacheBackend, FileCache, MemoryCache
+from .queue import DatabaseWorkQueue, MemoryWorkQueue, WorkQueue
+from .worker import QueueWorker
+
+INVALIDATION_CHANNEL = "cache.invalidate"
+
+_lock = threading.Lock()
+_cache: Optional[CacheBackend] = None
+_queue: Optional[WorkQueue] = None
+_broadcaster: Optional[Broadcaster] = None
+_worker: Optional[QueueWorker] = None
+
+
+def _build_cache() -> CacheBackend:
+    if config.CACHE_BACKEND == "file":
+        return FileCache(config.CACHE_DIR)
+    return MemoryCache()
+
+
+def _build_queue() -> WorkQueue:
+    if config.QUEUE_BACKEND == "database":
+        return DatabaseWorkQueue()
+    return MemoryWorkQueue()
+
+
+def _build_broadcaster() -> Broadcaster:
+    if config.BROADCAST_BACKEND == "database":
+        return DatabaseBroadcaster(poll_seconds=config.BROADCAST_POLL_SECONDS)
+    return LocalBroadcaster()
+
+
+def get_cache() -> CacheBackend:
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = _build_cache()
+        return _cache
+
+
+def get_queue() -> WorkQueue:
+    global _queue
+    with _lock:
+        if _queue is None:
+            _queue = _build_queue()
+        return _queue
+
+
+def get_broadcaster() -> Broadcaster:
+    global _broadcaster
+    with _lock:
+        if _broadcaster is None:
+            _broadcaster = _build_broadcaster()
+            _broadcaster.subscribe(INVALIDATION_CHANNEL, _drop_local)
+        return _broadcaster
+
+
+def configure(cache: Optional[CacheBackend] = None, queue: Optional[WorkQueue] = None,
+              broadcaster: Optional[Broadcaster] = None):
+    """
+    Installs specific backends, e.g. shared stand-ins in tests.
+    """
+    global _cache, _queue, _broadcaster
+    with _lock:
+        if cache is not None:
+            _cache = cache
+        if queue is not None:
+            _queue = queue
+        if broadcaster is not None:
+            _broadcaster = broadcaster
+            _broadcaster.subscribe(INVALIDATION_CHANNEL, _drop_local)
+
+
+def _drop_local(key: str):
+    get_cache().delete(key)
+
+
+def invalidate(key: str):
+    """
+    Removes a cache entry here and tells every other instance to drop its
+    copy too.
+    """
+    get_cache().delete(key)
+    get_broadcaster().publish(INVALIDATION_CHANNEL, key)
+
+
+def on_invalidate(callback):
+    """
+    Subscribes to cache invalidations from any instance, for in-process
+    structures that mirror cached data.
+    """
+    get_broadcaster().subscribe(INVALIDATION_CHANNEL, callback)
+
+
+def start(worker_threads: int):
+    """
+    Starts the invalidation listener and the queue worker for this instance.
+    """
+    global _worker
+    get_broadcaster().start()
+    if worker_threads > 0 and _worker is None:
+        _worker = QueueWorker(
+            get_queue(),
+            threads=worker_threads,
+            lease_seconds=config.QUEUE_LEASE_SECONDS,
+            poll_seconds=config.QUEUE_POLL_SECONDS,
+        )
+        _worker.start()
+
+
+def stop(timeout: Optional[float] = None):
+    global _worker
+    if _worker is not None:
+        _worker.stop(timeout)
+        _worker = None
+    get_broadcaster().stop()
@@ -0,0 +1,95 @@
+import logging
+import os
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from backend.core.lifecycle import inflight_matches
+from .queue import Task, WorkQueue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Handler:
+    run: Callable[[dict], None]
+    # Called once a task has exhausted its attempts
+    on_failure: Optional[Callable[[dict, str], None]] = None
+
+
+_handlers: Dict[str, Handler] = {}
+
+
+def register_handler(kind: str, on_failure: Optional[Callable[[dict, str], None]] = None):
+    """
+    Decorator registering the function that processes tasks of a kind.
+    """
+    def decorator(func: Callable[[dict], None]):
+        _handlers[kind] = Handler(func, on_failure)
+        return func
+    return decorator
+
+
+class QueueWorker:
+    """
+    Threads that lease tasks from the work queue and run their handlers.
+    Every API instance runs one, so adding nodes adds consumers.
+    """
+
+    def __init__(self, queue: WorkQueue, threads: int, lease_seconds: float, poll_seconds: float):
+        self.queue = queue
+        self.threads = threads
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        for index in range(self.threads):
+            thread = threading.Thread(
+                target=self._run,
+                args=(f"{prefix}:{index}",),
+                name=f"queue-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run_once(self, worker_id: str) -> bool:
+        """
+        Leases and processes a single task. Returns False if none was ready.
+        """
+        task = self.queue.lease(worker_id, self.lease_seconds, kinds=list(_handlers))
+        if task is None:
+            return False
+        self._process(task)
+        return True
+
+    def _process(self, task: Task):
+        handler = _handlers[task.kind]
+        with inflight_matches.track():
+            try:
+                handler.run(task.payload)
+            except Exception as exc:
+                logger.exception("Task %s (%s) failed on attempt %d", task.id, task.kind, task.attempts)
+                if not self.queue.fail(task, str(exc)) and handler.on_failure is not None:
+                    handler.on_failure(task.payload, str(exc))
+            else:
+                self.queue.complete(task)
+
+    def _run(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                if not self.run_once(worker_id):
+                    self._stop.wait(self.poll_seconds)
+            except Exception:
+                logger.exception("Queue worker %s failed to lease", worker_id)
+                self._stop.wait(self.poll_seconds)
@@ -0,0 +1,215 @@
+import gzip
+import hashlib
+import mimetypes
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict
+
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+)
+
+# Served for hashed names: the URL changes whenever the content does
+IMMUTABLE_CACHE = "public, max-age={max_age}, immutable"
+# Served for plain names and HTML pages: always revalidate via ETag
+REVALIDATE_CACHE = "no-cache"
+
+
+@dataclass
+class Asset:
+    name: str
+    hashed_name: str
+    media_type: str
+    etag: str
+    # Maps content-encoding ("identity", "gzip", "br") to the encoded body
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def _hashed_name(name: str, digest: str) -> str:
+    path = Path(name)
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def _build_variants(body: bytes, media_type: str) -> Dict[str, bytes]:
+    variants = {"identity": body}
+    if not _is_compressible(media_type):
+        return variants
+
+    gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+    if len(gzipped) < len(body):
+        variants["gzip"] = gzipped
+
+    if brotli is not None:
+        brotlied = brotli.compress(body, quality=11)
+        if len(brotlied) < len(body):
+            variants["br"] = brotlied
+
+    return variants
+
+
+class AssetManifest:
+    """
+    Reads every file under the frontend directory once, fingerprints it and
+    keeps identity/gzip/brotli encodings in memory. HTML pages are rewritten
+    to reference the fingerprinted names so browsers can cache scripts and
+    stylesheets forever.
+    """
+
+    def __init__(self, directory: Path, url_prefix: str = "/static"):
+        self.directory = Path(directory)
+        self.url_prefix = url_prefix.rstrip("/")
+        self._assets: Dict[str, Asset] = {}
+        self._by_hashed_name: Dict[str, Asset] = {}
+        self.build()
+
+    def build(self):
+        files = sorted(p for p in self.directory.rglob("*") if p.is_file())
+        pages = []
+
+        for path in files:
+            name = path.relative_to(self.directory).as_posix()
+            if path.suffix == ".html":
+                pages.append((name, path))
+                continue
+            self._add(name, path.read_bytes())
+
+        # Pages go last so their references can point at the hashed names
+        for name, path in pages:
+            html = path.read_text(encoding="utf-8")
+            self._add(name, self._rewrite_references(html).encode("utf-8"))
+
+    def _add(self, name: str, body: bytes):
+        media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        digest = hashlib.sha256(body).hexdigest()[:12]
+        asset = Asset(
+            name=name,
+            hashed_name=_hashed_name(name, digest),
+            media_type=media_type,
+            etag=f'"{digest}"',
+            variants=_build_variants(body, media_type),
+        )
+        self._assets[name] = asset
+        self._by_hashed_name[asset.hashed_name] = asset
+
+    def _rewrite_references(self, html: str) -> str:
+        for name, asset in self._assets.items():
+            pattern = re.escape(f"{self.url_prefix}/{name}") + r'(?=["\'?#])'
+            html = re.sub(pattern, f"{self.url_prefix}/{asset.hashed_name}", html)
+        return html
+
+    def url_for(self, name: str) -> str:
+        asset = self._assets[name]
+        return f"{self.url_prefix}/{asset.hashed_name}"
+
+    def lookup(self, name: str):
+        """
+        Returns (asset, immutable) for a plain or fingerprinted name, or
+        (None, False) if the asset doesn't exist.
+        """
+        asset = self._by_hashed_name.get(name)
+        if asset is not None and asset.hashed_name != asset.name:
+            return asset, True
+        return self._assets.get(name), False
+
+
+def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """
+    Maps each coding in an Accept-Encoding header to its q-value. An entry
+    whose q-value doesn't parse is ignored.
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = None
+        if q is not None:
+            weights[coding] = q
+    return weights
+
+
+def _choose_encoding(asset: Asset, accept_encoding: str) -> str:
+    weights = _parse_accept_encoding(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if encoding in asset.variants and weights.get(encoding, wildcard) > 0:
+            return encoding
+    return "identity"
+
+
+def asset_response(request: Request, asset: Asset, immutable: bool, max_age: int) -> Response:
+    headers = {
+        "ETag": asset.etag,
+        "Vary": "Accept-Encoding",
+        "Cache-Control": IMMUTABLE_CACHE.format(max_age=max_age) if immutable else REVALIDATE_CACHE,
+    }
+
+    if request.headers.get("if-none-match") == asset.etag:
+        return Response(status_code=304, headers=headers)
+
+    encoding = _choose_encoding(asset, request.headers.get("accept-encoding", ""))
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    body = asset.variants[encoding]
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(body))
+        body = b""
+
+    return Response(content=body, media_type=asset.media_type, headers=headers)
+
+
+class PrecompressedStaticFiles:
+    """
+    Drop-in replacement for StaticFiles that serves assets from an
+    AssetManifest with content negotiation and cache headers.
+    """
+
+    def __init__(self, manifest: AssetManifest, max_age: int):
+        self.manifest = manifest
+        self.max_age = max_age
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive)
+        response = self.get_response(request)
+        await response(scope, receive, send)
+
+    def get_response(self, request: Request) -> Response:
+        if request.method not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405)
+
+        # Under a Mount, root_path holds the mount prefix and path the full URL path
+        path = request.scope["path"]
+        root_path = request.scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        name = path.lstrip("/")
+
+        asset, immutable = self.manifest.lookup(name)
+        if asset is None:
+            return PlainTextResponse("Not Found", status_code=404)
+        return asset_response(request, asset, immutable, self.max_age)
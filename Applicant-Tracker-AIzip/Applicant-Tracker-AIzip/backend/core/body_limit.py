@@ -0,0 +1,69 @@
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+
+class BodyTooLarge(HTTPException):
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            status_code=413,
+            detail=f"Request body exceeds {max_bytes} bytes",
+        )
+
+
+class BodySizeLimitMiddleware:
+    """
+    Rejects request bodies larger than max_bytes with 413. A declared
+    Content-Length is checked up front; chunked bodies are counted as
+    they are received, so an oversized upload is never fully buffered.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    def _too_large(self) -> JSONResponse:
+        exc = BodyTooLarge(self.max_bytes)
+        return JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    too_large = int(value) > self.max_bytes
+                except ValueError:
+                    too_large = False
+                if too_large:
+                    await self._too_large()(scope, receive, send)
+                    return
+                break
+
+        received = 0
+        response_started = False
+
+        async def counting_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # An HTTPException, so FastAPI's body parsing passes it
+                    # through as a 413 instead of a generic 400
+                    raise BodyTooLarge(self.max_bytes)
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, counting_receive, tracking_send)
+        except BodyTooLarge:
+            if response_started:
+                raise
+            await self._too_large()(scope, receive, send)
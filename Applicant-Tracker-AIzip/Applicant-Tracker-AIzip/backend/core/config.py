@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+# Project layout
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+FRONTEND_DIR = Path(os.getenv("ATS_FRONTEND_DIR", str(PROJECT_ROOT / "frontend")))
+# Files the app writes at runtime: the file cache and match archives
+DATA_DIR = Path(os.getenv("ATS_DATA_DIR", str(PROJECT_ROOT / "var")))
+
+# Server configuration from environment variables with safe defaults
+HOST = os.getenv("ATS_HOST", "0.0.0.0")
+PORT = int(os.getenv("ATS_PORT", "5000"))
+# 0 means "one worker per CPU core"
+WORKERS = int(os.getenv("ATS_WORKERS", "0"))
+KEEP_ALIVE_SECONDS = int(os.getenv("ATS_KEEP_ALIVE_SECONDS", "5"))
+BACKLOG = int(os.getenv("ATS_BACKLOG", "2048"))
+GRACEFUL_SHUTDOWN_SECONDS = int(os.getenv("ATS_GRACEFUL_SHUTDOWN_SECONDS", "30"))
+LOG_LEVEL = os.getenv("ATS_LOG_LEVEL", "info")
+# Worker processes on this host; set by backend.server for its workers
+SERVER_WORKERS = int(os.getenv("ATS_SERVER_WORKERS", "1"))
+
+# Static frontend and response compression
+STATIC_CACHE_MAX_AGE = int(os.getenv("ATS_STATIC_CACHE_MAX_AGE", str(365 * 24 * 3600)))
+GZIP_MINIMUM_SIZE = int(os.getenv("ATS_GZIP_MINIMUM_SIZE", "1024"))
+
+# Rate limiting and admission control.
+# Rates are "<requests>/<second|minute|hour>"; concurrency caps are per worker.
+RATE_LIMIT_ENABLED = os.getenv("ATS_RATE_LIMIT_ENABLED", "true").lower() == "true"
+# "memory" keeps buckets per process; "database" shares them across workers
+RATE_LIMIT_BACKEND = os.getenv("ATS_RATE_LIMIT_BACKEND", "memory")
+RATE_LIMITS = {
+    "login": os.getenv("ATS_RATE_LIMIT_LOGIN", "10/minute"),
+    "match": os.getenv("ATS_RATE_LIMIT_MATCH", "30/minute"),
+    "export": os.getenv("ATS_RATE_LIMIT_EXPORT", "10/minute"),
+}
+CONCURRENCY_LIMITS = {
+    "login": int(os.getenv("ATS_CONCURRENCY_LOGIN", "4")),
+    "match": int(os.getenv("ATS_CONCURRENCY_MATCH", "8")),
+    "export": int(os.getenv("ATS_CONCURRENCY_EXPORT", "2")),
+}
+
+# Skill taxonomy used for keyword extraction
+SKILL_TAXONOMY_PATH = Path(os.getenv("ATS_SKILL_TAXONOMY", str(PROJECT_ROOT / "backend" / "data" / "skills.json")))
+# Copy of the keyword_vocabulary table, memory-mapped at startup
+VOCABULARY_SNAPSHOT = Path(os.getenv("ATS_VOCABULARY_SNAPSHOT", str(DATA_DIR / "vocabulary.snapshot")))
+
+# Input size limits. Request bodies over MAX_REQUEST_BYTES are rejected
+# with 413 before they are read into memory.
+MAX_REQUEST_BYTES = int(os.getenv("ATS_MAX_REQUEST_BYTES", str(2 * 1024 * 1024)))
+MAX_RESUME_CHARS = int(os.getenv("ATS_MAX_RESUME_CHARS", "200000"))
+MAX_JOB_DESCRIPTION_CHARS = int(os.getenv("ATS_MAX_JOB_DESCRIPTION_CHARS", "100000"))
+# Keyword extraction reads text in windows of this many characters, so
+# memory per match stays bounded however long the document is
+EXTRACTION_WINDOW_CHARS = int(os.getenv("ATS_EXTRACTION_WINDOW_CHARS", "65536"))
+MAX_KEYWORDS_PER_DOCUMENT = int(os.getenv("ATS_MAX_KEYWORDS_PER_DOCUMENT", "20000"))
+# Longer tokens (base64 blobs, pasted URLs) are not keywords
+MAX_TOKEN_CHARS = int(os.getenv("ATS_MAX_TOKEN_CHARS", "64"))
+
+# Background scoring of new jobs against the resume pool
+SCORE_ON_PUBLISH = os.getenv("ATS_SCORE_ON_PUBLISH", "false").lower() == "true"
+SCORING_CHUNK_SIZE = int(os.getenv("ATS_SCORING_CHUNK_SIZE", "200"))
+# Per host, shared out between the server's worker processes.
+# 0 means "one process per CPU core"
+SCORING_PROCESSES = int(os.getenv("ATS_SCORING_PROCESSES", "0"))
+
+# Coordination between API instances. The defaults keep everything in this
+# process; "file"/"database" share state across workers and hosts.
+CACHE_BACKEND = os.getenv("ATS_CACHE_BACKEND", "memory")
+CACHE_DIR = Path(os.getenv("ATS_CACHE_DIR", str(DATA_DIR / "cache")))
+QUEUE_BACKEND = os.getenv("ATS_QUEUE_BACKEND", "memory")
+BROADCAST_BACKEND = os.getenv("ATS_BROADCAST_BACKEND", "memory")
+# Queue worker threads per host, shared out like SCORING_PROCESSES.
+# 0 means "same as SCORING_PROCESSES"
+QUEUE_WORKERS = int(os.getenv("ATS_QUEUE_WORKERS", "0"))
+QUEUE_LEASE_SECONDS = int(os.getenv("ATS_QUEUE_LEASE_SECONDS", "300"))
+QUEUE_MAX_ATTEMPTS = int(os.getenv("ATS_QUEUE_MAX_ATTEMPTS", "3"))
+QUEUE_POLL_SECONDS = float(os.getenv("ATS_QUEUE_POLL_SECONDS", "0.5"))
+BROADCAST_POLL_SECONDS = float(os.getenv("ATS_BROADCAST_POLL_SECONDS", "1.0"))
+
+# Application writes: concurrent applies are batched into one commit
+APPLICATION_GROUP_COMMIT = os.getenv("ATS_APPLICATION_GROUP_COMMIT", "true").lower() == "true"
+GROUP_COMMIT_WINDOW_MS = float(os.getenv("ATS_GROUP_COMMIT_WINDOW_MS", "5"))
+GROUP_COMMIT_MAX_BATCH = int(os.getenv("ATS_GROUP_COMMIT_MAX_BATCH", "256"))
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("ATS_IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+
+# Match history retention. match_results keeps the latest result per
+# (resume, job); superseded results move to match_results_archive and,
+# after MATCH_ARCHIVE_DAYS, out of the database into files in ARCHIVE_DIR.
+MATCH_HISTORY_ENABLED = os.getenv("ATS_MATCH_HISTORY_ENABLED", "true").lower() == "true"
+# 0 keeps archived results in the database indefinitely
+MATCH_ARCHIVE_DAYS = int(os.getenv("ATS_MATCH_ARCHIVE_DAYS", "30"))
+ARCHIVE_DIR = Path(os.getenv("ATS_ARCHIVE_DIR", str(DATA_DIR / "archive")))
+# "auto" writes Parquet when pyarrow is installed, gzipped JSON lines otherwise
+ARCHIVE_FORMAT = os.getenv("ATS_ARCHIVE_FORMAT", "auto")
+ARCHIVE_BATCH_SIZE = int(os.getenv("ATS_ARCHIVE_BATCH_SIZE", "10000"))
+# 0 disables the scheduled compaction
+COMPACTION_INTERVAL_SECONDS = int(os.getenv("ATS_COMPACTION_INTERVAL_SECONDS", "3600"))
+
+# Read replicas (DATABASE_REPLICA_URLS). Replicas further behind than the
+# max lag are skipped; a client that just wrote reads from the primary for
+# READ_YOUR_WRITES_SECONDS. The write time is sent back in a cookie; clients
+# that don't keep cookies also need a shared cache backend with several workers.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("ATS_REPLICA_MAX_LAG_SECONDS", "5"))
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv("ATS_REPLICA_LAG_CHECK_SECONDS", "5"))
+READ_YOUR_WRITES_SECONDS = float(os.getenv("ATS_READ_YOUR_WRITES_SECONDS", "10"))
+
+# Candidate job recommendations (GET /match/recommendations)
+RECOMMENDATION_CACHE_TTL_SECONDS = int(os.getenv("ATS_RECOMMENDATION_CACHE_TTL_SECONDS", "86400"))
+RECOMMENDATIONS_MAX_K = int(os.getenv("ATS_RECOMMENDATIONS_MAX_K", "1000"))
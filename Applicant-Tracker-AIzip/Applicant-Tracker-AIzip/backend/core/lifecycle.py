@@ -0,0 +1,62 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Deadline:
+    """
+    A time budget shared by consecutive shutdown steps, so together they
+    take no longer than the graceful timeout.
+    """
+
+    def __init__(self, seconds: float):
+        self._end = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self._end - time.monotonic())
+
+
+class InFlightTracker:
+    """
+    Counts units of work (e.g. matches) that are currently running so that
+    shutdown can wait for them to finish instead of cutting them off.
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._cond = threading.Condition()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @contextmanager
+    def track(self):
+        with self._cond:
+            self._count += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._count -= 1
+                if self._count == 0:
+                    self._cond.notify_all()
+
+    def drain(self, timeout: float) -> bool:
+        """
+        Blocks until all tracked work has finished or the timeout expires.
+        Returns True if drained. Callers stop the sources of new work
+        (connections, the task queue) first.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._count > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+
+# Process-wide tracker for in-flight matching work
+inflight_matches = InFlightTracker()
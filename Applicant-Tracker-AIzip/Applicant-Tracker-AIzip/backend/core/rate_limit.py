@@ -0,0 +1,291 @@
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from backend.core import config
+from backend.core.security import decode_access_token
+from backend.database.db import engine
+from backend.database.models import RateLimitBucket
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+# Buckets that have refilled to capacity carry no state and are dropped
+# at most this often, so one-off callers don't accumulate forever.
+SWEEP_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class Rate:
+    capacity: int
+    period_seconds: float
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+
+def parse_rate(text: str) -> Rate:
+    """
+    Parses a rate such as "30/minute" into a token bucket definition.
+    """
+    count, _, period = text.partition("/")
+    period = period.strip().lower().rstrip("s")
+    if period not in PERIODS:
+        raise ValueError(f"Invalid rate '{text}'. Expected '<count>/<second|minute|hour>'")
+    return Rate(capacity=int(count), period_seconds=PERIODS[period])
+
+
+def _refill(tokens: float, updated_at: float, rate: Rate, now: float) -> float:
+    elapsed = max(0.0, now - updated_at)
+    return min(rate.capacity, tokens + elapsed * rate.refill_per_second)
+
+
+def _take(tokens: float, rate: Rate) -> Tuple[float, float]:
+    """
+    Returns (tokens left, seconds to wait). A wait of 0 means the request
+    was admitted and one token was taken.
+    """
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate.refill_per_second
+
+
+def _full_at(tokens: float, now: float, rate: Rate) -> float:
+    return now + (rate.capacity - tokens) / rate.refill_per_second
+
+
+class MemoryRateLimitBackend:
+    """
+    Token buckets held in this process. Each worker enforces its own limit.
+    """
+
+    def __init__(self):
+        # key -> (tokens, updated_at, time the bucket is full again)
+        self._buckets: Dict[str, Tuple[float, float, float]] = {}
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+
+    def consume(self, key: str, rate: Rate, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        with self._lock:
+            if now >= self._next_sweep:
+                self._sweep(now)
+            bucket = self._buckets.get(key)
+            tokens, updated_at = (rate.capacity, now) if bucket is None else bucket[:2]
+            tokens, wait = _take(_refill(tokens, updated_at, rate, now), rate)
+            self._buckets[key] = (tokens, now, _full_at(tokens, now, rate))
+        return wait
+
+    def _sweep(self, now: float):
+        self._buckets = {key: bucket for key, bucket in self._buckets.items() if bucket[2] > now}
+        self._next_sweep = now + SWEEP_SECONDS
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+def prune_full_buckets(conn, now: float) -> int:
+    """
+    Deletes database buckets that have refilled to capacity. Bucket keys
+    start with the endpoint class, which determines the rate.
+    """
+    removed = 0
+    for endpoint_class, text in config.RATE_LIMITS.items():
+        rate = parse_rate(text)
+        full_at = RateLimitBucket.updated_at + (rate.capacity - RateLimitBucket.tokens) / rate.refill_per_second
+        removed += conn.execute(delete(RateLimitBucket).where(
+            RateLimitBucket.key.startswith(f"{endpoint_class}:", autoescape=True),
+            full_at <= now,
+        )).rowcount
+    return removed
+
+
+class DatabaseRateLimitBackend:
+    """
+    Token buckets stored in the rate_limit_buckets table so that every
+    worker (and every host sharing the database) enforces one limit.
+    Updates are compare-and-swap on updated_at, retried on contention.
+    """
+
+    MAX_ATTEMPTS = 5
+
+    def __init__(self, bind=None):
+        self.bind = bind or engine
+        self._next_sweep = 0.0
+
+    def consume(self, key: str, rate: Rate, now: Optional[float] = None) -> float:
+        if (time.time() if now is None else now) >= self._next_sweep:
+            self.sweep(now)
+        for _ in range(self.MAX_ATTEMPTS):
+            current = time.time() if now is None else now
+            try:
+                wait = self._try_consume(key, rate, current)
+            except IntegrityError:
+                # Another worker created the bucket first
+                continue
+            if wait is not None:
+                return wait
+        # Heavily contended bucket: fail closed for a moment
+        return 1.0 / rate.refill_per_second
+
+    def _try_consume(self, key: str, rate: Rate, now: float) -> Optional[float]:
+        with self.bind.begin() as conn:
+            row = conn.execute(
+                select(RateLimitBucket.tokens, RateLimitBucket.updated_at)
+                .where(RateLimitBucket.key == key)
+            ).first()
+
+            if row is None:
+                tokens, wait = _take(rate.capacity, rate)
+                conn.execute(insert(RateLimitBucket).values(
+                    key=key, tokens=tokens, updated_at=now
+                ))
+                return wait
+
+            tokens, wait = _take(_refill(row.tokens, row.updated_at, rate, now), rate)
+            result = conn.execute(
+                update(RateLimitBucket)
+                .where(
+                    RateLimitBucket.key == key,
+                    RateLimitBucket.updated_at == row.updated_at
+                )
+                .values(tokens=tokens, updated_at=now)
+            )
+            # None means the row changed under us; the caller retries
+            return wait if result.rowcount == 1 else None
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        # Racing workers may both sweep; deleting a full bucket twice is harmless
+        self._next_sweep = now + SWEEP_SECONDS
+        with self.bind.begin() as conn:
+            return prune_full_buckets(conn, now)
+
+    def reset(self):
+        with self.bind.begin() as conn:
+            conn.execute(RateLimitBucket.__table__.delete())
+
+
+BACKENDS = {
+    "memory": MemoryRateLimitBackend,
+    "database": DatabaseRateLimitBackend,
+}
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[config.RATE_LIMIT_BACKEND]()
+    return _backend
+
+
+def set_backend(backend):
+    """
+    Replaces the rate limit backend, e.g. with a shared store.
+    """
+    global _backend
+    _backend = backend
+
+
+class ConcurrencyLimiter:
+    """
+    Caps how many requests of one endpoint class run at the same time in
+    this worker. Requests over the cap are rejected rather than queued.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+
+    def try_acquire(self) -> bool:
+        return self._semaphore.acquire(blocking=False)
+
+    def release(self):
+        self._semaphore.release()
+
+
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(endpoint_class: str) -> Optional[ConcurrencyLimiter]:
+    limit = config.CONCURRENCY_LIMITS.get(endpoint_class, 0)
+    if limit <= 0:
+        return None
+    with _limiters_lock:
+        if endpoint_class not in _limiters:
+            _limiters[endpoint_class] = ConcurrencyLimiter(limit)
+        return _limiters[endpoint_class]
+
+
+def client_identity(request: Request) -> str:
+    """
+    Identifies the caller by user id when a valid bearer token is present,
+    otherwise by client IP address.
+    """
+    authorization = request.headers.get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        payload = decode_access_token(token)
+        if payload and payload.get("user_id") is not None:
+            return f"user:{payload['user_id']}"
+    host = request.client.host if request.client else "unknown"
+    return f"ip:{host}"
+
+
+def _too_many_requests(retry_after: float, detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def rate_limit(endpoint_class: str):
+    """
+    Dependency enforcing the token bucket and concurrency cap configured
+    for an endpoint class. Buckets are keyed by class, route and caller.
+    """
+    rate = parse_rate(config.RATE_LIMITS[endpoint_class])
+
+    def limiter(request: Request):
+        if not config.RATE_LIMIT_ENABLED:
+            yield
+            return
+
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        key = f"{endpoint_class}:{request.method}:{route_path}:{client_identity(request)}"
+
+        wait = get_backend().consume(key, rate)
+        if wait > 0:
+            raise _too_many_requests(wait, "Rate limit exceeded. Please retry later.")
+
+        concurrency = get_concurrency_limiter(endpoint_class)
+        if concurrency is None:
+            yield
+            return
+
+        if not concurrency.try_acquire():
+            raise _too_many_requests(1, "Server is busy. Please retry shortly.")
+        try:
+            yield
+        finally:
+            concurrency.release()
+
+    return limiter
@@ -0,0 +1,88 @@
+import math
+import time
+
+from fastapi import Request
+
+from backend.core import config
+from backend.core.rate_limit import client_identity
+from backend.coordination import get_cache
+from backend.database.db import SessionLocal
+from backend.database.replicas import get_replicas
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+# Carries the client's last write time, so any worker or instance can
+# route its reads without a shared cache
+LAST_WRITE_COOKIE = "ats_last_write"
+
+
+def _recent_write_key(identity: str) -> str:
+    return f"recent-write:{identity}"
+
+
+def mark_recent_write(identity: str):
+    get_cache().set(_recent_write_key(identity), time.time(), ttl=config.READ_YOUR_WRITES_SECONDS)
+
+
+def has_recent_write(identity: str) -> bool:
+    return get_cache().get(_recent_write_key(identity)) is not None
+
+
+def _cookie_has_recent_write(request: Request) -> bool:
+    try:
+        written_at = float(request.cookies.get(LAST_WRITE_COOKIE, ""))
+    except ValueError:
+        return False
+    return time.time() - written_at < config.READ_YOUR_WRITES_SECONDS
+
+
+def last_write_cookie(now: float) -> bytes:
+    max_age = max(1, math.ceil(config.READ_YOUR_WRITES_SECONDS))
+    return (f"{LAST_WRITE_COOKIE}={now:.3f}; Max-Age={max_age}; Path=/; "
+            "HttpOnly; SameSite=Lax").encode("latin-1")
+
+
+def get_read_db(request: Request):
+    """
+    Session for read-only endpoints: a replica when one is current enough,
+    the primary for clients that wrote in the last few seconds so they see
+    their own changes.
+    """
+    replicas = get_replicas()
+    if (not replicas.replicas or _cookie_has_recent_write(request)
+            or has_recent_write(client_identity(request))):
+        db = SessionLocal()
+    else:
+        db = replicas.session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware:
+    """
+    Remembers clients whose write request succeeded, so their following
+    reads are routed to the primary (see get_read_db). The write time goes
+    back in a cookie, which reaches whichever worker serves the next
+    request, and into the cache for clients that don't keep cookies. Both
+    are set before the response starts, so they are in place before the
+    client can send its next request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS or not get_replicas().replicas:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_marking_writes(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                now = time.time()
+                mark_recent_write(client_identity(Request(scope)))
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", last_write_cookie(now))]
+            await send(message)
+
+        await self.app(scope, receive, send_marking_writes)
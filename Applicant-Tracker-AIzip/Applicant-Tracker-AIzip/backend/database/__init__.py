@@ -1,2 +1,2 @@
-from .db import engine, SessionLocal, Base, get_db
-from .models import User, Resume, JobDescription, Application, MatchResult
+from .db import engine, SessionLocal, Base, get_db, init_db
+from .models import User, Resume, JobDescription, Application, MatchResult, MatchResultArchive, MaintenanceRun, RateLimitBucket, VocabularyTerm, JobScoringRun, WorkItem, CoordinationEvent, IdempotencyKey
@@ -1,11 +1,23 @@
+import os
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./ats.db"
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./ats.db")
+# Comma-separated read replicas of DATABASE_URL, used by read-only endpoints
+REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+
+def connect_args_for(url: str) -> dict:
+    connect_args = {}
+    if url.startswith("sqlite"):
+        connect_args["check_same_thread"] = False
+    return connect_args
+
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    connect_args=connect_args_for(SQLALCHEMY_DATABASE_URL)
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -19,3 +31,16 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def init_db():
+    """
+    Creates all tables and search indexes. Safe to call repeatedly.
+    """
+    from backend.database import models  # noqa: F401  (registers the models)
+    from backend.database.migrations import apply_migrations
+    from backend.database.search import install_search
+
+    Base.metadata.create_all(bind=engine)
+    apply_migrations(engine)
+    install_search(engine)
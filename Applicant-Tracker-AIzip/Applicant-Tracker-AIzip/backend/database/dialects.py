@@ -0,0 +1,19 @@
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql, sqlite
+
+_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def supports_on_conflict(bind) -> bool:
+    return bind.dialect.name in _INSERTS
+
+
+def dialect_insert(bind, model):
+    """
+    Returns an INSERT for the bind's dialect, which supports
+    on_conflict_do_nothing()/on_conflict_do_update() on SQLite and Postgres.
+    """
+    return _INSERTS.get(bind.dialect.name, insert)(model)
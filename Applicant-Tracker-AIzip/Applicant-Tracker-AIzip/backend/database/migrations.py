@@ -0,0 +1,60 @@
+import logging
+
+from sqlalchemy import func, inspect, select
+
+from .models import Application, IdempotencyKey, MatchResult
+
+logger = logging.getLogger(__name__)
+
+
+def _dedupe(conn, model, columns):
+    """
+    Deletes all but the oldest row for each combination of columns.
+    """
+    keep = select(func.min(model.id)).group_by(*columns)
+    result = conn.execute(model.__table__.delete().where(model.id.not_in(keep)))
+    if result.rowcount:
+        logger.info("Removed %d duplicate %s rows", result.rowcount, model.__tablename__)
+
+
+def _ensure_unique_index(conn, model, index_name, columns, dedupe=_dedupe):
+    existing = {index["name"] for index in inspect(conn).get_indexes(model.__tablename__)}
+    if index_name in existing:
+        return
+    dedupe(conn, model, columns)
+    index = next(i for i in model.__table__.indexes if i.name == index_name)
+    index.create(conn, checkfirst=True)
+
+
+def _ensure_column(conn, model, column):
+    existing = {c["name"] for c in inspect(conn).get_columns(model.__tablename__)}
+    if column.name in existing:
+        return
+    column_type = column.type.compile(dialect=conn.dialect)
+    conn.exec_driver_sql(f"ALTER TABLE {model.__tablename__} ADD COLUMN {column.name} {column_type}")
+
+
+def apply_migrations(bind):
+    """
+    Brings tables created by older versions up to date. create_all() only
+    creates missing tables, so constraints added later are applied here.
+    """
+    from backend.services.retention import archive_superseded
+
+    def archive_match_history(conn, model, columns):
+        moved = archive_superseded(conn)
+        if moved:
+            logger.info("Moved %d superseded match results out of match_results", moved)
+
+    with bind.begin() as conn:
+        _ensure_column(conn, IdempotencyKey, IdempotencyKey.request_hash)
+        _ensure_unique_index(
+            conn, Application, "uq_applications_job_candidate",
+            [Application.job_id, Application.candidate_id],
+        )
+        # Older versions appended a result on every match; keep the latest
+        _ensure_unique_index(
+            conn, MatchResult, "uq_match_results_resume_job",
+            [MatchResult.resume_id, MatchResult.job_id],
+            dedupe=archive_match_history,
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -47,6 +47,9 @@ class JobDescription(Base):
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("uq_applications_job_candidate", "job_id", "candidate_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=False)
@@ -60,6 +63,11 @@ class Application(Base):
 
 class MatchResult(Base):
     __tablename__ = "match_results"
+    # Only the latest result per (resume, job) is kept here; earlier ones
+    # live in match_results_archive.
+    __table_args__ = (
+        Index("uq_match_results_resume_job", "resume_id", "job_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
@@ -70,3 +78,94 @@ class MatchResult(Base):
 
     resume = relationship("Resume", back_populates="match_results")
     job = relationship("JobDescription", back_populates="match_results")
+
+
+class MatchResultArchive(Base):
+    __tablename__ = "match_results_archive"
+
+    id = Column(Integer, primary_key=True, index=True)
+    match_id = Column(Integer, nullable=False)
+    resume_id = Column(Integer, nullable=False, index=True)
+    job_id = Column(Integer, nullable=False)
+    score = Column(Float, nullable=False)
+    missing_keywords = Column(Text)
+    created_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class MaintenanceRun(Base):
+    __tablename__ = "maintenance_runs"
+
+    name = Column(String, primary_key=True)
+    started_at = Column(Float, nullable=False)
+    finished_at = Column(Float)
+    last_result = Column(Text)
+
+
+class RateLimitBucket(Base):
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String, primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(Float, nullable=False)
+
+
+class VocabularyTerm(Base):
+    __tablename__ = "keyword_vocabulary"
+
+    id = Column(Integer, primary_key=True)
+    term = Column(String, unique=True, nullable=False)
+
+
+class JobScoringRun(Base):
+    __tablename__ = "job_scoring_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(Integer, ForeignKey("job_descriptions.id"), nullable=False, index=True)
+    status = Column(String, default="pending", nullable=False)
+    total = Column(Integer, default=0, nullable=False)
+    processed = Column(Integer, default=0, nullable=False)
+    error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+
+class WorkItem(Base):
+    __tablename__ = "work_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+    status = Column(String, default="queued", nullable=False, index=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    max_attempts = Column(Integer, nullable=False)
+    available_at = Column(Float, nullable=False)
+    leased_by = Column(String)
+    lease_expires_at = Column(Float)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class CoordinationEvent(Base):
+    __tablename__ = "coordination_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel = Column(String, nullable=False)
+    message = Column(Text, nullable=False)
+    created_at = Column(Float, nullable=False, index=True)
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "endpoint", "key", name="uq_idempotency_keys_user_endpoint_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    endpoint = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    resource_id = Column(Integer, nullable=False)
+    # Fingerprint of the request body; a key reused with another body is rejected
+    request_hash = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,145 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.core import config
+from .db import REPLICA_URLS, SessionLocal, connect_args_for
+
+logger = logging.getLogger(__name__)
+
+LagProbe = Callable[[Connection], float]
+
+
+def sqlite_lag(conn: Connection) -> float:
+    # A SQLite replica is a file copied or synced out of band; there is
+    # no replication stream to measure.
+    return 0.0
+
+
+def postgresql_lag(conn: Connection) -> float:
+    # A replica streaming from the primary that has replayed everything it
+    # received is current, even if the primary has been idle since the
+    # last replayed transaction. Without a streaming WAL receiver nothing
+    # new arrives, so receive = replay says nothing and the lag is the age
+    # of the last replayed transaction (or of the server, if none was).
+    lag = conn.execute(text(
+        "SELECT CASE"
+        " WHEN NOT pg_is_in_recovery() THEN 0"
+        " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()"
+        "  AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN 0"
+        " ELSE EXTRACT(EPOCH FROM now() - COALESCE(pg_last_xact_replay_timestamp(), pg_postmaster_start_time()))"
+        " END"
+    )).scalar()
+    return float(lag or 0)
+
+
+LAG_PROBES: Dict[str, LagProbe] = {
+    "sqlite": sqlite_lag,
+    "postgresql": postgresql_lag,
+}
+
+
+class Replica:
+    def __init__(self, engine: Engine, probe: LagProbe):
+        self.engine = engine
+        self.probe = probe
+        self.session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        # None while the replica cannot be reached
+        self.lag: Optional[float] = 0.0
+        self.checked_at: Optional[float] = None
+
+    @property
+    def name(self) -> str:
+        return self.engine.url.render_as_string(hide_password=True)
+
+
+class ReplicaSet:
+    """
+    Read replicas for read-only endpoints. Replicas are used round-robin;
+    one whose measured lag is over max_lag_seconds, or that cannot be
+    reached, is skipped until its next check. With no usable replica,
+    reads go to the primary.
+    """
+
+    def __init__(self, engines: List[Engine], max_lag_seconds: float, check_seconds: float,
+                 probes: Optional[Dict[str, LagProbe]] = None):
+        probes = probes or LAG_PROBES
+        # Dialects without a probe are assumed to be current
+        self.replicas = [Replica(e, probes.get(e.dialect.name, sqlite_lag)) for e in engines]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _usable(self, lag: Optional[float]) -> bool:
+        return lag is not None and lag <= self.max_lag_seconds
+
+    def _lag(self, replica: Replica, now: float) -> Optional[float]:
+        if replica.checked_at is not None and now - replica.checked_at < self.check_seconds:
+            return replica.lag
+        try:
+            with replica.engine.connect() as conn:
+                replica.lag = replica.probe(conn)
+        except Exception:
+            logger.warning("Replica %s is unreachable", replica.name, exc_info=True)
+            replica.lag = None
+        replica.checked_at = now
+        return replica.lag
+
+    def choose(self) -> Optional[Replica]:
+        if not self.replicas:
+            return None
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.replicas)
+        now = time.monotonic()
+        for i in range(len(self.replicas)):
+            replica = self.replicas[(start + i) % len(self.replicas)]
+            if self._usable(self._lag(replica, now)):
+                return replica
+        return None
+
+    def session(self) -> Session:
+        replica = self.choose()
+        return replica.session_factory() if replica is not None else SessionLocal()
+
+    def status(self) -> List[Dict]:
+        return [
+            {
+                "replica": r.name,
+                "lag_seconds": r.lag,
+                "reachable": r.lag is not None,
+                "usable": self._usable(r.lag),
+            }
+            for r in self.replicas
+        ]
+
+
+_replicas: Optional[ReplicaSet] = None
+_replicas_lock = threading.Lock()
+
+
+def get_replicas() -> ReplicaSet:
+    global _replicas
+    if _replicas is None:
+        with _replicas_lock:
+            if _replicas is None:
+                _replicas = ReplicaSet(
+                    [create_engine(url, connect_args=connect_args_for(url)) for url in REPLICA_URLS],
+                    max_lag_seconds=config.REPLICA_MAX_LAG_SECONDS,
+                    check_seconds=config.REPLICA_LAG_CHECK_SECONDS,
+                )
+    return _replicas
+
+
+def set_replicas(replicas: ReplicaSet):
+    """
+    Replaces the replica set, e.g. with stand-in engines in tests.
+    """
+    global _replicas
+    _replicas = replicas
@@ -1,6 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+from backend.core import config
 
 
 class UserBase(BaseModel):
@@ -25,7 +27,7 @@ class ResumeBase(BaseModel):
 
 
 class ResumeCreate(ResumeBase):
-    pass
+    content: str = Field(..., max_length=config.MAX_RESUME_CHARS)
 
 
 class ResumeResponse(ResumeBase):
@@ -37,13 +39,25 @@ class ResumeResponse(ResumeBase):
         from_attributes = True
 
 
+class ResumeSearchResult(ResumeResponse):
+    candidate_email: str
+    rank: float
+
+
+class ResumeSearchPage(BaseModel):
+    total: int
+    limit: int
+    offset: int
+    results: List[ResumeSearchResult]
+
+
 class JobDescriptionBase(BaseModel):
     title: str
     description: str
 
 
 class JobDescriptionCreate(JobDescriptionBase):
-    pass
+    description: str = Field(..., max_length=config.MAX_JOB_DESCRIPTION_CHARS)
 
 
 class JobDescriptionResponse(JobDescriptionBase):
@@ -55,6 +69,17 @@ class JobDescriptionResponse(JobDescriptionBase):
         from_attributes = True
 
 
+class JobSearchResult(JobDescriptionResponse):
+    rank: float
+
+
+class JobSearchPage(BaseModel):
+    total: int
+    limit: int
+    offset: int
+    results: List[JobSearchResult]
+
+
 class ApplicationBase(BaseModel):
     job_id: int
     candidate_id: int
@@ -100,3 +125,17 @@ class MatchResultResponse(MatchResultBase):
 
     class Config:
         from_attributes = True
+
+
+class JobScoringRunResponse(BaseModel):
+    id: int
+    job_id: int
+    status: str
+    total: int
+    processed: int
+    error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,189 @@
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy import column, func, literal_column, or_, select, table, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from .db import engine
+from .models import JobDescription, Resume, User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    table: str
+    columns: Tuple[str, ...]
+    # Relative importance of each column when ranking
+    weights: Tuple[float, ...]
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+
+JOB_INDEX = SearchIndex("job_descriptions", ("title", "description"), (4.0, 1.0))
+RESUME_INDEX = SearchIndex("resumes", ("content",), (1.0,))
+SEARCH_INDEXES = (JOB_INDEX, RESUME_INDEX)
+
+# Postgres tsvector weight labels, highest first
+PG_WEIGHT_LABELS = ("A", "B", "C", "D")
+
+# "fts5", "tsvector" or "like", keyed by dialect name
+_search_modes: Dict[str, str] = {}
+
+
+def _sqlite_statements(index: SearchIndex) -> List[str]:
+    cols = ", ".join(index.columns)
+    new_values = ", ".join(f"new.{c}" for c in index.columns)
+    old_values = ", ".join(f"old.{c}" for c in index.columns)
+    fts = index.fts_table
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{cols}, content='{index.table}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {index.table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {index.table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {index.table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def _postgres_statements(index: SearchIndex) -> List[str]:
+    vector = " || ".join(
+        f"setweight(to_tsvector('english', coalesce({column}, '')), '{label}')"
+        for column, label in zip(index.columns, PG_WEIGHT_LABELS)
+    )
+    return [
+        f"ALTER TABLE {index.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_{index.table}_search_vector "
+        f"ON {index.table} USING GIN (search_vector)",
+    ]
+
+
+def _install_sqlite(conn, index: SearchIndex):
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": index.fts_table},
+    ).first()
+    for statement in _sqlite_statements(index):
+        conn.execute(text(statement))
+    if not exists:
+        # Index rows that were written before the triggers existed
+        conn.execute(text(f"INSERT INTO {index.fts_table}({index.fts_table}) VALUES ('rebuild')"))
+
+
+def install_search(bind=None):
+    """
+    Creates the full-text indexes for jobs and resumes: FTS5 tables kept in
+    sync by triggers on SQLite, a generated tsvector column with a GIN index
+    on Postgres. Other databases fall back to LIKE scans.
+    """
+    bind = bind or engine
+    dialect = bind.dialect.name
+
+    try:
+        with bind.begin() as conn:
+            for index in SEARCH_INDEXES:
+                if dialect == "sqlite":
+                    _install_sqlite(conn, index)
+                elif dialect == "postgresql":
+                    for statement in _postgres_statements(index):
+                        conn.execute(text(statement))
+    except OperationalError:
+        logger.warning("Full-text search unavailable on this database; using LIKE scans")
+        _search_modes[dialect] = "like"
+        return
+
+    _search_modes[dialect] = {"sqlite": "fts5", "postgresql": "tsvector"}.get(dialect, "like")
+
+
+def _search_mode(db: Session) -> str:
+    dialect = db.get_bind().dialect.name
+    return _search_modes.get(dialect) or {"sqlite": "fts5", "postgresql": "tsvector"}.get(dialect, "like")
+
+
+def _terms(query: str) -> List[str]:
+    return re.findall(r"\w+", query.lower())
+
+
+def _fts5_query(terms: Sequence[str]) -> str:
+    # Quote every term so user input can't inject FTS syntax; the last term
+    # is a prefix so results show up while the user is still typing.
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _base_query(index: SearchIndex, model, entities, terms: Sequence[str], mode: str):
+    """
+    Returns (select statement, rank expression) restricted to matching rows,
+    where a higher rank is a better match.
+    """
+    if mode == "fts5":
+        # Drive the query from the FTS index and join back to the content table
+        fts = table(index.fts_table, column("rowid"))
+        weights = ", ".join(str(w) for w in index.weights)
+        rank = -literal_column(f"bm25({index.fts_table}, {weights})")
+        stmt = (
+            select(*entities, rank.label("rank"))
+            .select_from(fts)
+            .join(model, model.id == fts.c.rowid)
+            .where(literal_column(index.fts_table).op("MATCH")(_fts5_query(terms)))
+        )
+        return stmt, rank
+
+    if mode == "tsvector":
+        vector = literal_column(f"{index.table}.search_vector")
+        tsquery = func.plainto_tsquery("english", " ".join(terms))
+        rank = func.ts_rank(vector, tsquery)
+        stmt = select(*entities, rank.label("rank")).select_from(model).where(vector.op("@@")(tsquery))
+        return stmt, rank
+
+    columns = [getattr(model, c) for c in index.columns]
+    rank = literal_column("0.0")
+    stmt = select(*entities, rank.label("rank")).select_from(model).where(
+        or_(*(col.ilike(f"%{term}%") for term in terms for col in columns))
+    )
+    return stmt, rank
+
+
+def _search(db: Session, index: SearchIndex, model, entities, query: str,
+            limit: int, offset: int, joins=()) -> Tuple[int, list]:
+    terms = _terms(query)
+    if not terms:
+        return 0, []
+
+    stmt, rank = _base_query(index, model, entities, terms, _search_mode(db))
+    for target, onclause in joins:
+        stmt = stmt.join(target, onclause)
+
+    total = db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one()
+    page = stmt.order_by(rank.desc(), model.id.desc()).limit(limit).offset(offset)
+
+    return total, db.execute(page).all()
+
+
+def search_jobs(db: Session, query: str, limit: int = 20, offset: int = 0):
+    """
+    Ranked full-text search over job titles and descriptions.
+    Returns (total matches, rows of (JobDescription, rank)).
+    """
+    return _search(db, JOB_INDEX, JobDescription, [JobDescription], query, limit, offset)
+
+
+def search_resumes(db: Session, query: str, limit: int = 20, offset: int = 0):
+    """
+    Ranked full-text search over resume content.
+    Returns (total matches, rows of (Resume, candidate email, rank)).
+    """
+    return _search(
+        db, RESUME_INDEX, Resume, [Resume, User.email], query, limit, offset,
+        joins=[(User, User.id == Resume.user_id)],
+    )
@@ -1,24 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
+from typing import List, Optional
 from pydantic import BaseModel
 
 from backend.database.db import get_db
-from backend.database.models import Application, User, JobDescription
+from backend.core.read_routing import get_read_db
+from backend.core import config
+from backend.database.models import Application, IdempotencyKey, User, JobDescription
 from backend.database.schemas import ApplicationResponse, ApplicationUpdate
 from backend.core.security import require_role
+from backend.core.lifecycle import inflight_matches
+from backend.core.rate_limit import rate_limit
+from backend.services.application_writer import (
+    CREATE_APPLICATION_ENDPOINT,
+    ApplicationWrite,
+    get_application_writer,
+    request_hash,
+    write_applications,
+)
+from backend.utils.serialization import iter_csv, iter_json_array, iter_ndjson
 
 router = APIRouter()
 
 class ApplicationCreateRequest(BaseModel):
     job_id: int
 
-@router.post("/", response_model=ApplicationResponse)
+def find_idempotent_application(db: Session, user: User, key: str, body_hash: str):
+    """
+    Returns the application created earlier by this user with the same
+    Idempotency-Key, if the key hasn't expired. Reusing the key for a
+    different request body is a 422.
+    """
+    cutoff = datetime.utcnow() - timedelta(hours=config.IDEMPOTENCY_KEY_TTL_HOURS)
+    record = db.query(IdempotencyKey).filter(
+        IdempotencyKey.user_id == user.id,
+        IdempotencyKey.endpoint == CREATE_APPLICATION_ENDPOINT,
+        IdempotencyKey.key == key,
+        IdempotencyKey.created_at >= cutoff
+    ).first()
+    if not record:
+        return None
+    # Keys stored before request hashes were recorded match any body
+    if record.request_hash is not None and record.request_hash != body_hash:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used for a different request"
+        )
+    return db.query(Application).filter(Application.id == record.resource_id).first()
+
+@router.post("/", response_model=ApplicationResponse, dependencies=[Depends(rate_limit("match"))])
 def create_application(
     request: ApplicationCreateRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role("candidate"))
 ):
+    body_hash = request_hash(request.model_dump())
+    # A retried request with the same key gets the original application back
+    if idempotency_key:
+        previous = find_idempotent_application(db, current_user, idempotency_key, body_hash)
+        if previous:
+            return previous
+
     # Check if job exists
     job = db.query(JobDescription).filter(JobDescription.id == request.job_id).first()
     if not job:
@@ -27,69 +73,122 @@ def create_application(
             detail="Job not found"
         )
 
-    # Prevent duplicate applications
-    existing_app = db.query(Application).filter(
+    # Cheap check first so a repeated apply doesn't pay for a match. The
+    # unique constraint still decides races between concurrent requests.
+    already_applied = db.query(Application.id).filter(
         Application.job_id == request.job_id,
         Application.candidate_id == current_user.id
     ).first()
-    
-    if existing_app:
+    if already_applied:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already applied for this job"
         )
-    
-    new_app = Application(
-        job_id=request.job_id,
-        candidate_id=current_user.id,
-        status="pending"
-    )
-    db.add(new_app)
-    db.commit()
-    db.refresh(new_app)
 
     # --- Auto-Match Trigger ---
-    # --- Auto-Match Trigger ---
+    # The score is computed here, in parallel with other requests, and
+    # stored together with the application by the batched write below.
     from backend.services.matching_engine import match_resume_to_job
-    from backend.database.models import Resume, MatchResult
-    
-    # 1. Get Candidate Resume
+    from backend.database.models import Resume
+
+    match = None
     resume = db.query(Resume).filter(Resume.user_id == current_user.id).first()
     if resume:
-        # 2. Calculate Match
-        match_result = match_resume_to_job(resume.content, job.description)
-        score = match_result["score"]
-        missing = match_result["missing_keywords"]
-        
-        # 3. Store Match Result
-        # Check if exists first to avoid dupes (optional based on logic, but safe)
-        existing_match = db.query(MatchResult).filter(
-            MatchResult.resume_id == resume.id,
-            MatchResult.job_id == job.id
-        ).first()
-
-        if not existing_match:
-            new_match = MatchResult(
-                resume_id=resume.id,
-                job_id=job.id,
-                score=score,
-                missing_keywords=", ".join(missing) # Convert list to string
-            )
-            db.add(new_match)
-            db.commit()
-
-    return new_app
+        with inflight_matches.track():
+            match_result = match_resume_to_job(resume.content, job.description)
+        match = {
+            "resume_id": resume.id,
+            "score": match_result["score"],
+            "missing_keywords": ", ".join(match_result["missing_keywords"]) # Convert list to string
+        }
+    write = ApplicationWrite(
+        job_id=request.job_id,
+        candidate_id=current_user.id,
+        idempotency_key=idempotency_key,
+        request_hash=body_hash,
+        match=match
+    )
+    # Hand the connection back before waiting on the writer. Nothing below
+    # may touch expired ORM attributes, or the session would check out a
+    # connection again while blocked.
+    db.rollback()
+    writer = get_application_writer()
+    if writer is not None:
+        result = writer.submit(write)
+    else:
+        result = write_applications(db, [write])[0]
+
+    # Prevent duplicate applications
+    if not result.created:
+        if idempotency_key:
+            previous = find_idempotent_application(db, current_user, idempotency_key, body_hash)
+            if previous:
+                return previous
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="You have already applied for this job"
+        )
+
+    return result.application
 
 from backend.database.schemas import ApplicationResponse, ApplicationUpdate, RecruiterApplicationResponse
 from backend.database.models import Application, User, JobDescription, Resume, MatchResult
 
-# ... (imports)
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 500
+
+STREAM_DESCRIPTION = (
+    "Stream the rows as a JSON array straight from the database cursor "
+    "instead of building and validating the full list in memory"
+)
+
+
+def application_rows(db: Session, *criteria):
+    """
+    Yields one plain dict per application, shaped like
+    RecruiterApplicationResponse, using a single joined query that selects
+    only the needed columns. The latest match result for the candidate's
+    resume and the job is attached.
+    """
+    latest = aliased(MatchResult)
+    latest_match_id = select(func.max(latest.id)).where(
+        latest.resume_id == Resume.id,
+        latest.job_id == Application.job_id
+    ).scalar_subquery()
+
+    stmt = select(
+        Application.id,
+        Application.job_id,
+        Application.candidate_id,
+        Application.status,
+        Application.created_at,
+        User.email.label("candidate_email"),
+        MatchResult.score.label("match_score"),
+        MatchResult.missing_keywords.label("missing_skills"),
+    ).join(User, User.id == Application.candidate_id)\
+     .outerjoin(Resume, Resume.user_id == Application.candidate_id)\
+     .outerjoin(MatchResult, MatchResult.id == latest_match_id)\
+     .where(*criteria)\
+     .order_by(Application.id)\
+     .execution_options(yield_per=STREAM_BATCH_SIZE)
+
+    for row in db.execute(stmt):
+        yield row._asdict()
+
+
+def stream_json_rows(rows) -> StreamingResponse:
+    return StreamingResponse(iter_json_array(rows), media_type="application/json")
+
 
 @router.get("/me", response_model=List[RecruiterApplicationResponse])
 def get_my_applications(
-    db: Session = Depends(get_db),
+    stream: bool = Query(False, description=STREAM_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role("candidate"))
 ):
+    if stream:
+        return stream_json_rows(application_rows(db, Application.candidate_id == current_user.id))
+
     apps = db.query(Application).filter(Application.candidate_id == current_user.id).all()
     results = []
 
@@ -118,7 +217,8 @@ def get_my_applications(
 @router.get("/job/{job_id}", response_model=List[RecruiterApplicationResponse])
 def get_job_applications(
     job_id: int,
-    db: Session = Depends(get_db),
+    stream: bool = Query(False, description=STREAM_DESCRIPTION),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role("recruiter"))
 ):
     # Verify the recruiter owns the job
@@ -133,6 +233,9 @@ def get_job_applications(
             detail="You do not have access to this job's applications"
         )
     
+    if stream:
+        return stream_json_rows(application_rows(db, Application.job_id == job_id))
+
     apps = db.query(Application).filter(Application.job_id == job_id).all()
     results = []
 
@@ -160,6 +263,70 @@ def get_job_applications(
         
     return results
 
+EXPORT_FIELDS = [
+    "id",
+    "candidate_email",
+    "status",
+    "match_score",
+    "missing_skills",
+    "created_at",
+]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+@router.get("/job/{job_id}/export", dependencies=[Depends(rate_limit("export"))])
+def export_job_applications(
+    job_id: int,
+    format: str = Query("csv", description="Export format: csv or ndjson"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Streams every applicant for a job with their match score and missing
+    skills. Rows are read from a server-side cursor in fixed-size batches,
+    so memory use doesn't grow with the number of applicants.
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid format. Must be one of: {', '.join(EXPORT_FORMATS)}"
+        )
+
+    # Verify the recruiter owns the job
+    job = db.query(JobDescription).filter(
+        JobDescription.id == job_id,
+        JobDescription.recruiter_id == current_user.id
+    ).first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this job's applications"
+        )
+
+    rows = (
+        {field: row[field] for field in EXPORT_FIELDS}
+        for row in application_rows(db, Application.job_id == job_id)
+    )
+    if format == "csv":
+        body = iter_csv(rows, EXPORT_FIELDS)
+    else:
+        body = iter_ndjson(rows)
+
+    # A sync iterator is consumed in the threadpool, so a long export
+    # doesn't hold up the event loop for other requests.
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="job-{job_id}-applicants.{format}"'
+        }
+    )
+
 @router.patch("/{application_id}", response_model=ApplicationResponse)
 def update_application_status(
     application_id: int,
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from backend.database.db import get_db
 from backend.database.models import User
 from backend.core.security import hash_password, verify_password, create_access_token
+from backend.core.rate_limit import rate_limit
 
 router = APIRouter()
 
@@ -30,7 +31,7 @@ class MessageResponse(BaseModel):
     message: str
 
 
-@router.post("/signup", response_model=MessageResponse)
+@router.post("/signup", response_model=MessageResponse, dependencies=[Depends(rate_limit("login"))])
 def signup(request: SignupRequest, db: Session = Depends(get_db)):
     # Normalize role
     request.role = request.role.strip().lower()
@@ -63,7 +64,7 @@ def signup(request: SignupRequest, db: Session = Depends(get_db)):
     return {"message": "User created successfully"}
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(rate_limit("login"))])
 def login(request: LoginRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == request.email).first()
     
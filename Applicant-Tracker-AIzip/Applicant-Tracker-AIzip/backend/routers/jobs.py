@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List
 
 from backend.database.db import get_db
-from backend.database.models import JobDescription, User
-from backend.database.schemas import JobDescriptionCreate, JobDescriptionResponse
+from backend.core.read_routing import get_read_db
+from backend.core import config
+from backend.database.models import JobDescription, JobScoringRun, User
+from backend.database.schemas import JobDescriptionCreate, JobDescriptionResponse, JobSearchPage, JobScoringRunResponse
+from backend.database.search import search_jobs
+from backend.services.batch_scoring import start_job_scoring
 from backend.core.security import require_role
 
 router = APIRouter()
@@ -12,6 +16,10 @@ router = APIRouter()
 @router.post("/", response_model=JobDescriptionResponse)
 def create_job(
     job_in: JobDescriptionCreate,
+    score_on_publish: bool = Query(
+        config.SCORE_ON_PUBLISH,
+        description="Score the new job against every resume in the background"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role("recruiter"))
 ):
@@ -23,11 +31,15 @@ def create_job(
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
+
+    if score_on_publish:
+        start_job_scoring(db, new_job)
+
     return new_job
 
 @router.get("/me", response_model=List[JobDescriptionResponse])
 def get_my_jobs(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role("recruiter"))
 ):
     jobs = db.query(JobDescription).filter(JobDescription.recruiter_id == current_user.id).all()
@@ -35,8 +47,71 @@ def get_my_jobs(
 
 @router.get("/", response_model=List[JobDescriptionResponse])
 def get_all_jobs(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role("candidate"))
 ):
     jobs = db.query(JobDescription).all()
     return jobs
+
+@router.get("/search", response_model=JobSearchPage)
+def search_all_jobs(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(require_role("candidate"))
+):
+    total, rows = search_jobs(db, q, limit=limit, offset=offset)
+    results = []
+    for job, rank in rows:
+        job_dict = {c.name: getattr(job, c.name) for c in job.__table__.columns}
+        job_dict["rank"] = rank
+        results.append(job_dict)
+
+    return {"total": total, "limit": limit, "offset": offset, "results": results}
+
+def get_recruiter_job(db: Session, job_id: int, recruiter: User) -> JobDescription:
+    job = db.query(JobDescription).filter(
+        JobDescription.id == job_id,
+        JobDescription.recruiter_id == recruiter.id
+    ).first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied or job not found"
+        )
+    return job
+
+@router.post("/{job_id}/scoring", response_model=JobScoringRunResponse)
+def start_scoring(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Scores the job against every resume that hasn't been matched to it yet.
+    """
+    job = get_recruiter_job(db, job_id, current_user)
+    return start_job_scoring(db, job)
+
+@router.get("/{job_id}/scoring", response_model=JobScoringRunResponse)
+def get_scoring_status(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    """
+    Returns the progress of the most recent scoring run for the job.
+    """
+    get_recruiter_job(db, job_id, current_user)
+    run = db.query(JobScoringRun).filter(
+        JobScoringRun.job_id == job_id
+    ).order_by(JobScoringRun.id.desc()).first()
+
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No scoring run found for this job"
+        )
+    return run
@@ -1,13 +1,20 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
+from sqlalchemy import literal
 from sqlalchemy.orm import Session
 from typing import List
 
 from backend.database.db import get_db
-from backend.database.models import Resume, JobDescription, MatchResult, User
+from backend.core.read_routing import get_read_db
+from backend.database.models import Resume, JobDescription, MatchResult, MatchResultArchive, User
 from backend.services.matching_engine import match_resume_to_job
+from backend.services.recommendations import recommend_jobs
+from backend.services.retention import save_match_results
+from backend.core import config
 from backend.core.security import require_role
+from backend.core.lifecycle import inflight_matches
+from backend.core.rate_limit import rate_limit
 
 router = APIRouter()
 
@@ -25,6 +32,8 @@ class MatchHistoryResponse(BaseModel):
     score: float
     missing_keywords: str
     created_at: datetime
+    # Archived results are numbered separately: id is unique per flag value
+    archived: bool = False
 
     class Config:
         from_attributes = True
@@ -34,20 +43,56 @@ class MatchInsightResponse(BaseModel):
     score: float
     missing_keywords: str
 
+class RecommendationResponse(BaseModel):
+    job_id: int
+    title: str
+    score: float
+    created_at: datetime
+
+@router.get("/recommendations", response_model=List[RecommendationResponse])
+def get_job_recommendations(
+    k: int = Query(10, ge=1, le=config.RECOMMENDATIONS_MAX_K, description="Number of jobs to return"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(require_role("candidate"))
+):
+    resume = db.query(Resume).filter(Resume.user_id == current_user.id).first()
+    if not resume:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload a resume to get recommendations"
+        )
+
+    return recommend_jobs(db, resume, k)
+
 @router.get("/me", response_model=List[MatchHistoryResponse])
 def get_my_match_history(
-    db: Session = Depends(get_db),
+    include_archived: bool = Query(False, description="Also return earlier results that were superseded"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role("candidate"))
 ):
     results = db.query(MatchResult).join(Resume).filter(
         Resume.user_id == current_user.id
     ).all()
-    return results
+    if not include_archived:
+        return results
+
+    archived = db.query(
+        MatchResultArchive.id,
+        MatchResultArchive.job_id,
+        MatchResultArchive.score,
+        MatchResultArchive.missing_keywords,
+        MatchResultArchive.created_at,
+        literal(True).label("archived")
+    ).join(Resume, MatchResultArchive.resume_id == Resume.id)\
+     .filter(Resume.user_id == current_user.id).all()
+    return sorted(
+        [*results, *archived], key=lambda r: r.created_at, reverse=True
+    )
 
 @router.get("/job/{job_id}", response_model=List[MatchInsightResponse])
 def get_job_match_insights(
     job_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(require_role("recruiter"))
 ):
     # Verify job belongs to recruiter
@@ -69,11 +114,12 @@ def get_job_match_insights(
         MatchResult.missing_keywords
     ).join(Resume, MatchResult.resume_id == Resume.id)\
      .join(User, Resume.user_id == User.id)\
-     .filter(MatchResult.job_id == job_id).all()
+     .filter(MatchResult.job_id == job_id)\
+     .order_by(MatchResult.score.desc()).all()
     
     return results
 
-@router.post("/", response_model=MatchResponse)
+@router.post("/", response_model=MatchResponse, dependencies=[Depends(rate_limit("match"))])
 def perform_match(
     request: MatchRequest,
     db: Session = Depends(get_db),
@@ -99,21 +145,21 @@ def perform_match(
             detail="Job description not found"
         )
     
-    # Perform matching
-    result = match_resume_to_job(str(resume.content), str(job.description))
-    
-    # Store result in DB
-    match_result = MatchResult(
-        resume_id=resume.id,
-        job_id=job.id,
-        score=result["score"],
-        missing_keywords=", ".join(result["missing_keywords"])
-    )
-    db.add(match_result)
-    db.commit()
-    db.refresh(match_result)
+    with inflight_matches.track():
+        # Perform matching
+        result = match_resume_to_job(str(resume.content), str(job.description))
+
+        # Store result in DB, replacing the previous one for this pair
+        save_match_results(db, [{
+            "resume_id": resume.id,
+            "job_id": job.id,
+            "score": result["score"],
+            "missing_keywords": ", ".join(result["missing_keywords"]),
+            "created_at": datetime.utcnow()
+        }])
+        db.commit()
     
     return {
-        "score": match_result.score,
+        "score": result["score"],
         "missing_keywords": result["missing_keywords"]
     }
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List
 from datetime import datetime
 
 from backend.database.db import get_db
 from backend.database.models import Resume, User
-from backend.database.schemas import ResumeCreate, ResumeResponse
+from backend.database.schemas import ResumeCreate, ResumeResponse, ResumeSearchPage
+from backend.database.search import search_resumes
 from backend.core.security import get_current_user, require_role
+from backend.coordination import invalidate
+from backend.services.recommendations import recommendations_cache_key
 
 router = APIRouter()
 
@@ -24,6 +27,8 @@ def create_resume(
         existing_resume.created_at = datetime.utcnow()
         db.commit()
         db.refresh(existing_resume)
+        # Scores for the old content are stale on every instance
+        invalidate(recommendations_cache_key(existing_resume.id))
         return existing_resume
 
     new_resume = Resume(
@@ -42,3 +47,20 @@ def get_my_resumes(
 ):
     resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
     return resumes
+
+@router.get("/search", response_model=ResumeSearchPage)
+def search_all_resumes(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("recruiter"))
+):
+    total, rows = search_resumes(db, q, limit=limit, offset=offset)
+    results = []
+    for resume, email, rank in rows:
+        resume_dict = {c.name: getattr(resume, c.name) for c in resume.__table__.columns}
+        resume_dict.update({"candidate_email": email, "rank": rank})
+        results.append(resume_dict)
+
+    return {"total": total, "limit": limit, "offset": offset, "results": results}
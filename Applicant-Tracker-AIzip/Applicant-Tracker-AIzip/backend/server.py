@@ -0,0 +1,73 @@
+import argparse
+import importlib.util
+import os
+
+import uvicorn
+
+from backend.core import config
+from backend.database.db import init_db
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def resolve_workers(workers: int) -> int:
+    """
+    Returns the number of worker processes; 0 means one per CPU core.
+    """
+    if workers > 0:
+        return workers
+    return os.cpu_count() or 1
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the AI ATS server")
+    parser.add_argument("--host", default=config.HOST)
+    parser.add_argument("--port", type=int, default=config.PORT)
+    parser.add_argument("--workers", type=int, default=config.WORKERS,
+                        help="Worker processes (0 = one per CPU core)")
+    parser.add_argument("--keep-alive", type=int, default=config.KEEP_ALIVE_SECONDS,
+                        help="Seconds to keep idle connections open")
+    parser.add_argument("--backlog", type=int, default=config.BACKLOG,
+                        help="Maximum number of pending connections")
+    parser.add_argument("--graceful-timeout", type=int, default=config.GRACEFUL_SHUTDOWN_SECONDS,
+                        help="Seconds to wait for in-flight requests on shutdown")
+    parser.add_argument("--log-level", default=config.LOG_LEVEL)
+    parser.add_argument("--reload", action="store_true", help="Reload on code changes (development)")
+    return parser.parse_args(argv)
+
+
+def run(argv=None):
+    args = parse_args(argv)
+
+    # Create tables once in the parent so workers don't race on startup
+    init_db()
+
+    workers = 1 if args.reload else resolve_workers(args.workers)
+    # Workers inherit the environment; they split the host's scoring
+    # processes and queue threads between them instead of each taking all
+    os.environ["ATS_SERVER_WORKERS"] = str(workers)
+    # The lifespan shutdown reads the same timeout: from the environment in
+    # spawned workers, from config when it runs in this process
+    os.environ["ATS_GRACEFUL_SHUTDOWN_SECONDS"] = str(args.graceful_timeout)
+    config.GRACEFUL_SHUTDOWN_SECONDS = args.graceful_timeout
+
+    uvicorn.run(
+        "backend.app:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        loop="uvloop" if _has_module("uvloop") else "auto",
+        http="httptools" if _has_module("httptools") else "auto",
+        timeout_keep_alive=args.keep_alive,
+        backlog=args.backlog,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        log_level=args.log_level,
+        reload=args.reload,
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -1,14 +1,16 @@
 from typing import Set
-from backend.utils.text_utils import extract_keywords
+from backend.services.skill_taxonomy import get_skill_matcher
 
 def extract_resume_keywords(resume_text: str) -> Set[str]:
     """
-    Extracts meaningful keywords from resume text.
+    Extracts meaningful keywords from resume text, with known skills
+    normalized to their canonical names.
     """
-    return extract_keywords(resume_text)
+    return get_skill_matcher().extract(resume_text)
 
 def extract_jd_keywords(jd_text: str) -> Set[str]:
     """
-    Extracts meaningful keywords from job description text.
+    Extracts meaningful keywords from job description text, with known
+    skills normalized to their canonical names.
     """
-    return extract_keywords(jd_text)
+    return get_skill_matcher().extract(jd_text)
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, tuple_
+
+from backend.core import config
+from backend.database.db import SessionLocal
+from backend.database.dialects import dialect_insert, supports_on_conflict
+from backend.database.models import Application, IdempotencyKey
+from backend.services.retention import add_match_results
+
+logger = logging.getLogger(__name__)
+
+CREATE_APPLICATION_ENDPOINT = "applications.create"
+
+# Seconds a request waits for its batch to be committed
+SUBMIT_TIMEOUT_SECONDS = 30
+
+
+def request_hash(payload: Dict[str, Any]) -> str:
+    """
+    Fingerprint of a request body, stored with its idempotency key.
+    """
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ApplicationWrite:
+    job_id: int
+    candidate_id: int
+    idempotency_key: Optional[str] = None
+    request_hash: Optional[str] = None
+    # Precomputed match for the candidate's resume: resume_id, score,
+    # missing_keywords
+    match: Optional[Dict] = None
+
+
+@dataclass
+class ApplicationWriteResult:
+    application: Dict
+    # False if the candidate had already applied for the job
+    created: bool
+
+
+APPLICATION_COLUMNS = (
+    Application.id,
+    Application.job_id,
+    Application.candidate_id,
+    Application.status,
+    Application.created_at,
+)
+
+
+def write_applications(db, writes: List[ApplicationWrite]) -> List[ApplicationWriteResult]:
+    """
+    Inserts a batch of applications, their match results and idempotency
+    keys in a single transaction. Existing (job, candidate) pairs are left
+    untouched and reported as not created.
+    """
+    bind = db.get_bind()
+    now = datetime.utcnow()
+    pairs = list(dict.fromkeys((w.job_id, w.candidate_id) for w in writes))
+    rows = [
+        {"job_id": job_id, "candidate_id": candidate_id, "status": "pending", "created_at": now}
+        for job_id, candidate_id in pairs
+    ]
+
+    if supports_on_conflict(bind):
+        stmt = dialect_insert(bind, Application)\
+            .on_conflict_do_nothing(index_elements=["job_id", "candidate_id"])\
+            .returning(Application.job_id, Application.candidate_id)
+        created = {(r.job_id, r.candidate_id) for r in db.execute(stmt, rows)}
+    else:
+        existing = set(db.execute(
+            select(Application.job_id, Application.candidate_id)
+            .where(tuple_(Application.job_id, Application.candidate_id).in_(pairs))
+        ).tuples())
+        new_rows = [r for r in rows if (r["job_id"], r["candidate_id"]) not in existing]
+        if new_rows:
+            db.execute(Application.__table__.insert(), new_rows)
+        created = {(r["job_id"], r["candidate_id"]) for r in new_rows}
+
+    applications = {
+        (row.job_id, row.candidate_id): row._asdict()
+        for row in db.execute(
+            select(*APPLICATION_COLUMNS)
+            .where(tuple_(Application.job_id, Application.candidate_id).in_(pairs))
+        )
+    }
+
+    results = []
+    match_rows = []
+    key_rows = {}
+    claimed = set()
+    for write in writes:
+        pair = (write.job_id, write.candidate_id)
+        # Only the first write for a pair in the batch counts as the creator
+        is_creator = pair in created and pair not in claimed
+        claimed.add(pair)
+        application = applications[pair]
+        results.append(ApplicationWriteResult(application, is_creator))
+        if not is_creator:
+            continue
+        if write.match is not None:
+            match_rows.append({**write.match, "job_id": write.job_id, "created_at": now})
+        key = (write.candidate_id, write.idempotency_key)
+        # One row per key: a statement that upserts the same key twice
+        # fails on Postgres. The first write in the batch keeps it.
+        if write.idempotency_key and key not in key_rows:
+            key_rows[key] = {
+                "user_id": write.candidate_id,
+                "endpoint": CREATE_APPLICATION_ENDPOINT,
+                "key": write.idempotency_key,
+                "resource_id": application["id"],
+                "request_hash": write.request_hash,
+                "created_at": now,
+            }
+
+    # An existing result for the pair is kept
+    add_match_results(db, match_rows)
+
+    if key_rows:
+        if supports_on_conflict(bind):
+            # An expired key may be reused; point it at the new application
+            stmt = dialect_insert(bind, IdempotencyKey)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "endpoint", "key"],
+                set_={
+                    "resource_id": stmt.excluded.resource_id,
+                    "request_hash": stmt.excluded.request_hash,
+                    "created_at": stmt.excluded.created_at,
+                },
+            )
+            db.execute(stmt, list(key_rows.values()))
+        else:
+            db.execute(IdempotencyKey.__table__.insert(), list(key_rows.values()))
+
+    db.commit()
+    return results
+
+
+class ApplicationWriter:
+    """
+    Group commit for application inserts. Requests hand their write to a
+    single writer thread, which waits a few milliseconds for others to
+    arrive and commits the whole batch at once, so a burst of applies
+    costs one transaction per batch instead of two per request.
+    """
+
+    def __init__(self, window_seconds: float, max_batch: int, session_factory=SessionLocal):
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self.session_factory = session_factory
+        self._queue: "queue.Queue[Optional[Tuple[ApplicationWrite, Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="application-writer", daemon=True)
+                self._thread.start()
+
+    def submit(self, write: ApplicationWrite) -> ApplicationWriteResult:
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((write, future))
+        return future.result(timeout=SUBMIT_TIMEOUT_SECONDS)
+
+    def _collect(self, first) -> List[Tuple[ApplicationWrite, Future]]:
+        batch = [first]
+        deadline = time.monotonic() + self.window_seconds
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Shutdown: flush what we have, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = self._collect(item)
+            db = self.session_factory()
+            try:
+                results = write_applications(db, [write for write, _ in batch])
+            except Exception:
+                logger.exception("Group commit of %d applications failed; retrying one by one", len(batch))
+                db.rollback()
+                self._write_each(db, batch)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            finally:
+                db.close()
+
+    @staticmethod
+    def _write_each(db, batch: List[Tuple[ApplicationWrite, Future]]):
+        # One bad write must not fail the requests batched with it
+        for write, future in batch:
+            try:
+                future.set_result(write_applications(db, [write])[0])
+            except Exception as exc:
+                db.rollback()
+                future.set_exception(exc)
+
+    def stop(self, timeout: Optional[float] = None):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+_writer: Optional[ApplicationWriter] = None
+
+
+def get_application_writer() -> Optional[ApplicationWriter]:
+    """
+    Returns the process-wide writer, or None if group commit is disabled.
+    """
+    global _writer
+    if not config.APPLICATION_GROUP_COMMIT:
+        return None
+    if _writer is None:
+        _writer = ApplicationWriter(
+            window_seconds=config.GROUP_COMMIT_WINDOW_MS / 1000,
+            max_batch=config.GROUP_COMMIT_MAX_BATCH,
+        )
+    return _writer
+
+
+def stop_application_writer(timeout: Optional[float] = None):
+    if _writer is not None:
+        _writer.stop(timeout)
@@ -0,0 +1,216 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import exists, select, update
+from sqlalchemy.orm import Session
+
+from backend.core import config
+from backend.coordination import get_queue, register_handler
+from backend.database.db import SessionLocal
+from backend.database.models import JobDescription, JobScoringRun, MatchResult, Resume
+from backend.services.matching_engine import match_resume_to_job
+from backend.services.retention import add_match_results
+
+logger = logging.getLogger(__name__)
+
+SCORE_CHUNK_TASK = "score_chunk"
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+# Splits runs into chunk tasks; the scoring itself is done by queue
+# workers on whichever instance leases each chunk.
+_drivers = ThreadPoolExecutor(max_workers=2, thread_name_prefix="job-scoring")
+_pool_lock = threading.Lock()
+
+
+def _worker_share(host_total: int) -> int:
+    # Budgets are per host; each server worker process takes its share
+    return max(1, host_total // max(1, config.SERVER_WORKERS))
+
+
+def scoring_processes() -> int:
+    """
+    Scoring processes for this worker process.
+    """
+    return _worker_share(config.SCORING_PROCESSES or os.cpu_count() or 1)
+
+
+def queue_threads() -> int:
+    """
+    Queue worker threads for this worker process.
+    """
+    if config.QUEUE_WORKERS:
+        return _worker_share(config.QUEUE_WORKERS)
+    return scoring_processes()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is None:
+            # spawn: forking a threaded server process is unsafe
+            _process_pool = ProcessPoolExecutor(
+                max_workers=scoring_processes(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def shutdown_pools():
+    global _process_pool
+    _drivers.shutdown(wait=False, cancel_futures=True)
+    with _pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def score_chunk(job_id: int, jd_text: str, resumes: List[Tuple[int, str]]) -> List[Dict]:
+    """
+    Scores one chunk of resumes against a job. Runs in a worker process and
+    returns rows ready for a bulk insert into match_results.
+    """
+    rows = []
+    for resume_id, content in resumes:
+        result = match_resume_to_job(content, jd_text)
+        rows.append({
+            "resume_id": resume_id,
+            "job_id": job_id,
+            "score": result["score"],
+            "missing_keywords": ", ".join(result["missing_keywords"]),
+            "created_at": datetime.utcnow(),
+        })
+    return rows
+
+
+def _unscored_resumes(job_id: int, *columns):
+    already_scored = exists().where(
+        MatchResult.resume_id == Resume.id,
+        MatchResult.job_id == job_id
+    )
+    return select(*(columns or (Resume.id,))).where(~already_scored).order_by(Resume.id)
+
+
+def _id_chunks(db: Session, job_id: int, size: int) -> Iterator[List[int]]:
+    # Keyset pagination: each chunk is a short read, so no cursor is held
+    # open while other workers write results.
+    last_id = 0
+    while True:
+        ids = db.execute(
+            _unscored_resumes(job_id).where(Resume.id > last_id).limit(size)
+        ).scalars().all()
+        if not ids:
+            return
+        last_id = ids[-1]
+        yield ids
+
+
+def _finish_if_done(db: Session, run_id: int):
+    db.execute(
+        update(JobScoringRun)
+        .where(
+            JobScoringRun.id == run_id,
+            JobScoringRun.status == "running",
+            JobScoringRun.processed >= JobScoringRun.total,
+        )
+        .values(status="completed", finished_at=datetime.utcnow())
+    )
+    db.commit()
+
+
+def _mark_failed(run_id: int, error: str):
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(JobScoringRun)
+            .where(JobScoringRun.id == run_id)
+            .values(status="failed", error=error, finished_at=datetime.utcnow())
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _on_chunk_failed(payload: dict, error: str):
+    _mark_failed(payload["run_id"], error)
+
+
+@register_handler(SCORE_CHUNK_TASK, on_failure=_on_chunk_failed)
+def run_score_chunk(payload: dict):
+    """
+    Queue handler: scores one chunk of a run in the local process pool and
+    writes the results and the progress update in one transaction.
+    """
+    db = SessionLocal()
+    try:
+        job = db.get(JobDescription, payload["job_id"])
+        # A retried chunk skips resumes an earlier attempt already stored
+        resumes = db.execute(
+            _unscored_resumes(job.id, Resume.id, Resume.content)
+            .where(Resume.id.in_(payload["resume_ids"]))
+        ).all()
+        db.rollback()
+
+        rows = get_process_pool().submit(
+            score_chunk, job.id, job.description, [(r.id, r.content) for r in resumes]
+        ).result()
+
+        # A candidate may have scored themselves since the chunk was read
+        add_match_results(db, rows)
+        db.execute(
+            update(JobScoringRun)
+            .where(JobScoringRun.id == payload["run_id"])
+            .values(processed=JobScoringRun.processed + len(payload["resume_ids"]))
+        )
+        db.commit()
+        _finish_if_done(db, payload["run_id"])
+    finally:
+        db.close()
+
+
+def enqueue_job_scoring(run_id: int):
+    """
+    Splits a run into chunk tasks on the work queue. Any instance's queue
+    worker may pick them up.
+    """
+    db = SessionLocal()
+    try:
+        run = db.get(JobScoringRun, run_id)
+        queue = get_queue()
+        total = 0
+        for ids in _id_chunks(db, run.job_id, config.SCORING_CHUNK_SIZE):
+            queue.enqueue(
+                SCORE_CHUNK_TASK,
+                {"run_id": run.id, "job_id": run.job_id, "resume_ids": ids},
+                max_attempts=config.QUEUE_MAX_ATTEMPTS,
+            )
+            total += len(ids)
+            # End the read transaction so workers can commit between pages
+            db.rollback()
+
+        run.total = total
+        run.status = "running"
+        db.commit()
+        _finish_if_done(db, run.id)
+    except Exception as exc:
+        logger.exception("Queueing scoring run %s failed", run_id)
+        db.rollback()
+        _mark_failed(run_id, str(exc))
+    finally:
+        db.close()
+
+
+def start_job_scoring(db: Session, job: JobDescription) -> JobScoringRun:
+    """
+    Records a scoring run for the job and queues it in the background.
+    """
+    run = JobScoringRun(job_id=job.id, status="pending")
+    db.add(run)
+    db.commit()
+    db.refresh(run)
+    _drivers.submit(enqueue_job_scoring, run.id)
+    return run
@@ -1,27 +1,29 @@
-from typing import Dict, List, Set
+from typing import Dict
 from backend.services.ai_engine import extract_resume_keywords, extract_jd_keywords
 
 def match_resume_to_job(resume_text: str, jd_text: str) -> Dict:
     """
     Compares resume text against job description text based on keywords.
     """
+    # One-off sets: plain set operations, no interning, so the shared
+    # vocabulary only holds terms of long-lived sets.
     resume_keywords = extract_resume_keywords(resume_text)
     jd_keywords = extract_jd_keywords(jd_text)
-    
+
     if not jd_keywords:
         return {
             "score": 0.0,
             "matched_keywords": [],
             "missing_keywords": []
         }
-    
-    matched_keywords = resume_keywords.intersection(jd_keywords)
+
+    matched_keywords = resume_keywords & jd_keywords
     missing_keywords = jd_keywords - resume_keywords
-    
+
     score = (len(matched_keywords) / len(jd_keywords)) * 100
-    
+
     return {
         "score": round(score, 2),
-        "matched_keywords": list(matched_keywords),
-        "missing_keywords": list(missing_keywords)
+        "matched_keywords": sorted(matched_keywords),
+        "missing_keywords": sorted(missing_keywords)
     }
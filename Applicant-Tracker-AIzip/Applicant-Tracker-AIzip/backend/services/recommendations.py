@@ -0,0 +1,255 @@
+import heapq
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.core import config
+from backend.coordination import get_cache
+from backend.database.models import JobDescription, Resume
+from backend.services.ai_engine import extract_jd_keywords, extract_resume_keywords
+from backend.services.vocabulary import KeywordSet, Vocabulary, count_in, get_vocabulary
+
+# Jobs read per round trip when the index catches up
+INDEX_FETCH_SIZE = 500
+# Ids below the highest one seen that are checked again on every refresh.
+# Postgres assigns ids at INSERT, so a job can commit after jobs with
+# higher ids are already visible.
+INDEX_RECHECK_IDS = 1000
+
+
+def term_hashes(terms: Iterable[str]) -> array:
+    """
+    64-bit hashes of distinct terms, 8 bytes each. Hashes are per process,
+    like vocabulary ids, and a collision between two of a job's and a
+    resume's keywords is vanishingly unlikely.
+    """
+    return array("q", {hash(term) for term in terms})
+
+
+@dataclass
+class JobEntry:
+    id: int
+    title: str
+    created_at: datetime
+    # Keywords in the vocabulary (canonical skills and persisted terms) as
+    # ids; the job's other words as hashes, so indexing a job never grows
+    # the process-wide vocabulary.
+    keywords: KeywordSet
+    other_keywords: array
+
+    def __len__(self) -> int:
+        return len(self.keywords) + len(self.other_keywords)
+
+
+class JobIndex:
+    """
+    Keyword sets of every job, kept in memory so a resume can be scored
+    against all of them without re-parsing descriptions. Jobs are never
+    edited, so the index catches up by reading jobs above the highest id
+    it has seen, plus any it missed in the last INDEX_RECHECK_IDS ids.
+    Those late jobs are kept in a separate list (see late_entries).
+    """
+
+    def __init__(self):
+        self._entries: List[JobEntry] = []
+        self._ids: List[int] = []
+        self._late: List[JobEntry] = []
+        self._by_id: Dict[int, JobEntry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def watermark(self) -> int:
+        return self._ids[-1] if self._ids else 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self, db: Session) -> int:
+        """
+        Indexes jobs added since the last refresh; returns how many.
+        """
+        vocabulary = get_vocabulary()
+        columns = (
+            JobDescription.id,
+            JobDescription.title,
+            JobDescription.description,
+            JobDescription.created_at,
+        )
+        with self._lock:
+            watermark = self.watermark
+            recent = db.execute(
+                select(JobDescription.id)
+                .where(JobDescription.id > watermark - INDEX_RECHECK_IDS, JobDescription.id <= watermark)
+            ).scalars()
+            missed = [job_id for job_id in recent if job_id not in self._by_id]
+            added = 0
+            if missed:
+                for row in db.execute(select(*columns).where(JobDescription.id.in_(missed))):
+                    entry = self._entry(row, vocabulary)
+                    self._by_id[row.id] = entry
+                    self._late.append(entry)
+                    added += 1
+
+            rows = db.execute(
+                select(*columns)
+                .where(JobDescription.id > watermark)
+                .order_by(JobDescription.id)
+                .execution_options(yield_per=INDEX_FETCH_SIZE)
+            )
+            for row in rows:
+                entry = self._entry(row, vocabulary)
+                self._by_id[row.id] = entry
+                self._entries.append(entry)
+                # Appended last: readers use _ids to decide what exists
+                self._ids.append(row.id)
+                added += 1
+            return added
+
+    @staticmethod
+    def _entry(row, vocabulary: Vocabulary) -> JobEntry:
+        terms = extract_jd_keywords(row.description)
+        return JobEntry(
+            row.id,
+            row.title,
+            row.created_at,
+            vocabulary.known_set(terms),
+            term_hashes(term for term in terms if vocabulary.lookup(term) is None),
+        )
+
+    def get(self, job_id: int) -> Optional[JobEntry]:
+        return self._by_id.get(job_id)
+
+    def since(self, job_id: int) -> List[JobEntry]:
+        """
+        Jobs with an id above job_id, oldest first.
+        """
+        count = len(self._ids)
+        return self._entries[bisect_right(self._ids, job_id, 0, count):count]
+
+    def late_entries(self) -> List[JobEntry]:
+        """
+        Jobs that became visible after jobs with higher ids, in the order
+        they were found. since() doesn't return them.
+        """
+        return self._late[:]
+
+
+_job_index = JobIndex()
+
+
+def get_job_index() -> JobIndex:
+    return _job_index
+
+
+@dataclass
+class ResumeProbe:
+    """
+    A resume's keywords as hash sets, built once per request and tested
+    against every job. All terms are hashed, not just unknown ones, so a
+    term interned after a job was indexed still matches.
+    """
+    ids: FrozenSet[int]
+    hashes: FrozenSet[int]
+
+    @classmethod
+    def from_terms(cls, terms: Set[str], vocabulary: Vocabulary) -> "ResumeProbe":
+        return cls(vocabulary.known_set(terms).probe(), frozenset(hash(term) for term in terms))
+
+
+def fit_score(resume: ResumeProbe, job: JobEntry) -> float:
+    """
+    Same score as match_resume_to_job: share of the job's keywords the
+    resume covers.
+    """
+    total = len(job)
+    if not total:
+        return 0.0
+    matched = count_in(resume.ids, job.keywords) + len(resume.hashes.intersection(job.other_keywords))
+    return round(matched / total * 100, 2)
+
+
+@dataclass
+class CachedRecommendations:
+    # Resume.created_at the scores were computed for; it changes whenever
+    # the resume is replaced.
+    version: str
+    # Scores for the jobs scored so far, in ascending job id order
+    job_ids: array
+    scores: array
+
+
+def recommendations_cache_key(resume_id: int) -> str:
+    return f"recommendations:{resume_id}"
+
+
+def _contains(job_ids: array, job_id: int) -> bool:
+    i = bisect_left(job_ids, job_id)
+    return i < len(job_ids) and job_ids[i] == job_id
+
+
+def _scores_for(resume: Resume, index: JobIndex) -> CachedRecommendations:
+    """
+    Returns the cached scores for the resume, scoring only the jobs posted
+    since they were cached and late jobs it doesn't have yet. A changed
+    resume is rescored from scratch.
+    """
+    cache = get_cache()
+    key = recommendations_cache_key(resume.id)
+    version = resume.created_at.isoformat()
+    cached = cache.get(key)
+    if cached is None or cached.version != version:
+        cached = CachedRecommendations(version, array("I"), array("d"))
+
+    new_jobs = index.since(cached.job_ids[-1] if cached.job_ids else 0)
+    late_jobs = [entry for entry in index.late_entries() if not _contains(cached.job_ids, entry.id)]
+    if not new_jobs and not late_jobs:
+        return cached
+
+    resume_probe = ResumeProbe.from_terms(extract_resume_keywords(str(resume.content)), get_vocabulary())
+    # Cached objects may be shared with other requests; extend copies
+    job_ids = array("I", cached.job_ids)
+    scores = array("d", cached.scores)
+    for entry in new_jobs:
+        job_ids.append(entry.id)
+        scores.append(fit_score(resume_probe, entry))
+    if late_jobs:
+        pairs = sorted([
+            *zip(job_ids, scores),
+            *((entry.id, fit_score(resume_probe, entry)) for entry in late_jobs),
+        ])
+        job_ids = array("I", (job_id for job_id, _ in pairs))
+        scores = array("d", (score for _, score in pairs))
+    cached = CachedRecommendations(version, job_ids, scores)
+    cache.set(key, cached, ttl=config.RECOMMENDATION_CACHE_TTL_SECONDS)
+    return cached
+
+
+def recommend_jobs(db: Session, resume: Resume, k: int) -> List[Dict]:
+    """
+    Top-k jobs for a resume by fit score, newest first among equal scores.
+    """
+    index = get_job_index()
+    index.refresh(db)
+    cached = _scores_for(resume, index)
+
+    job_ids, scores = cached.job_ids, cached.scores
+    top = heapq.nlargest(k, range(len(job_ids)), key=lambda i: (scores[i], job_ids[i]))
+    results = []
+    for i in top:
+        entry = index.get(job_ids[i])
+        if entry is None:
+            # Scored by an instance whose database view was further ahead
+            continue
+        results.append({
+            "job_id": entry.id,
+            "title": entry.title,
+            "score": scores[i],
+            "created_at": entry.created_at,
+        })
+    return results
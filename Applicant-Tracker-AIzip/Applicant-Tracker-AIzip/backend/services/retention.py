@@ -0,0 +1,395 @@
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from sqlalchemy import DateTime, delete, func, insert, literal, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pyarrow is optional; archives fall back to gzipped JSON lines
+    pyarrow = None
+
+from backend.coordination.broadcast import prune_events
+from backend.core import config
+from backend.core.rate_limit import prune_full_buckets
+from backend.database.db import engine
+from backend.database.dialects import dialect_insert, supports_on_conflict
+from backend.database.models import IdempotencyKey, MaintenanceRun, MatchResult, MatchResultArchive
+from backend.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+COMPACTION_RUN = "match_results.compaction"
+
+ARCHIVE_COLUMNS = (
+    "match_id", "resume_id", "job_id", "score", "missing_keywords", "created_at", "archived_at",
+)
+
+
+def _archive_rows(where, now: datetime):
+    """
+    INSERT ... SELECT copying the hot rows matching `where` to the archive.
+    """
+    return insert(MatchResultArchive).from_select(
+        list(ARCHIVE_COLUMNS),
+        select(
+            MatchResult.id,
+            MatchResult.resume_id,
+            MatchResult.job_id,
+            MatchResult.score,
+            MatchResult.missing_keywords,
+            MatchResult.created_at,
+            literal(now, DateTime),
+        ).where(where),
+    )
+
+
+def _pairs(rows: List[Dict]):
+    return list(dict.fromkeys((r["resume_id"], r["job_id"]) for r in rows))
+
+
+def save_match_results(db, rows: List[Dict]):
+    """
+    Stores the latest result for each (resume, job), replacing the current
+    one. The replaced result is copied to the archive first when match
+    history is enabled. Runs in the caller's transaction.
+    """
+    if not rows:
+        return
+    bind = db.get_bind()
+    pairs = _pairs(rows)
+    in_pairs = tuple_(MatchResult.resume_id, MatchResult.job_id).in_(pairs)
+
+    if config.MATCH_HISTORY_ENABLED:
+        db.execute(_archive_rows(in_pairs, datetime.utcnow()))
+
+    if supports_on_conflict(bind):
+        stmt = dialect_insert(bind, MatchResult)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["resume_id", "job_id"],
+            set_={
+                "score": stmt.excluded.score,
+                "missing_keywords": stmt.excluded.missing_keywords,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        db.execute(stmt, rows)
+        return
+
+    existing = set(db.execute(
+        select(MatchResult.resume_id, MatchResult.job_id).where(in_pairs)
+    ).tuples())
+    for row in rows:
+        if (row["resume_id"], row["job_id"]) in existing:
+            db.execute(
+                update(MatchResult)
+                .where(MatchResult.resume_id == row["resume_id"], MatchResult.job_id == row["job_id"])
+                .values(score=row["score"], missing_keywords=row["missing_keywords"], created_at=row["created_at"])
+            )
+        else:
+            db.execute(insert(MatchResult), [row])
+            existing.add((row["resume_id"], row["job_id"]))
+
+
+def add_match_results(db, rows: List[Dict]):
+    """
+    Stores results for (resume, job) pairs that have none yet; pairs
+    already scored keep their current result.
+    """
+    if not rows:
+        return
+    bind = db.get_bind()
+    if supports_on_conflict(bind):
+        db.execute(
+            dialect_insert(bind, MatchResult).on_conflict_do_nothing(index_elements=["resume_id", "job_id"]),
+            rows,
+        )
+        return
+
+    scored = set(db.execute(
+        select(MatchResult.resume_id, MatchResult.job_id)
+        .where(tuple_(MatchResult.resume_id, MatchResult.job_id).in_(_pairs(rows)))
+    ).tuples())
+    rows = [r for r in rows if (r["resume_id"], r["job_id"]) not in scored]
+    if rows:
+        db.execute(insert(MatchResult), rows)
+
+
+def archive_superseded(conn, now: Optional[datetime] = None) -> int:
+    """
+    Moves all but the newest result per (resume, job) out of the hot
+    table. Databases written by older versions kept every result there;
+    this is a full-table scan, run once by apply_migrations before the
+    unique index that keeps the table that way is created.
+    """
+    keep = select(func.max(MatchResult.id)).group_by(MatchResult.resume_id, MatchResult.job_id)
+    superseded = MatchResult.id.not_in(keep)
+    if config.MATCH_HISTORY_ENABLED:
+        conn.execute(_archive_rows(superseded, now or datetime.utcnow()))
+    return conn.execute(delete(MatchResult).where(superseded)).rowcount
+
+
+def archive_format() -> str:
+    if config.ARCHIVE_FORMAT == "auto":
+        return "parquet" if pyarrow is not None else "jsonl"
+    if config.ARCHIVE_FORMAT == "parquet" and pyarrow is None:
+        raise RuntimeError("ATS_ARCHIVE_FORMAT=parquet requires the pyarrow package")
+    return config.ARCHIVE_FORMAT
+
+
+def _write_archive_file(path: Path, rows: List[Dict], fmt: str) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    if fmt == "parquet":
+        pyarrow.parquet.write_table(pyarrow.Table.from_pylist(rows), tmp, compression="zstd")
+    else:
+        with gzip.open(tmp, "wb") as f:
+            for row in rows:
+                f.write(dumps(row) + b"\n")
+    os.replace(tmp, path)
+    return path.stat().st_size
+
+
+def export_archive(cutoff: datetime, directory: Path, batch_size: int, bind=None):
+    """
+    Moves archived results older than the cutoff out of the database into
+    compressed files, one file per batch. Returns (rows, files, bytes).
+    """
+    bind = bind or engine
+    fmt = archive_format()
+    suffix = ".parquet" if fmt == "parquet" else ".jsonl.gz"
+    columns = [getattr(MatchResultArchive, name) for name in ARCHIVE_COLUMNS]
+    exported = files = written = 0
+    while True:
+        with bind.begin() as conn:
+            batch = conn.execute(
+                select(MatchResultArchive.id, *columns)
+                .where(MatchResultArchive.archived_at < cutoff)
+                .order_by(MatchResultArchive.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            first, last = batch[0].id, batch[-1].id
+            path = directory / f"match_results_{first:012d}-{last:012d}{suffix}"
+            # The rows are only deleted once the file is in place. If the
+            # commit fails the next run writes the same ids again, so
+            # readers should de-duplicate on match_id + archived_at.
+            written += _write_archive_file(path, [
+                {name: getattr(row, name) for name in ARCHIVE_COLUMNS} for row in batch
+            ], fmt)
+            conn.execute(delete(MatchResultArchive).where(
+                MatchResultArchive.id.in_([row.id for row in batch])
+            ))
+        exported += len(batch)
+        files += 1
+        if len(batch) < batch_size:
+            break
+    return exported, files, written
+
+
+def prune_idempotency_keys(conn, now: datetime) -> int:
+    cutoff = now - timedelta(hours=config.IDEMPOTENCY_KEY_TTL_HOURS)
+    return conn.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)).rowcount
+
+
+@dataclass
+class CompactionResult:
+    archive_rows_exported: int = 0
+    archive_files_written: int = 0
+    archive_bytes_written: int = 0
+    idempotency_keys_pruned: int = 0
+    rate_limit_buckets_pruned: int = 0
+    coordination_events_pruned: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def rows_reclaimed(self) -> int:
+        return (self.archive_rows_exported + self.idempotency_keys_pruned
+                + self.rate_limit_buckets_pruned + self.coordination_events_pruned)
+
+
+def compact(now: Optional[datetime] = None, bind=None) -> CompactionResult:
+    """
+    One compaction pass: archive rows past MATCH_ARCHIVE_DAYS go to
+    files, and expired idempotency keys, refilled rate limit buckets and
+    old coordination events are deleted. Each step commits on its own. Superseded results never
+    reach the hot table (see save_match_results), so it is not scanned.
+    """
+    bind = bind or engine
+    now = now or datetime.utcnow()
+    started = time.monotonic()
+    result = CompactionResult()
+
+    if config.MATCH_ARCHIVE_DAYS > 0:
+        rows, files, written = export_archive(
+            now - timedelta(days=config.MATCH_ARCHIVE_DAYS),
+            config.ARCHIVE_DIR,
+            config.ARCHIVE_BATCH_SIZE,
+            bind,
+        )
+        result.archive_rows_exported = rows
+        result.archive_files_written = files
+        result.archive_bytes_written = written
+
+    with bind.begin() as conn:
+        result.idempotency_keys_pruned = prune_idempotency_keys(conn, now)
+        result.rate_limit_buckets_pruned = prune_full_buckets(conn, time.time())
+        result.coordination_events_pruned = prune_events(conn, time.time())
+
+    result.duration_seconds = round(time.monotonic() - started, 3)
+    _totals.add(result)
+    logger.info("Compaction reclaimed %d rows: %s", result.rows_reclaimed, asdict(result))
+    return result
+
+
+class CompactionTotals:
+    """
+    Counters accumulated by this process since it started.
+    """
+
+    FIELDS = ("archive_rows_exported", "archive_files_written", "archive_bytes_written",
+              "idempotency_keys_pruned", "rate_limit_buckets_pruned", "coordination_events_pruned")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, result: CompactionResult):
+        with self._lock:
+            self.runs += 1
+            for name in self.FIELDS:
+                self.counts[name] += getattr(result, name)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {"runs": self.runs, **self.counts}
+
+
+_totals = CompactionTotals()
+
+
+def claim_run(name: str, interval: float, now: Optional[float] = None, bind=None) -> bool:
+    """
+    Claims a periodic maintenance run across every worker and host sharing
+    the database. Returns True for exactly one caller per interval.
+    """
+    bind = bind or engine
+    now = time.time() if now is None else now
+    try:
+        with bind.begin() as conn:
+            row = conn.execute(
+                select(MaintenanceRun.started_at).where(MaintenanceRun.name == name)
+            ).first()
+            if row is None:
+                conn.execute(insert(MaintenanceRun).values(name=name, started_at=now))
+                return True
+            if row.started_at > now - interval:
+                return False
+            result = conn.execute(
+                update(MaintenanceRun)
+                .where(MaintenanceRun.name == name, MaintenanceRun.started_at == row.started_at)
+                .values(started_at=now)
+            )
+            return result.rowcount == 1
+    except IntegrityError:
+        # Another worker created the row first
+        return False
+
+
+def _record_run(name: str, result: CompactionResult, bind=None):
+    bind = bind or engine
+    with bind.begin() as conn:
+        conn.execute(
+            update(MaintenanceRun)
+            .where(MaintenanceRun.name == name)
+            .values(finished_at=time.time(), last_result=json.dumps(asdict(result)))
+        )
+
+
+def retention_metrics(bind=None) -> Dict:
+    """
+    Table sizes, the last compaction run (by any instance) and this
+    process's totals.
+    """
+    bind = bind or engine
+    with bind.connect() as conn:
+        hot = conn.execute(select(func.count()).select_from(MatchResult)).scalar_one()
+        archived = conn.execute(select(func.count()).select_from(MatchResultArchive)).scalar_one()
+        run = conn.execute(
+            select(MaintenanceRun).where(MaintenanceRun.name == COMPACTION_RUN)
+        ).first()
+    last_run = None
+    if run is not None:
+        last_run = {
+            "started_at": run.started_at,
+            "finished_at": run.finished_at,
+            "result": json.loads(run.last_result) if run.last_result else None,
+        }
+    return {
+        "match_results": hot,
+        "match_results_archive": archived,
+        "archive_format": archive_format(),
+        "last_compaction": last_run,
+        "process_totals": _totals.snapshot(),
+    }
+
+
+class CompactionScheduler:
+    """
+    Background thread that runs compaction every interval. Every worker
+    runs one; claim_run() lets only one of them do the work per interval.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="compaction", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        tick = max(1.0, min(self.interval_seconds / 4, 60.0))
+        while not self._stop.wait(tick):
+            try:
+                if claim_run(COMPACTION_RUN, self.interval_seconds):
+                    _record_run(COMPACTION_RUN, compact())
+            except Exception:
+                logger.exception("Compaction failed")
+
+    def stop(self, timeout: Optional[float] = None):
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join(timeout)
+
+
+_scheduler: Optional[CompactionScheduler] = None
+
+
+def start_compaction():
+    global _scheduler
+    if config.COMPACTION_INTERVAL_SECONDS > 0 and _scheduler is None:
+        _scheduler = CompactionScheduler(config.COMPACTION_INTERVAL_SECONDS)
+        _scheduler.start()
+
+
+def stop_compaction(timeout: Optional[float] = None):
+    global _scheduler
+    scheduler, _scheduler = _scheduler, None
+    if scheduler is not None:
+        scheduler.stop(timeout)
@@ -0,0 +1,277 @@
+import json
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from backend.core import config
+from backend.utils.text_utils import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# Punctuation stripped from the edges of a token before lookup. "+" and "#"
+# are kept so "c++" and "c#" survive; inner dots keep "node.js" intact, and
+# a leading dot is kept so ".net" doesn't turn into the word "net".
+LEADING_PUNCTUATION = ",;:!?()[]{}<>\"'`*|~"
+EDGE_PUNCTUATION = "." + LEADING_PUNCTUATION
+
+NON_WORD = re.compile(r"[^\w]")
+
+# Key marking the end of a phrase in the trie; never a valid token
+END = ""
+
+
+def split_tokens(text: str) -> List[str]:
+    """
+    Lowercases text and splits it on whitespace, stripping edge punctuation
+    from each token. Empty tokens are dropped.
+    """
+    tokens = []
+    for raw in text.lower().split():
+        token = clean_token(raw)
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def clean_token(raw: str) -> str:
+    return raw.lstrip(LEADING_PUNCTUATION).rstrip(EDGE_PUNCTUATION)
+
+
+def plain_keyword(token: str) -> Optional[str]:
+    """
+    Reduces a token that isn't a known skill the same way normalize_text
+    does (all punctuation removed), dropping stopwords.
+    """
+    if not token.isalnum():
+        token = NON_WORD.sub("", token)
+    if not token or token in STOPWORDS:
+        return None
+    return token
+
+
+def load_taxonomy(path: Path) -> Dict[str, List[str]]:
+    """
+    Loads a taxonomy file mapping each canonical skill to its synonyms, e.g.
+    {"kubernetes": ["k8s"], "machine learning": ["ml"]}.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning("Skill taxonomy %s not found; using plain keywords only", path)
+        return {}
+
+
+class SkillMatcher:
+    """
+    Token trie compiled from a skill taxonomy. Extraction scans the token
+    stream once, taking the longest phrase that starts at each position, so
+    multi-word skills and synonyms collapse into one canonical keyword.
+    Tokens that aren't part of a skill pass through as plain keywords.
+
+    Only tokens that start some phrase cost more than a plain keyword. A
+    taxonomy of tens of thousands of phrases starting with everyday words
+    makes most tokens do so, and extraction then takes about 1.5-2x as
+    long as without a taxonomy (benchmarks/bench_taxonomy.py).
+    """
+
+    def __init__(self, taxonomy: Mapping[str, Iterable[str]]):
+        self._root: Dict[str, dict] = {}
+        self.term_count = 0
+        self.max_phrase_tokens = 0
+
+        for canonical, synonyms in taxonomy.items():
+            # Reported as written in the taxonomy
+            canonical_key = " ".join(canonical.split())
+            if not canonical_key:
+                continue
+            for term in (canonical, *synonyms):
+                self._add(split_tokens(term), canonical_key)
+
+    def _add(self, tokens: List[str], canonical: str):
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if END not in node:
+            self.term_count += 1
+        node[END] = canonical
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(tokens))
+
+    def canonical_terms(self) -> List[str]:
+        terms = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for token, child in node.items():
+                if token == END:
+                    terms.append(child)
+                else:
+                    stack.append(child)
+        return sorted(set(terms))
+
+    def longest_match(self, tokens: List[str], start: int) -> Tuple[int, Optional[str]]:
+        """
+        Returns (end index, canonical skill) of the longest phrase starting
+        at tokens[start], or (start, None) if no phrase starts there.
+        """
+        node = self._root.get(tokens[start])
+        end, skill = start, None
+        i = start
+        while node is not None:
+            i += 1
+            canonical = node.get(END)
+            if canonical is not None:
+                end, skill = i, canonical
+            if i >= len(tokens):
+                break
+            node = node.get(tokens[i])
+        return end, skill
+
+    def extract_from_tokens(self, tokens: List[str], keywords: Set[str]):
+        """
+        Adds the keywords found in a token list to the given set.
+        """
+        self.scan(tokens, keywords, len(tokens))
+
+    def scan(self, tokens: List[str], keywords: Set[str], stop: int) -> int:
+        """
+        Adds the keywords for phrases and tokens starting before `stop` and
+        returns the index scanning ended at (at least `stop`, more if the
+        last phrase ran past it).
+        """
+        # Most tokens are not skills, so the common path is one failed dict
+        # lookup followed by the plain-keyword cleanup. With a large
+        # taxonomy most tokens start some phrase, so the longest match is
+        # walked inline rather than through longest_match().
+        root = self._root
+        add = keywords.add
+        count = len(tokens)
+        i = 0
+        while i < stop:
+            token = tokens[i]
+            node = root.get(token)
+            if node is not None:
+                skill = node.get(END)
+                end = i + 1
+                j = end
+                while j < count:
+                    node = node.get(tokens[j])
+                    if node is None:
+                        break
+                    j += 1
+                    canonical = node.get(END)
+                    if canonical is not None:
+                        end, skill = j, canonical
+                if skill is not None:
+                    add(skill)
+                    i = end
+                    continue
+            if not token.isalnum():
+                token = NON_WORD.sub("", token)
+            if token and token not in STOPWORDS:
+                add(token)
+            i += 1
+        return i
+
+    def accumulator(self) -> "KeywordAccumulator":
+        return KeywordAccumulator(
+            self,
+            max_keywords=config.MAX_KEYWORDS_PER_DOCUMENT,
+            max_token_chars=config.MAX_TOKEN_CHARS,
+        )
+
+    def extract_chunks(self, chunks: Iterable[str]) -> Set[str]:
+        """
+        Extracts keywords from text arriving in pieces, e.g. read from a
+        file, without joining it.
+        """
+        accumulator = self.accumulator()
+        for chunk in chunks:
+            accumulator.feed(chunk)
+        return accumulator.close()
+
+    def extract(self, text: str) -> Set[str]:
+        window = config.EXTRACTION_WINDOW_CHARS
+        return self.extract_chunks(text[start:start + window] for start in range(0, len(text), window))
+
+
+# Stands in for an over-long token: it separates the tokens around it like
+# a real one but never matches a skill or becomes a keyword.
+BREAK = " "
+
+
+class KeywordAccumulator:
+    """
+    Incremental extraction over text fed in windows, so memory is bounded
+    by the window size rather than the document. A token cut by a window
+    boundary is carried over whole, and the last max_phrase_tokens - 1
+    tokens are held back until the next window, so the keywords are the
+    same as for the text in one piece.
+    """
+
+    def __init__(self, matcher: SkillMatcher, max_keywords: int, max_token_chars: int):
+        self.matcher = matcher
+        self.keywords: Set[str] = set()
+        self.max_keywords = max_keywords
+        self.max_token_chars = max_token_chars
+        # A phrase starting within this many tokens of the end may continue
+        # into the next window
+        self._lookahead = max(matcher.max_phrase_tokens, 1)
+        self._tokens: List[str] = []
+        self._partial = ""
+
+    @property
+    def full(self) -> bool:
+        return len(self.keywords) >= self.max_keywords
+
+    def _append_tokens(self, text: str):
+        append = self._tokens.append
+        for raw in text.lower().split():
+            if len(raw) > self.max_token_chars:
+                append(BREAK)
+                continue
+            token = clean_token(raw)
+            if token:
+                append(token)
+
+    def _scan(self, final: bool):
+        tokens = self._tokens
+        stop = len(tokens) if final else len(tokens) - self._lookahead + 1
+        if stop > 0:
+            del tokens[:self.matcher.scan(tokens, self.keywords, stop)]
+
+    def feed(self, chunk: str):
+        if self.full:
+            return
+        text = self._partial + chunk if self._partial else chunk
+        if not text:
+            return
+        if text[-1].isspace():
+            head, partial = text, ""
+        else:
+            parts = text.rsplit(None, 1)
+            head, partial = ("", parts[0]) if len(parts) == 1 else parts
+        # Only the length of an over-long token matters, not its content
+        self._partial = partial[:self.max_token_chars + 1]
+        self._append_tokens(head)
+        self._scan(final=False)
+
+    def close(self) -> Set[str]:
+        if not self.full:
+            self._append_tokens(self._partial)
+            self._scan(final=True)
+        self._partial = ""
+        self._tokens.clear()
+        return self.keywords
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """
+    Returns the process-wide matcher compiled from the configured taxonomy.
+    """
+    return SkillMatcher(load_taxonomy(config.SKILL_TAXONOMY_PATH))
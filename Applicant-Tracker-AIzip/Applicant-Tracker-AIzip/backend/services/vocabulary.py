@@ -0,0 +1,235 @@
+import logging
+import mmap
+import os
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+
+from backend.core import config
+from backend.database.db import engine
+from backend.database.models import VocabularyTerm
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT when persisting new terms
+SAVE_BATCH_SIZE = 1000
+
+
+class KeywordSet:
+    """
+    A set of keywords as interned integer ids, stored as a sorted
+    array('I'): 4 bytes per keyword, independent of the vocabulary size.
+    """
+
+    __slots__ = ("ids",)
+
+    def __init__(self, ids: array):
+        self.ids = ids
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "KeywordSet":
+        return cls(array("I", sorted(set(ids))))
+
+    def probe(self) -> FrozenSet[int]:
+        """
+        Hash set of the ids, for testing many KeywordSets against this one
+        (see count_in). Built per request, never cached.
+        """
+        return frozenset(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+
+# Intersections probe a hash set with the other side's ids, which runs in
+# C. Merging or galloping over the two sorted arrays needs a Python-level
+# loop per id and measured several times slower.
+
+def count_in(probe: FrozenSet[int], keywords: KeywordSet) -> int:
+    """
+    How many of the keywords are in the probe set.
+    """
+    return len(probe.intersection(keywords.ids))
+
+
+def _smaller_first(a: KeywordSet, b: KeywordSet) -> Tuple[KeywordSet, KeywordSet]:
+    return (a, b) if len(a) <= len(b) else (b, a)
+
+
+def intersection(a: KeywordSet, b: KeywordSet) -> KeywordSet:
+    small, large = _smaller_first(a, b)
+    return KeywordSet.from_ids(small.probe().intersection(large.ids))
+
+
+def difference(a: KeywordSet, b: KeywordSet) -> KeywordSet:
+    exclude = b.probe()
+    return KeywordSet(array("I", (keyword_id for keyword_id in a.ids if keyword_id not in exclude)))
+
+
+def intersection_count(a: KeywordSet, b: KeywordSet) -> int:
+    small, large = _smaller_first(a, b)
+    return count_in(small.probe(), large)
+
+
+class Vocabulary:
+    """
+    Process-wide mapping between keywords and dense integer ids. Ids are
+    only meaningful inside one process; the keyword_vocabulary table keeps
+    known terms across restarts so the common ones get low, stable ids.
+
+    Terms are never evicted, so only a bounded set of terms is interned:
+    the taxonomy's canonical skills and terms persisted by earlier runs.
+    Everything else, resumes and the job index alike, uses known_set()
+    and never adds terms.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._persisted = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def intern(self, term: str) -> int:
+        keyword_id = self._ids.get(term)
+        if keyword_id is not None:
+            return keyword_id
+        with self._lock:
+            keyword_id = self._ids.get(term)
+            if keyword_id is None:
+                keyword_id = len(self._terms)
+                self._terms.append(term)
+                self._ids[term] = keyword_id
+        return keyword_id
+
+    def keyword_set(self, terms: Iterable[str]) -> KeywordSet:
+        return KeywordSet.from_ids(self.intern(term) for term in terms)
+
+    def lookup(self, term: str) -> Optional[int]:
+        return self._ids.get(term)
+
+    def known_set(self, terms: Iterable[str]) -> KeywordSet:
+        """
+        The interned terms among `terms`, without interning new ones. A
+        term the vocabulary doesn't know can't match any interned set.
+        """
+        ids = self._ids
+        return KeywordSet.from_ids(ids[term] for term in terms if term in ids)
+
+    def term(self, keyword_id: int) -> str:
+        return self._terms[keyword_id]
+
+    def terms(self, keyword_set: KeywordSet) -> List[str]:
+        return [self._terms[keyword_id] for keyword_id in keyword_set.ids]
+
+    def load(self, bind=None, snapshot: Optional[Path] = None):
+        """
+        Interns every persisted term, lowest database id first. Terms up to
+        the snapshot's last id come from the memory-mapped snapshot file;
+        only rows added after it are read from the table.
+        """
+        bind = bind or engine
+        last_id = self._load_snapshot(snapshot or config.VOCABULARY_SNAPSHOT)
+        from_snapshot = len(self._terms)
+        with bind.connect() as conn:
+            rows = conn.execute(
+                select(VocabularyTerm.term)
+                .where(VocabularyTerm.id > last_id)
+                .order_by(VocabularyTerm.id)
+            )
+            for (term,) in rows:
+                self.intern(term)
+        self._persisted = len(self._terms)
+        logger.info("Loaded %d vocabulary terms (%d from the snapshot)", self._persisted, from_snapshot)
+
+    def _load_snapshot(self, path: Path) -> int:
+        """
+        Interns the terms in a snapshot; returns the last table id it covers.
+        """
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header_end = data.find(b"\n")
+                last_id = int(data[:header_end])
+                terms = data[header_end + 1:].decode("utf-8").split("\n")
+        except (FileNotFoundError, ValueError):
+            # Missing, empty or unreadable: read everything from the table
+            return 0
+        for term in terms:
+            if term:
+                self.intern(term)
+        return last_id
+
+    def save(self, bind=None, snapshot: Optional[Path] = None):
+        """
+        Persists terms interned since the last load/save. Terms another
+        worker saved in the meantime are skipped. The snapshot is then
+        rewritten so the next start maps it instead of reading the table.
+        """
+        bind = bind or engine
+        snapshot = snapshot or config.VOCABULARY_SNAPSHOT
+        with self._lock:
+            new_terms = self._terms[self._persisted:]
+            self._persisted = len(self._terms)
+
+        for start in range(0, len(new_terms), SAVE_BATCH_SIZE):
+            try:
+                self._save_batch(bind, new_terms[start:start + SAVE_BATCH_SIZE])
+            except IntegrityError:
+                logger.info("Vocabulary batch raced with another worker; skipped")
+        if new_terms or not snapshot.exists():
+            write_snapshot(bind, snapshot)
+
+    def _save_batch(self, bind, batch: List[str]):
+        with bind.begin() as conn:
+            existing = set(conn.execute(
+                select(VocabularyTerm.term).where(VocabularyTerm.term.in_(batch))
+            ).scalars())
+            rows = [{"term": term} for term in batch if term not in existing]
+            if rows:
+                conn.execute(VocabularyTerm.__table__.insert(), rows)
+
+
+def write_snapshot(bind, path: Path):
+    """
+    Writes every persisted term to `path`: the last table id on the first
+    line, then one term per line in id order. Terms never contain a
+    newline; extraction splits on whitespace.
+    """
+    with bind.connect() as conn:
+        rows = conn.execute(select(VocabularyTerm.id, VocabularyTerm.term).order_by(VocabularyTerm.id)).all()
+    last_id = rows[-1].id if rows else 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Workers shutting down together each write their own temporary file
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+        f.write(f"{last_id}\n")
+        f.write("\n".join(row.term for row in rows))
+    os.replace(tmp, path)
+
+
+_vocabulary = Vocabulary()
+
+
+def get_vocabulary() -> Vocabulary:
+    return _vocabulary
+
+
+def load_vocabulary():
+    """
+    Loads persisted terms, then interns every canonical skill so the
+    terms most jobs share have ids from the start.
+    """
+    from backend.services.skill_taxonomy import get_skill_matcher
+
+    _vocabulary.load()
+    for term in get_skill_matcher().canonical_terms():
+        _vocabulary.intern(term)
@@ -0,0 +1,110 @@
+import csv
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Rows are buffered until roughly this many bytes before being yielded,
+# so the server doesn't issue one socket write per row.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _default(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encodes a value as compact JSON bytes, using orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def _buffered(parts: Iterable[bytes]) -> Iterator[bytes]:
+    buffer = bytearray()
+    for part in parts:
+        buffer += part
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def iter_json_array(rows: Iterable[Mapping]) -> Iterator[bytes]:
+    """
+    Encodes rows as a JSON array one row at a time.
+    """
+    def parts():
+        yield b"["
+        first = True
+        for row in rows:
+            if not first:
+                yield b","
+            first = False
+            yield dumps(dict(row))
+        yield b"]"
+
+    return _buffered(parts())
+
+
+def iter_ndjson(rows: Iterable[Mapping]) -> Iterator[bytes]:
+    """
+    Encodes rows as newline-delimited JSON, one object per line.
+    """
+    return _buffered(dumps(dict(row)) + b"\n" for row in rows)
+
+
+class _LineBuffer:
+    """Minimal file-like sink so csv.writer can emit one row at a time."""
+
+    def __init__(self):
+        self.value = ""
+
+    def write(self, text: str):
+        self.value += text
+
+    def pop(self) -> bytes:
+        value, self.value = self.value, ""
+        return value.encode("utf-8")
+
+
+def iter_csv(rows: Iterable[Mapping], fields: Sequence[str]) -> Iterator[bytes]:
+    """
+    Encodes rows as CSV with a header line, one row at a time.
+    """
+    sink = _LineBuffer()
+    writer = csv.writer(sink)
+
+    def parts():
+        writer.writerow(fields)
+        yield sink.pop()
+        for row in rows:
+            writer.writerow([_csv_value(row.get(field)) for field in fields])
+            yield sink.pop()
+
+    return _buffered(parts())
+
+
+# Spreadsheets evaluate cells starting with these as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        # A leading quote makes the cell plain text, e.g. a candidate
+        # signing up as =HYPERLINK(...)
+        return "'" + value
+    return value
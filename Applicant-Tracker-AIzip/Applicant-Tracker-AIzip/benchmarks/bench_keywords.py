@@ -0,0 +1,133 @@
+"""
+Compares keyword sets stored as set[str] against interned KeywordSets
+(sorted array('I')): memory per resume, pairwise intersections, and
+scoring one resume against a whole job index as the recommendations
+endpoint does.
+
+Run from the project directory:
+
+    python -m benchmarks.bench_keywords [--resumes 2000] [--vocabulary 50000]
+"""
+import argparse
+import random
+import string
+import time
+import tracemalloc
+
+from backend.services.ai_engine import extract_resume_keywords
+from backend.services.vocabulary import Vocabulary, count_in, intersection_count
+
+
+def random_terms(count: int, rng: random.Random):
+    return [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+        for _ in range(count)
+    ]
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    value = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, after - before
+
+
+def intersections_per_second(pairs, intersect, seconds: float = 1.0) -> float:
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for a, b in pairs:
+            intersect(a, b)
+        count += len(pairs)
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return count / elapsed
+
+
+def milliseconds_per_call(call, seconds: float = 1.0) -> float:
+    count = 0
+    start = time.perf_counter()
+    while True:
+        call()
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            return elapsed / count * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    parser.add_argument("--keywords", type=int, default=300, help="Keywords per resume")
+    parser.add_argument("--jd-keywords", type=int, default=60, help="Keywords per job")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    terms = random_terms(args.vocabulary, rng)
+    # Skewed draw: real resumes share a core of common terms
+    weights = [1.0 / (rank + 1) for rank in range(len(terms))]
+
+    def draw(k):
+        return set(rng.choices(terms, weights=weights, k=k))
+
+    resume_terms = [draw(args.keywords) for _ in range(args.resumes)]
+    jd_terms = [draw(args.jd_keywords) for _ in range(args.resumes)]
+
+    vocabulary = Vocabulary()
+    for term in terms:
+        vocabulary.intern(term)
+
+    # Copy strings so the set[str] measurement pays for its own strings,
+    # as it does when each request rebuilds them from text.
+    string_sets, string_bytes = measure_memory(
+        lambda: [{"".join(t) for t in s} for s in resume_terms]
+    )
+    id_sets, id_bytes = measure_memory(
+        lambda: [vocabulary.keyword_set(s) for s in resume_terms]
+    )
+    jd_id_sets = [vocabulary.keyword_set(s) for s in jd_terms]
+
+    n = args.resumes
+    print(f"resumes={n} vocabulary={len(vocabulary)} keywords/resume~{args.keywords}")
+    print(f"memory per resume  set[str]:    {string_bytes / n:10.0f} B")
+    print(f"memory per resume  array('I'):  {id_bytes / n:10.0f} B")
+
+    string_pairs = list(zip(string_sets, jd_terms))
+    id_pairs = list(zip(id_sets, jd_id_sets))
+    print(f"intersections/sec  set[str]:    {intersections_per_second(string_pairs, lambda a, b: len(a & b)):12.0f}")
+    print(f"intersections/sec  array('I'):  {intersections_per_second(id_pairs, intersection_count):12.0f}")
+
+    # One resume against every job, as recommendations score it: the
+    # resume is probed once per request, the jobs stay compact.
+    def score_strings():
+        resume = string_sets[0]
+        return [len(resume & job) for job in jd_terms]
+
+    def score_ids():
+        probe = id_sets[0].probe()
+        return [count_in(probe, job) for job in jd_id_sets]
+
+    print(f"score 1 vs {n} jobs set[str]:    {milliseconds_per_call(score_strings):8.2f} ms")
+    print(f"score 1 vs {n} jobs array('I'):  {milliseconds_per_call(score_ids):8.2f} ms")
+
+    # End to end per request: the resume is extracted from text first
+    resume_text = " ".join(resume_terms[0])
+
+    def request_strings():
+        resume = extract_resume_keywords(resume_text)
+        return [len(resume & job) for job in jd_terms]
+
+    def request_ids():
+        probe = vocabulary.known_set(extract_resume_keywords(resume_text)).probe()
+        return [count_in(probe, job) for job in jd_id_sets]
+
+    print(f"per request        set[str]:    {milliseconds_per_call(request_strings):8.2f} ms")
+    print(f"per request        array('I'):  {milliseconds_per_call(request_ids):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
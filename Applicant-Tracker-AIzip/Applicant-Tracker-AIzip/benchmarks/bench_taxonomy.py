@@ -0,0 +1,64 @@
+"""
+Keyword extraction from one large document with a large skill taxonomy,
+against extract_keywords (no taxonomy). Two-word phrases are drawn from
+the document's own words, so most tokens start some phrase: the worst
+case for the trie. "rare starts" uses phrases whose first word never
+appears in the document.
+
+Run from the project directory:
+
+    python -m benchmarks.bench_taxonomy [--phrases 50000] [--tokens 100000]
+"""
+import argparse
+import itertools
+import random
+import string
+import time
+
+from backend.services.skill_taxonomy import SkillMatcher
+from backend.utils.text_utils import extract_keywords
+
+
+def best_ms(extract, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--phrases", type=int, default=50000)
+    parser.add_argument("--tokens", type=int, default=100000)
+    parser.add_argument("--words", type=int, default=20000, help="Distinct words in the document")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(args.words)]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(args.words)))
+    text = " ".join(rng.choices(words, cum_weights=cum_weights, k=args.tokens))
+
+    common_starts = {
+        " ".join(rng.choices(words, cum_weights=cum_weights, k=2)): [] for _ in range(args.phrases)
+    }
+    rare_starts = {
+        f"zz{i} {rng.choice(words)}": [] for i in range(args.phrases)
+    }
+    matchers = {
+        "no taxonomy": SkillMatcher({}),
+        f"{len(rare_starts)} phrases, rare starts": SkillMatcher(rare_starts),
+        f"{len(common_starts)} phrases, common starts": SkillMatcher(common_starts),
+    }
+
+    print(f"{args.tokens} tokens per document, best of {args.repeat}")
+    print(f"{'extract_keywords (baseline)':40s} {best_ms(extract_keywords, text, args.repeat):8.1f} ms")
+    for name, matcher in matchers.items():
+        print(f"{'SkillMatcher, ' + name:40s} {best_ms(matcher.extract, text, args.repeat):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import itertools
+import os
+import tempfile
+
+# Configuration is read at import time, so the test environment is set up
+# before anything from backend is imported.
+_data_dir = tempfile.mkdtemp(prefix="ats-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_data_dir}/primary.db"
+os.environ["ATS_DATA_DIR"] = _data_dir
+os.environ["ATS_RATE_LIMIT_ENABLED"] = "false"
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import create_app
+from backend.database.db import Base, init_db
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    """
+    An empty database in its own SQLite file, with every table created.
+    """
+    from backend.database import models  # noqa: F401  (registers the models)
+
+    engine = create_engine(f"sqlite:///{tmp_path}/test.db", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(sqlite_engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=sqlite_engine)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    The application on the primary test database, lifespan included.
+    """
+    init_db()
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+_user_numbers = itertools.count(1)
+
+
+@pytest.fixture
+def signup(client):
+    """
+    Creates a user and returns Authorization headers for it.
+    """
+    def create(role: str):
+        # The database outlives each test, so emails are unique per session
+        email = f"{role}-{os.getpid()}-{next(_user_numbers)}@example.com"
+        response = client.post("/auth/signup", json={"email": email, "password": "pw", "role": role})
+        assert response.status_code == 200, response.text
+        token = client.post("/auth/login", json={"email": email, "password": "pw"}).json()["access_token"]
+        return {"Authorization": f"Bearer {token}"}
+
+    return create
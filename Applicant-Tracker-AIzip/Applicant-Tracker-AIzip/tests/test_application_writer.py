@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.database.models import Application, IdempotencyKey, JobDescription, MatchResult, User
+from backend.services import application_writer
+from backend.services.application_writer import ApplicationWrite, ApplicationWriter, write_applications
+
+
+@pytest.fixture
+def people(session_factory):
+    """
+    A recruiter's two jobs and three candidates; returns (job ids, candidate ids).
+    """
+    with session_factory() as db:
+        recruiter = User(email="recruiter@example.com", password_hash="x", role="recruiter")
+        candidates = [User(email=f"c{i}@example.com", password_hash="x", role="candidate") for i in range(3)]
+        db.add_all([recruiter, *candidates])
+        db.flush()
+        jobs = [JobDescription(recruiter_id=recruiter.id, title=f"Job {i}", description="python") for i in range(2)]
+        db.add_all(jobs)
+        db.commit()
+        return [job.id for job in jobs], [candidate.id for candidate in candidates]
+
+
+def count(session_factory, model):
+    with session_factory() as db:
+        return db.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def test_duplicate_pairs_in_one_batch_create_one_application(session_factory, people):
+    (job, _), (alice, bob, _) = people
+    writes = [
+        ApplicationWrite(job_id=job, candidate_id=alice, match={"resume_id": 1, "score": 50.0, "missing_keywords": ""}),
+        ApplicationWrite(job_id=job, candidate_id=alice, match={"resume_id": 1, "score": 50.0, "missing_keywords": ""}),
+        ApplicationWrite(job_id=job, candidate_id=bob),
+    ]
+    with session_factory() as db:
+        results = write_applications(db, writes)
+
+    assert [r.created for r in results] == [True, False, True]
+    assert results[0].application["id"] == results[1].application["id"]
+    assert count(session_factory, Application) == 2
+    assert count(session_factory, MatchResult) == 1
+
+
+def test_existing_application_is_not_created_again(session_factory, people):
+    (job, _), (alice, _, _) = people
+    with session_factory() as db:
+        first = write_applications(db, [ApplicationWrite(job_id=job, candidate_id=alice)])[0]
+    with session_factory() as db:
+        again = write_applications(db, [ApplicationWrite(job_id=job, candidate_id=alice)])[0]
+    assert (first.created, again.created) == (True, False)
+    assert again.application["id"] == first.application["id"]
+
+
+def test_repeated_idempotency_key_in_one_batch_is_stored_once(session_factory, people):
+    (job, other_job), (alice, _, _) = people
+    writes = [
+        ApplicationWrite(job_id=job, candidate_id=alice, idempotency_key="k", request_hash="h1"),
+        ApplicationWrite(job_id=other_job, candidate_id=alice, idempotency_key="k", request_hash="h2"),
+    ]
+    with session_factory() as db:
+        results = write_applications(db, writes)
+        key = db.execute(select(IdempotencyKey)).scalar_one()
+
+    # The first write keeps the key
+    assert (key.resource_id, key.request_hash) == (results[0].application["id"], "h1")
+
+
+def test_group_commit_batches_concurrent_writes(session_factory, people):
+    jobs, candidates = people
+    writer = ApplicationWriter(window_seconds=0.05, max_batch=100, session_factory=session_factory)
+    results = []
+    lock = threading.Lock()
+
+    def apply(job_id, candidate_id):
+        result = writer.submit(ApplicationWrite(job_id=job_id, candidate_id=candidate_id))
+        with lock:
+            results.append(((job_id, candidate_id), result.created))
+
+    # Every pair is submitted twice; exactly one of each is created
+    pairs = [(job, candidate) for job in jobs for candidate in candidates] * 2
+    threads = [threading.Thread(target=apply, args=pair) for pair in pairs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.stop(timeout=5)
+
+    created = [pair for pair, was_created in results if was_created]
+    assert sorted(created) == sorted(set(pairs))
+    assert count(session_factory, Application) == len(set(pairs))
+
+
+def test_failed_batch_is_retried_one_write_at_a_time(session_factory, people, monkeypatch):
+    (job, _), (alice, bob, carol) = people
+    real_write = application_writer.write_applications
+
+    def write_failing_for_bob(db, writes):
+        if any(w.candidate_id == bob for w in writes):
+            raise RuntimeError("constraint violated")
+        return real_write(db, writes)
+
+    monkeypatch.setattr(application_writer, "write_applications", write_failing_for_bob)
+    writer = ApplicationWriter(window_seconds=0.1, max_batch=100, session_factory=session_factory)
+    outcomes = {}
+
+    def apply(candidate_id):
+        try:
+            outcomes[candidate_id] = writer.submit(ApplicationWrite(job_id=job, candidate_id=candidate_id)).created
+        except RuntimeError as exc:
+            outcomes[candidate_id] = str(exc)
+
+    threads = [threading.Thread(target=apply, args=(c,)) for c in (alice, bob, carol)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.stop(timeout=5)
+
+    assert outcomes == {alice: True, bob: "constraint violated", carol: True}
+    assert count(session_factory, Application) == 2
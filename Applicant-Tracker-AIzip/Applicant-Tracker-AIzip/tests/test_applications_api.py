@@ -0,0 +1,33 @@
+import pytest
+
+
+@pytest.fixture
+def jobs(client, signup):
+    recruiter = signup("recruiter")
+    return [
+        client.post("/jobs/", json={"title": title, "description": "python sql"}, headers=recruiter).json()["id"]
+        for title in ("Backend", "Data")
+    ]
+
+
+def test_apply_once(client, signup, jobs):
+    candidate = signup("candidate")
+    first = client.post("/applications/", json={"job_id": jobs[0]}, headers=candidate)
+    again = client.post("/applications/", json={"job_id": jobs[0]}, headers=candidate)
+    assert first.status_code == 200
+    assert again.status_code == 400
+
+
+def test_idempotent_retry_returns_the_original_application(client, signup, jobs):
+    headers = {**signup("candidate"), "Idempotency-Key": "retry-1"}
+    first = client.post("/applications/", json={"job_id": jobs[0]}, headers=headers)
+    retry = client.post("/applications/", json={"job_id": jobs[0]}, headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+
+
+def test_idempotency_key_reused_for_another_body_is_rejected(client, signup, jobs):
+    headers = {**signup("candidate"), "Idempotency-Key": "reused"}
+    assert client.post("/applications/", json={"job_id": jobs[0]}, headers=headers).status_code == 200
+    response = client.post("/applications/", json={"job_id": jobs[1]}, headers=headers)
+    assert response.status_code == 422
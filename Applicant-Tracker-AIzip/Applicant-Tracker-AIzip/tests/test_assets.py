@@ -0,0 +1,105 @@
+import gzip
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from backend.core.assets import Asset, AssetManifest, PrecompressedStaticFiles, _choose_encoding
+
+SCRIPT = "function hello() { return 'hello'; }\n" * 50
+
+ALL_VARIANTS = Asset("app.js", "app.0.js", "application/javascript", '"0"',
+                     {"identity": b"x", "gzip": b"g", "br": b"b"})
+GZIP_ONLY = Asset("app.js", "app.0.js", "application/javascript", '"0"',
+                  {"identity": b"x", "gzip": b"g"})
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("", "identity"),
+    ("gzip, deflate, br", "br"),
+    ("gzip", "gzip"),
+    ("GZIP ; Q=1", "gzip"),
+    ("br;q=0, gzip", "gzip"),
+    ("br;q=0.0, gzip;q=0.00", "identity"),
+    ("br;q=0.000, gzip;q=0.5", "gzip"),
+    ("*", "br"),
+    ("*;q=0, gzip", "gzip"),
+    ("br;q=invalid", "identity"),
+])
+def test_encoding_negotiation(header, expected):
+    assert _choose_encoding(ALL_VARIANTS, header) == expected
+
+
+def test_only_encodings_the_asset_has_are_chosen():
+    assert _choose_encoding(GZIP_ONLY, "br") == "identity"
+    assert _choose_encoding(GZIP_ONLY, "br, gzip") == "gzip"
+
+
+@pytest.fixture
+def frontend(tmp_path):
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "app.js").write_text(SCRIPT)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" + bytes(range(256)))
+    (tmp_path / "index.html").write_text('<script src="/static/js/app.js"></script>')
+    manifest = AssetManifest(tmp_path)
+    app = Starlette(routes=[Mount("/static", PrecompressedStaticFiles(manifest, max_age=600))])
+    return manifest, TestClient(app)
+
+
+def test_assets_are_fingerprinted_and_pages_rewritten(frontend, tmp_path):
+    manifest, client = frontend
+    url = manifest.url_for("js/app.js")
+    assert url.startswith("/static/js/app.") and url.endswith(".js") and url != "/static/js/app.js"
+
+    page = client.get("/static/index.html").text
+    assert f'src="{url}"' in page
+
+    # Changing the content changes the name
+    (tmp_path / "js" / "app.js").write_text(SCRIPT + "// v2\n")
+    assert AssetManifest(tmp_path).url_for("js/app.js") != url
+
+
+def test_hashed_names_are_immutable_and_plain_names_revalidate(frontend):
+    manifest, client = frontend
+    hashed = client.get(manifest.url_for("js/app.js"))
+    plain = client.get("/static/js/app.js")
+    assert hashed.headers["cache-control"] == "public, max-age=600, immutable"
+    assert plain.headers["cache-control"] == "no-cache"
+    assert hashed.headers["etag"] == plain.headers["etag"]
+    assert hashed.headers["vary"] == "Accept-Encoding"
+
+
+def test_matching_etag_gets_304(frontend):
+    _, client = frontend
+    etag = client.get("/static/js/app.js").headers["etag"]
+    response = client.get("/static/js/app.js", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert client.get("/static/js/app.js", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_compressed_variant_is_served_when_accepted(frontend):
+    _, client = frontend
+    response = client.get("/static/js/app.js", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == SCRIPT
+    raw = client.get("/static/js/app.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert raw.text == SCRIPT
+
+
+def test_binary_assets_are_not_compressed(frontend):
+    manifest, _ = frontend
+    asset, _ = manifest.lookup("logo.png")
+    assert set(asset.variants) == {"identity"}
+    assert gzip.decompress(manifest.lookup("js/app.js")[0].variants["gzip"]).decode() == SCRIPT
+
+
+def test_head_and_unknown_paths(frontend):
+    _, client = frontend
+    head = client.head("/static/js/app.js", headers={"Accept-Encoding": "identity"})
+    assert head.content == b""
+    assert int(head.headers["content-length"]) == len(SCRIPT)
+    assert client.get("/static/missing.js").status_code == 404
+    assert client.post("/static/js/app.js").status_code == 405
@@ -0,0 +1,173 @@
+import os
+import time
+
+import pytest
+
+from backend import coordination
+from sqlalchemy import func, insert, select
+
+from backend.coordination.broadcast import EVENT_RETENTION_SECONDS, DatabaseBroadcaster, LocalBroadcaster
+from backend.coordination import cache as cache_module
+from backend.coordination.cache import FileCache, MemoryCache
+from backend.database.models import CoordinationEvent
+from backend.services.retention import compact
+
+
+@pytest.fixture(params=["memory", "file"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache()
+    return FileCache(tmp_path / "cache")
+
+
+def test_cache_round_trip(cache):
+    assert cache.get("missing") is None
+    cache.set("k", {"scores": [1.5, 2.0]})
+    assert cache.get("k") == {"scores": [1.5, 2.0]}
+    cache.delete("k")
+    assert cache.get("k") is None
+
+
+def test_cache_entries_expire(cache):
+    cache.set("short", 1, ttl=0.01)
+    cache.set("long", 2, ttl=60)
+    time.sleep(0.05)
+    assert (cache.get("short"), cache.get("long")) == (None, 2)
+
+
+def test_expired_entries_are_swept_on_a_later_write(cache, monkeypatch):
+    monkeypatch.setattr(cache_module, "SWEEP_SECONDS", 0)
+    for i in range(5):
+        cache.set(f"one-off:{i}", i, ttl=0.01)
+    cache.set("kept", "v")
+    time.sleep(0.05)
+    cache.set("trigger", "v")
+    if isinstance(cache, MemoryCache):
+        assert len(cache) == 2
+    else:
+        assert len(list(cache.directory.glob("*.entry"))) == 2
+    assert cache.get("kept") == "v"
+
+
+def test_cache_clear(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+    assert (cache.get("a"), cache.get("b")) == (None, None)
+
+
+def test_file_cache_is_shared_through_the_directory(tmp_path):
+    FileCache(tmp_path / "cache").set("k", "v")
+    assert FileCache(tmp_path / "cache").get("k") == "v"
+
+
+def test_file_cache_refuses_a_directory_others_can_write(tmp_path):
+    directory = tmp_path / "shared"
+    directory.mkdir()
+    os.chmod(directory, 0o777)
+    with pytest.raises(RuntimeError, match="0700"):
+        FileCache(directory)
+
+
+def test_file_cache_refuses_a_symlink(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir(mode=0o700)
+    link = tmp_path / "link"
+    link.symlink_to(target)
+    with pytest.raises(RuntimeError, match="symlink"):
+        FileCache(link)
+
+
+def test_local_broadcast_reaches_subscribers():
+    broadcaster = LocalBroadcaster()
+    received = []
+    broadcaster.subscribe("jobs", received.append)
+    broadcaster.subscribe("other", lambda message: received.append(("other", message)))
+    broadcaster.publish("jobs", {"id": 1})
+    assert received == [{"id": 1}]
+
+
+def test_failing_subscriber_does_not_stop_delivery():
+    broadcaster = LocalBroadcaster()
+    received = []
+    broadcaster.subscribe("jobs", lambda message: 1 / 0)
+    broadcaster.subscribe("jobs", received.append)
+    broadcaster.publish("jobs", "hello")
+    assert received == ["hello"]
+
+
+def test_database_broadcast_reaches_every_instance(sqlite_engine):
+    first, second = DatabaseBroadcaster(sqlite_engine), DatabaseBroadcaster(sqlite_engine)
+    first.publish("jobs", "before start")
+    received = {"first": [], "second": []}
+    first.subscribe("jobs", received["first"].append)
+    second.subscribe("jobs", received["second"].append)
+    # The first poll only records where the log currently ends
+    first.poll()
+    second.poll()
+
+    first.publish("jobs", {"id": 1})
+    second.publish("jobs", {"id": 2})
+    first.poll()
+    second.poll()
+    second.poll()
+
+    assert received["first"] == received["second"] == [{"id": 1}, {"id": 2}]
+
+
+def event(event_id, message, created_at=None):
+    return insert(CoordinationEvent).values(
+        id=event_id, channel="jobs", message=f'"{message}"', created_at=created_at or time.time(),
+    )
+
+
+def test_event_committed_after_a_higher_id_is_delivered(sqlite_engine):
+    broadcaster = DatabaseBroadcaster(sqlite_engine)
+    received = []
+    broadcaster.subscribe("jobs", received.append)
+    broadcaster.poll()
+    with sqlite_engine.begin() as conn:
+        conn.execute(event(1, "first"))
+        conn.execute(event(3, "third"))
+    broadcaster.poll()
+    # Id 2 was assigned first but committed last
+    with sqlite_engine.begin() as conn:
+        conn.execute(event(2, "second"))
+    broadcaster.poll()
+    broadcaster.poll()
+    assert received == ["first", "third", "second"]
+
+
+def test_idle_poll_does_not_delete_events(sqlite_engine):
+    broadcaster = DatabaseBroadcaster(sqlite_engine)
+    broadcaster.poll()
+    with sqlite_engine.begin() as conn:
+        conn.execute(event(1, "old", created_at=time.time() - EVENT_RETENTION_SECONDS - 60))
+        conn.execute(event(2, "new"))
+    broadcaster.poll()
+    broadcaster.poll()
+    with sqlite_engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(CoordinationEvent)).scalar_one() == 2
+
+    assert compact(bind=sqlite_engine).coordination_events_pruned == 1
+    with sqlite_engine.connect() as conn:
+        assert conn.execute(select(CoordinationEvent.id)).scalars().all() == [2]
+
+
+@pytest.fixture
+def local_coordination():
+    previous = coordination.get_cache(), coordination.get_broadcaster()
+    cache, broadcaster = MemoryCache(), LocalBroadcaster()
+    coordination.configure(cache=cache, broadcaster=broadcaster)
+    yield cache, broadcaster
+    coordination.configure(cache=previous[0], broadcaster=previous[1])
+
+
+def test_invalidate_notifies_subscribers(local_coordination):
+    cache, _ = local_coordination
+    dropped = []
+    coordination.on_invalidate(dropped.append)
+    cache.set("recommendations:1", "scores")
+    coordination.invalidate("recommendations:1")
+    assert cache.get("recommendations:1") is None
+    assert dropped == ["recommendations:1"]
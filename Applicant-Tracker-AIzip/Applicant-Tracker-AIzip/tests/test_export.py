@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from backend.utils.serialization import iter_csv
+
+
+@pytest.fixture
+def job_with_applicants(client, signup):
+    recruiter = signup("recruiter")
+    job_id = client.post("/jobs/", json={"title": "Backend", "description": "python sql"},
+                         headers=recruiter).json()["id"]
+    for content in ("python", None):
+        candidate = signup("candidate")
+        if content:
+            resume_id = client.post("/resumes/", json={"content": content}, headers=candidate).json()["id"]
+            client.post("/match/", json={"resume_id": resume_id, "job_id": job_id}, headers=candidate)
+        client.post("/applications/", json={"job_id": job_id}, headers=candidate)
+    return recruiter, job_id
+
+
+def test_csv_export(client, job_with_applicants):
+    recruiter, job_id = job_with_applicants
+    response = client.get(f"/applications/job/{job_id}/export", headers=recruiter)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == f'attachment; filename="job-{job_id}-applicants.csv"'
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert list(rows[0]) == ["id", "candidate_email", "status", "match_score", "missing_skills", "created_at"]
+    assert [(row["match_score"], row["missing_skills"]) for row in rows] == [("50.0", "sql"), ("", "")]
+
+
+def test_ndjson_export_matches_the_listing(client, job_with_applicants):
+    recruiter, job_id = job_with_applicants
+    response = client.get(f"/applications/job/{job_id}/export?format=ndjson", headers=recruiter)
+    assert response.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    listing = client.get(f"/applications/job/{job_id}", headers=recruiter).json()
+    assert [(row["id"], row["match_score"]) for row in exported] == [
+        (row["id"], row["match_score"]) for row in listing
+    ]
+
+
+def test_export_rejects_unknown_formats_and_other_recruiters(client, signup, job_with_applicants):
+    recruiter, job_id = job_with_applicants
+    assert client.get(f"/applications/job/{job_id}/export?format=xlsx", headers=recruiter).status_code == 400
+    assert client.get(f"/applications/job/{job_id}/export", headers=signup("recruiter")).status_code == 403
+
+
+@pytest.mark.parametrize("value", ["=HYPERLINK(\"x\")", "+1", "-1+2", "@SUM(A1)", "\tx", "\rx"])
+def test_csv_neutralises_formulas(value):
+    body = b"".join(iter_csv([{"email": value}], ["email"])).decode()
+    assert list(csv.reader(io.StringIO(body)))[1] == ["'" + value]
+
+
+def test_csv_leaves_plain_values_alone():
+    row = {"email": "a@example.com", "score": 12.5, "missing": None, "at": datetime(2024, 1, 2)}
+    body = b"".join(iter_csv([row], list(row))).decode()
+    assert list(csv.reader(io.StringIO(body)))[1] == ["a@example.com", "12.5", "", "2024-01-02T00:00:00"]
@@ -0,0 +1,42 @@
+import pytest
+
+from backend.core import config
+from backend.services.skill_taxonomy import get_skill_matcher
+
+TEXTS = [
+    "Senior engineer: Python, FastAPI and machine learning on k8s (AWS).",
+    "Built .NET services and C# tooling; some C++ and node.js.\n\nNet income grew.",
+    "machine\nlearning   engineer\twith ML, Machine Learning and deep learning",
+    "word " * 50 + "x" * (config.MAX_TOKEN_CHARS + 10) + " learning machine learning",
+    "",
+    "   ",
+]
+
+
+def chunks(text, size):
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_chunked_extraction_matches_one_shot(text, size):
+    matcher = get_skill_matcher()
+    assert matcher.extract_chunks(chunks(text, size)) == matcher.extract_chunks([text])
+
+
+def test_extract_uses_windows(monkeypatch):
+    text = TEXTS[0] * 20
+    matcher = get_skill_matcher()
+    expected = matcher.extract_chunks([text])
+    monkeypatch.setattr(config, "EXTRACTION_WINDOW_CHARS", 5)
+    assert matcher.extract(text) == expected
+
+
+def test_skills_are_normalized():
+    keywords = get_skill_matcher().extract(TEXTS[0])
+    assert {"python", "fastapi", "machine learning", "kubernetes"} <= keywords
+
+
+def test_over_long_tokens_are_dropped():
+    text = "x" * (config.MAX_TOKEN_CHARS + 1) + " python"
+    assert get_skill_matcher().extract(text) == {"python"}
@@ -0,0 +1,82 @@
+import time
+
+from backend.core import config
+from backend.database.models import JobDescription, MatchResult, Resume, User
+from backend.services.batch_scoring import _id_chunks, score_chunk
+
+
+def wait_for_run(client, job_id, headers, timeout=60):
+    deadline = time.monotonic() + timeout
+    while True:
+        run = client.get(f"/jobs/{job_id}/scoring", headers=headers).json()
+        if run["status"] in ("completed", "failed") or time.monotonic() > deadline:
+            return run
+        time.sleep(0.1)
+
+
+def test_scoring_run_scores_every_resume(client, signup, monkeypatch):
+    monkeypatch.setattr(config, "SCORING_CHUNK_SIZE", 2)
+    recruiter = signup("recruiter")
+    job_id = client.post("/jobs/", json={"title": "Backend", "description": "python sql docker"},
+                         headers=recruiter).json()["id"]
+    assert client.get(f"/jobs/{job_id}/scoring", headers=recruiter).status_code == 404
+
+    for content in ("python", "python sql", "python sql docker"):
+        client.post("/resumes/", json={"content": content}, headers=signup("candidate"))
+
+    started = client.post(f"/jobs/{job_id}/scoring", headers=recruiter)
+    assert started.status_code == 200
+    assert started.json()["status"] == "pending"
+
+    run = wait_for_run(client, job_id, recruiter)
+    assert run["status"] == "completed", run
+    assert run["processed"] == run["total"] >= 3
+    assert run["finished_at"] is not None
+
+    scores = [row["score"] for row in client.get(f"/match/job/{job_id}", headers=recruiter).json()]
+    assert {100.0, 66.67, 33.33} <= set(scores)
+
+    # A second run has nothing left to score
+    client.post(f"/jobs/{job_id}/scoring", headers=recruiter)
+    again = wait_for_run(client, job_id, recruiter)
+    assert (again["status"], again["total"]) == ("completed", 0)
+
+
+def test_scoring_status_is_only_visible_to_the_owner(client, signup):
+    recruiter = signup("recruiter")
+    job_id = client.post("/jobs/", json={"title": "Data", "description": "sql"}, headers=recruiter).json()["id"]
+    other = signup("recruiter")
+    assert client.post(f"/jobs/{job_id}/scoring", headers=other).status_code == 403
+    assert client.get(f"/jobs/{job_id}/scoring", headers=other).status_code == 403
+
+
+def test_chunks_skip_resumes_already_scored(session_factory):
+    with session_factory() as db:
+        recruiter = User(email="r@example.com", password_hash="x", role="recruiter")
+        db.add(recruiter)
+        db.commit()
+        job = JobDescription(recruiter_id=recruiter.id, title="Job", description="python")
+        db.add(job)
+        resumes = []
+        for i in range(5):
+            user = User(email=f"c{i}@example.com", password_hash="x", role="candidate")
+            db.add(user)
+            db.flush()
+            resume = Resume(user_id=user.id, content="python")
+            db.add(resume)
+            resumes.append(resume)
+        db.commit()
+        db.add(MatchResult(resume_id=resumes[1].id, job_id=job.id, score=1.0, missing_keywords=""))
+        db.commit()
+
+        chunks = list(_id_chunks(db, job.id, 2))
+        expected = [r.id for r in resumes if r is not resumes[1]]
+    assert chunks == [expected[:2], expected[2:]]
+
+
+def test_score_chunk_returns_rows_for_a_bulk_insert():
+    rows = score_chunk(7, "python sql", [(1, "python"), (2, "")])
+    assert [(r["resume_id"], r["job_id"], r["score"], r["missing_keywords"]) for r in rows] == [
+        (1, 7, 50.0, "sql"),
+        (2, 7, 0.0, "python, sql"),
+    ]
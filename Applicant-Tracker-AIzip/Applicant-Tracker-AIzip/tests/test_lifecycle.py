@@ -0,0 +1,89 @@
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+
+from backend import app as app_module
+from backend import server
+from backend.core import config
+from backend.core.lifecycle import Deadline, InFlightTracker
+
+
+def test_drain_waits_for_tracked_work():
+    tracker = InFlightTracker()
+    started, release = threading.Event(), threading.Event()
+
+    def work():
+        with tracker.track():
+            started.set()
+            release.wait()
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    started.wait()
+    assert tracker.count == 1
+    threading.Timer(0.05, release.set).start()
+    assert tracker.drain(timeout=5)
+    assert tracker.count == 0
+    thread.join()
+
+
+def test_drain_gives_up_at_the_timeout():
+    tracker = InFlightTracker()
+    with tracker.track():
+        start = time.monotonic()
+        assert not tracker.drain(timeout=0.05)
+        assert time.monotonic() - start < 1
+    assert tracker.drain(timeout=0)
+
+
+def test_deadline_never_goes_negative():
+    deadline = Deadline(0.01)
+    time.sleep(0.02)
+    assert deadline.remaining() == 0.0
+
+
+def test_shutdown_steps_share_one_timeout(monkeypatch):
+    timeouts = []
+
+    def step(timeout=None):
+        timeouts.append(timeout)
+        time.sleep(0.1)
+        return True
+
+    for name in ("init_db", "load_vocabulary", "start_compaction", "shutdown_pools"):
+        monkeypatch.setattr(app_module, name, lambda: None)
+    monkeypatch.setattr(app_module.coordination, "start", lambda worker_threads: None)
+    monkeypatch.setattr(app_module, "get_vocabulary", lambda: SimpleNamespace(save=lambda: None))
+    for name in ("stop_compaction", "stop_application_writer"):
+        monkeypatch.setattr(app_module, name, step)
+    monkeypatch.setattr(app_module.coordination, "stop", step)
+    monkeypatch.setattr(app_module.inflight_matches, "drain", step)
+    monkeypatch.setattr(config, "GRACEFUL_SHUTDOWN_SECONDS", 1)
+
+    async def run():
+        async with app_module.lifespan(FastAPI()):
+            pass
+
+    asyncio.run(run())
+    assert len(timeouts) == 4
+    assert timeouts == sorted(timeouts, reverse=True)
+    assert timeouts[0] <= 1
+    assert timeouts[-1] <= 1 - 0.3
+
+
+def test_run_passes_the_graceful_timeout_to_workers(monkeypatch):
+    captured = {}
+    monkeypatch.setattr(server, "init_db", lambda: None)
+    monkeypatch.setattr(server.uvicorn, "run", lambda *args, **kwargs: captured.update(kwargs))
+    monkeypatch.setattr(config, "GRACEFUL_SHUTDOWN_SECONDS", config.GRACEFUL_SHUTDOWN_SECONDS)
+    monkeypatch.setenv("ATS_GRACEFUL_SHUTDOWN_SECONDS", "30")
+    monkeypatch.setenv("ATS_SERVER_WORKERS", "1")
+
+    server.run(["--workers", "2", "--graceful-timeout", "7"])
+    assert captured["timeout_graceful_shutdown"] == 7
+    assert os.environ["ATS_GRACEFUL_SHUTDOWN_SECONDS"] == "7"
+    assert config.GRACEFUL_SHUTDOWN_SECONDS == 7
@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import event, select
+
+from backend.coordination import queue as work_queue
+from backend.coordination.queue import DatabaseWorkQueue, MemoryWorkQueue
+from backend.coordination.worker import QueueWorker, register_handler
+from backend.database.models import WorkItem
+
+
+@pytest.fixture(params=["memory", "database"])
+def queue(request, sqlite_engine, monkeypatch):
+    # Failed tasks become visible again immediately
+    monkeypatch.setattr(work_queue, "RETRY_BACKOFF_SECONDS", 0)
+    if request.param == "memory":
+        return MemoryWorkQueue()
+    return DatabaseWorkQueue(sqlite_engine)
+
+
+def test_lease_complete(queue):
+    task_id = queue.enqueue("test.lease", {"n": 1})
+    task = queue.lease("w1", lease_seconds=30)
+    assert (task.id, task.payload, task.attempts) == (task_id, {"n": 1}, 1)
+    # Held by w1 until the lease expires
+    assert queue.lease("w2", lease_seconds=30) is None
+    queue.complete(task)
+    assert queue.pending_count() == 0
+
+
+def test_lease_filters_kinds(queue):
+    queue.enqueue("test.other", {})
+    assert queue.lease("w1", 30, kinds=["test.lease"]) is None
+    assert queue.lease("w1", 30, kinds=["test.other"]) is not None
+
+
+def test_failed_task_is_retried_then_dead(queue):
+    queue.enqueue("test.retry", {}, max_attempts=2)
+    first = queue.lease("w1", 30)
+    assert queue.fail(first, "boom") is True
+    second = queue.lease("w1", 30)
+    assert second.attempts == 2
+    assert queue.fail(second, "boom") is False
+    assert queue.lease("w1", 30) is None
+    assert queue.pending_count() == 0
+
+
+def test_expired_lease_is_leased_again(queue):
+    queue.enqueue("test.expire", {}, max_attempts=2)
+    assert queue.lease("w1", lease_seconds=0.01).attempts == 1
+    time.sleep(0.05)
+    assert queue.lease("w2", lease_seconds=30).attempts == 2
+
+
+def test_expired_final_lease_is_dead_lettered(queue):
+    queue.enqueue("test.expire", {}, max_attempts=1)
+    queue.lease("w1", lease_seconds=0.01)
+    time.sleep(0.05)
+    assert queue.lease("w2", lease_seconds=30) is None
+    assert queue.pending_count() == 0
+
+
+def test_concurrent_workers_never_share_a_task(queue):
+    for n in range(50):
+        queue.enqueue("test.race", {"n": n})
+    leased = []
+    lock = threading.Lock()
+
+    def drain(worker_id):
+        while True:
+            task = queue.lease(worker_id, 30)
+            if task is None:
+                return
+            with lock:
+                leased.append(task.payload["n"])
+
+    threads = [threading.Thread(target=drain, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(leased) == list(range(50))
+
+
+def test_idle_database_poll_does_not_write(sqlite_engine):
+    queue = DatabaseWorkQueue(sqlite_engine)
+    statements = []
+    event.listen(sqlite_engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement.split()[0]))
+    assert queue.lease("w1", 30) is None
+    assert statements == ["SELECT"]
+
+
+def test_dead_letter_records_the_error(sqlite_engine):
+    queue = DatabaseWorkQueue(sqlite_engine)
+    queue.enqueue("test.expire", {}, max_attempts=1)
+    queue.lease("w1", lease_seconds=0.01)
+    time.sleep(0.05)
+    queue.lease("w2", 30)
+    with sqlite_engine.connect() as conn:
+        row = conn.execute(select(WorkItem.status, WorkItem.last_error)).one()
+    assert tuple(row) == ("dead", "Lease expired")
+
+
+def test_worker_retries_and_reports_final_failure(queue):
+    calls = []
+    failures = []
+
+    @register_handler("test.flaky", on_failure=lambda payload, error: failures.append((payload, error)))
+    def flaky(payload):
+        calls.append(payload["n"])
+        raise ValueError("no luck")
+
+    queue.enqueue("test.flaky", {"n": 7}, max_attempts=3)
+    worker = QueueWorker(queue, threads=1, lease_seconds=30, poll_seconds=0.01)
+    while worker.run_once("w1"):
+        pass
+    assert calls == [7, 7, 7]
+    assert failures == [({"n": 7}, "no luck")]
+
+
+def test_worker_completes_successful_task(queue):
+    done = []
+    register_handler("test.ok")(lambda payload: done.append(payload["n"]))
+    queue.enqueue("test.ok", {"n": 1})
+    worker = QueueWorker(queue, threads=1, lease_seconds=30, poll_seconds=0.01)
+    assert worker.run_once("w1") is True
+    assert worker.run_once("w1") is False
+    assert done == [1]
+    assert queue.pending_count() == 0
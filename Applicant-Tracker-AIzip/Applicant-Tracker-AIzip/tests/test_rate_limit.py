@@ -0,0 +1,79 @@
+import pytest
+from sqlalchemy import func, select
+
+from backend.core.rate_limit import (
+    SWEEP_SECONDS,
+    ConcurrencyLimiter,
+    DatabaseRateLimitBackend,
+    MemoryRateLimitBackend,
+    parse_rate,
+    prune_full_buckets,
+)
+from backend.database.models import RateLimitBucket
+
+RATE = parse_rate("3/minute")
+
+
+@pytest.fixture(params=["memory", "database"])
+def backend(request, sqlite_engine):
+    if request.param == "memory":
+        return MemoryRateLimitBackend()
+    return DatabaseRateLimitBackend(sqlite_engine)
+
+
+def test_parse_rate():
+    assert parse_rate("30/minute").refill_per_second == 0.5
+    assert parse_rate("10 / seconds").period_seconds == 1
+    with pytest.raises(ValueError):
+        parse_rate("10/fortnight")
+
+
+def test_bucket_admits_capacity_then_waits(backend):
+    now = 1000.0
+    assert [backend.consume("k", RATE, now) for _ in range(3)] == [0.0, 0.0, 0.0]
+    # One token refills every 20 seconds
+    assert backend.consume("k", RATE, now) == pytest.approx(20.0)
+    assert backend.consume("k", RATE, now + 10) == pytest.approx(10.0)
+    assert backend.consume("k", RATE, now + 20) == 0.0
+
+
+def test_buckets_are_independent(backend):
+    for _ in range(3):
+        backend.consume("a", RATE, 1000.0)
+    assert backend.consume("a", RATE, 1000.0) > 0
+    assert backend.consume("b", RATE, 1000.0) == 0.0
+
+
+def test_memory_sweep_drops_refilled_buckets():
+    backend = MemoryRateLimitBackend()
+    backend.consume("one-off", RATE, 1000.0)
+    backend.consume("busy", RATE, 1000.0)
+    later = 1000.0 + SWEEP_SECONDS
+    for _ in range(3):
+        backend.consume("busy", RATE, later)
+    backend.consume("busy", RATE, later + 1)
+    assert len(backend) == 1
+
+
+def test_prune_full_buckets(sqlite_engine, monkeypatch):
+    from backend.core import config
+
+    monkeypatch.setattr(config, "RATE_LIMITS", {"read": "3/minute", "match": "3/minute"})
+    backend = DatabaseRateLimitBackend(sqlite_engine)
+    backend.consume("read:GET:/jobs/:ip:1", RATE, 1000.0)
+    for _ in range(3):
+        backend.consume("match:POST:/match/:ip:1", RATE, 1000.0)
+
+    with sqlite_engine.begin() as conn:
+        # One token missing refills in 20s, three in 60s
+        assert prune_full_buckets(conn, 1030.0) == 1
+        assert conn.execute(select(func.count()).select_from(RateLimitBucket)).scalar_one() == 1
+        assert prune_full_buckets(conn, 1060.0) == 1
+
+
+def test_concurrency_limiter():
+    limiter = ConcurrencyLimiter(2)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+    limiter.release()
+    assert limiter.try_acquire()
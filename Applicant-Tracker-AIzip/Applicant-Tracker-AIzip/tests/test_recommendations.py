@@ -0,0 +1,64 @@
+from backend.database.models import JobDescription, User
+from backend.services.ai_engine import extract_resume_keywords
+from backend.services.matching_engine import match_resume_to_job
+from backend.services.recommendations import JobIndex, ResumeProbe, fit_score
+from backend.services.vocabulary import get_vocabulary
+
+
+def add_job(db, recruiter_id, job_id, description="python"):
+    db.add(JobDescription(id=job_id, recruiter_id=recruiter_id, title=f"Job {job_id}", description=description))
+    db.commit()
+
+
+def test_index_catches_up_on_new_jobs(session_factory):
+    index = JobIndex()
+    with session_factory() as db:
+        recruiter = User(email="r@example.com", password_hash="x", role="recruiter")
+        db.add(recruiter)
+        db.commit()
+        add_job(db, recruiter.id, 1)
+        add_job(db, recruiter.id, 2)
+        assert index.refresh(db) == 2
+        assert index.refresh(db) == 0
+        add_job(db, recruiter.id, 3)
+        assert index.refresh(db) == 1
+    assert [entry.id for entry in index.since(1)] == [2, 3]
+
+
+def test_job_committed_after_a_higher_id_is_indexed(session_factory):
+    index = JobIndex()
+    with session_factory() as db:
+        recruiter = User(email="r@example.com", password_hash="x", role="recruiter")
+        db.add(recruiter)
+        db.commit()
+        add_job(db, recruiter.id, 1)
+        add_job(db, recruiter.id, 3)
+        index.refresh(db)
+        # Id 2 was assigned first but committed last
+        add_job(db, recruiter.id, 2, description="rust")
+        assert index.refresh(db) == 1
+        assert index.refresh(db) == 0
+    assert index.get(2) is not None
+    assert [entry.id for entry in index.late_entries()] == [2]
+
+
+def test_scores_match_the_matching_engine_without_growing_the_vocabulary(session_factory):
+    resume_text = "Python developer with SQL, Docker and some zyxwv experience"
+    descriptions = {1: "python sql kubernetes", 2: "zyxwv docker qwertz", 3: "java"}
+    index = JobIndex()
+    vocabulary = get_vocabulary()
+    with session_factory() as db:
+        recruiter = User(email="r@example.com", password_hash="x", role="recruiter")
+        db.add(recruiter)
+        db.commit()
+        for job_id, description in descriptions.items():
+            add_job(db, recruiter.id, job_id, description)
+        terms = len(vocabulary)
+        index.refresh(db)
+    assert len(vocabulary) == terms
+    assert vocabulary.lookup("qwertz") is None
+
+    probe = ResumeProbe.from_terms(extract_resume_keywords(resume_text), vocabulary)
+    for job_id, description in descriptions.items():
+        expected = match_resume_to_job(resume_text, description)["score"]
+        assert fit_score(probe, index.get(job_id)) == expected
@@ -0,0 +1,128 @@
+import json
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from starlette.requests import Request
+
+from backend.core import read_routing
+from backend.coordination import get_cache
+from backend.database import replicas as replica_module
+from backend.database.db import engine as primary_engine
+from backend.database.replicas import ReplicaSet
+
+
+@pytest.fixture
+def replica_engine(tmp_path):
+    # A second SQLite file stands in for a replica of the primary file
+    engine = create_engine(f"sqlite:///{tmp_path}/replica.db", connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def unreachable_engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path}/missing/dir/replica.db")
+
+
+@pytest.fixture
+def install_replicas():
+    previous = replica_module.get_replicas()
+
+    def install(replica_set):
+        replica_module.set_replicas(replica_set)
+        return replica_set
+
+    yield install
+    replica_module.set_replicas(previous)
+    get_cache().clear()
+
+
+def bind_of(session):
+    try:
+        return session.get_bind()
+    finally:
+        session.close()
+
+
+def test_current_replica_serves_reads(replica_engine):
+    replicas = ReplicaSet([replica_engine], max_lag_seconds=5, check_seconds=5)
+    assert bind_of(replicas.session()) is replica_engine
+
+
+def test_lagging_replica_falls_back_to_primary(replica_engine):
+    replicas = ReplicaSet([replica_engine], max_lag_seconds=5, check_seconds=5,
+                          probes={"sqlite": lambda conn: 60.0})
+    assert bind_of(replicas.session()) is primary_engine
+    assert replicas.status()[0]["usable"] is False
+
+
+def test_unreachable_replica_falls_back_and_reports_null_lag(replica_engine, unreachable_engine):
+    replicas = ReplicaSet([unreachable_engine, replica_engine], max_lag_seconds=5, check_seconds=60)
+    # Round-robin skips the unreachable replica on every turn
+    assert {bind_of(replicas.session()) for _ in range(4)} == {replica_engine}
+    status = {entry["replica"]: entry for entry in replicas.status()}
+    unreachable = status[unreachable_engine.url.render_as_string(hide_password=True)]
+    assert (unreachable["lag_seconds"], unreachable["reachable"], unreachable["usable"]) == (None, False, False)
+    json.dumps(replicas.status())
+
+
+def test_lag_is_rechecked_after_the_interval(replica_engine):
+    lags = iter([60.0, 0.0])
+    replicas = ReplicaSet([replica_engine], max_lag_seconds=5, check_seconds=0,
+                          probes={"sqlite": lambda conn: next(lags)})
+    assert bind_of(replicas.session()) is primary_engine
+    assert bind_of(replicas.session()) is replica_engine
+
+
+def test_no_replicas_means_primary():
+    assert bind_of(ReplicaSet([], max_lag_seconds=5, check_seconds=5).session()) is primary_engine
+
+
+def request_with(cookies=None, client=("10.0.0.1", 1234)) -> Request:
+    headers = []
+    if cookies:
+        cookie = "; ".join(f"{name}={value}" for name, value in cookies.items())
+        headers.append((b"cookie", cookie.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "client": client})
+
+
+def read_bind(request):
+    dependency = read_routing.get_read_db(request)
+    session = next(dependency)
+    try:
+        return session.get_bind()
+    finally:
+        dependency.close()
+
+
+def test_reads_stick_to_the_primary_after_a_write(replica_engine, install_replicas):
+    install_replicas(ReplicaSet([replica_engine], max_lag_seconds=5, check_seconds=5))
+    get_cache().clear()
+    assert read_bind(request_with()) is replica_engine
+
+    # Cookie alone: another worker with its own memory cache
+    fresh = {read_routing.LAST_WRITE_COOKIE: f"{time.time():.3f}"}
+    assert read_bind(request_with(fresh)) is primary_engine
+    stale = {read_routing.LAST_WRITE_COOKIE: f"{time.time() - 3600:.3f}"}
+    assert read_bind(request_with(stale)) is replica_engine
+
+    # Cache mark alone: clients that don't keep cookies
+    read_routing.mark_recent_write("ip:10.0.0.1")
+    assert read_bind(request_with()) is primary_engine
+
+
+def test_write_response_sets_the_last_write_cookie(client, signup, replica_engine, install_replicas):
+    install_replicas(ReplicaSet([replica_engine], max_lag_seconds=5, check_seconds=5))
+    response = client.post("/jobs/", json={"title": "T", "description": "python"}, headers=signup("recruiter"))
+    assert response.status_code == 200
+    assert read_routing.LAST_WRITE_COOKIE in response.cookies
+    client.cookies.clear()
+
+
+def test_metrics_with_unreachable_replica(client, unreachable_engine, install_replicas):
+    install_replicas(ReplicaSet([unreachable_engine], max_lag_seconds=5, check_seconds=5))
+    replica_module.get_replicas().session().close()
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.json()["replicas"][0]["reachable"] is False
@@ -0,0 +1,118 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, select
+
+from backend.core import config
+from backend.database.models import IdempotencyKey, MatchResult, MatchResultArchive
+from backend.services import retention
+from backend.services.retention import add_match_results, claim_run, compact, save_match_results
+
+
+def result(resume_id, score, job_id=1, created_at=None):
+    return {
+        "resume_id": resume_id,
+        "job_id": job_id,
+        "score": score,
+        "missing_keywords": "",
+        "created_at": created_at or datetime.utcnow(),
+    }
+
+
+def scores(db, model=MatchResult):
+    return sorted(db.execute(select(model.resume_id, model.score)).tuples())
+
+
+@pytest.fixture(params=["on_conflict", "select_then_write"])
+def upsert_path(request, monkeypatch):
+    if request.param == "select_then_write":
+        monkeypatch.setattr(retention, "supports_on_conflict", lambda bind: False)
+
+
+def test_save_replaces_the_result_and_archives_the_old_one(session_factory, upsert_path):
+    with session_factory() as db:
+        save_match_results(db, [result(1, 10.0), result(2, 20.0)])
+        db.commit()
+        save_match_results(db, [result(1, 15.0)])
+        db.commit()
+        assert scores(db) == [(1, 15.0), (2, 20.0)]
+        assert scores(db, MatchResultArchive) == [(1, 10.0)]
+        archived = db.execute(select(MatchResultArchive)).scalar_one()
+        assert archived.match_id == db.execute(
+            select(MatchResult.id).where(MatchResult.resume_id == 1)
+        ).scalar_one()
+
+
+def test_save_without_history_keeps_no_archive(session_factory, monkeypatch):
+    monkeypatch.setattr(config, "MATCH_HISTORY_ENABLED", False)
+    with session_factory() as db:
+        save_match_results(db, [result(1, 10.0)])
+        save_match_results(db, [result(1, 15.0)])
+        db.commit()
+        assert scores(db) == [(1, 15.0)]
+        assert scores(db, MatchResultArchive) == []
+
+
+def test_add_keeps_existing_results(session_factory, upsert_path):
+    with session_factory() as db:
+        save_match_results(db, [result(1, 10.0)])
+        add_match_results(db, [result(1, 99.0), result(2, 20.0)])
+        db.commit()
+        assert scores(db) == [(1, 10.0), (2, 20.0)]
+
+
+def test_compact_exports_old_archive_rows_and_prunes_keys(sqlite_engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "ARCHIVE_DIR", tmp_path / "archive")
+    monkeypatch.setattr(config, "ARCHIVE_FORMAT", "jsonl")
+    monkeypatch.setattr(config, "ARCHIVE_BATCH_SIZE", 2)
+    monkeypatch.setattr(config, "MATCH_ARCHIVE_DAYS", 30)
+    now = datetime(2024, 6, 1)
+    with sqlite_engine.begin() as conn:
+        conn.execute(insert(MatchResultArchive), [
+            {"match_id": i, "resume_id": i, "job_id": 1, "score": float(i), "missing_keywords": "",
+             "created_at": now, "archived_at": now - timedelta(days=age)}
+            for i, age in enumerate([90, 60, 45, 31, 1])
+        ])
+        conn.execute(insert(IdempotencyKey), [
+            {"user_id": 1, "endpoint": "apply", "key": key, "resource_id": 1,
+             "created_at": now - timedelta(hours=hours)}
+            for key, hours in (("old", config.IDEMPOTENCY_KEY_TTL_HOURS + 1), ("new", 1))
+        ])
+
+    stats = compact(now=now, bind=sqlite_engine)
+    assert (stats.archive_rows_exported, stats.archive_files_written) == (4, 2)
+    assert stats.idempotency_keys_pruned == 1
+    assert stats.rows_reclaimed >= 5
+
+    files = sorted((tmp_path / "archive").glob("*.jsonl.gz"))
+    exported = [json.loads(line) for path in files for line in gzip.open(path).read().splitlines()]
+    assert [row["match_id"] for row in exported] == [0, 1, 2, 3]
+    with sqlite_engine.connect() as conn:
+        assert conn.execute(select(MatchResultArchive.match_id)).scalars().all() == [4]
+        assert conn.execute(select(IdempotencyKey.key)).scalars().all() == ["new"]
+
+    # Nothing left to export
+    assert compact(now=now, bind=sqlite_engine).archive_rows_exported == 0
+
+
+def test_only_one_caller_claims_each_interval(sqlite_engine):
+    assert claim_run("test", 60, now=1000.0, bind=sqlite_engine)
+    assert not claim_run("test", 60, now=1030.0, bind=sqlite_engine)
+    assert claim_run("test", 60, now=1061.0, bind=sqlite_engine)
+
+
+def test_match_history_includes_archived_results(client, signup):
+    recruiter, candidate = signup("recruiter"), signup("candidate")
+    job_id = client.post("/jobs/", json={"title": "Backend", "description": "python sql"},
+                         headers=recruiter).json()["id"]
+    resume_id = client.post("/resumes/", json={"content": "python"}, headers=candidate).json()["id"]
+    client.post("/match/", json={"resume_id": resume_id, "job_id": job_id}, headers=candidate)
+    client.post("/resumes/", json={"content": "python sql"}, headers=candidate)
+    client.post("/match/", json={"resume_id": resume_id, "job_id": job_id}, headers=candidate)
+
+    current = client.get("/match/me", headers=candidate).json()
+    assert [(row["score"], row["archived"]) for row in current] == [(100.0, False)]
+    history = client.get("/match/me?include_archived=true", headers=candidate).json()
+    assert [(row["score"], row["archived"]) for row in history] == [(100.0, False), (50.0, True)]
@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import delete, update
+
+from backend.database import search
+from backend.database.models import JobDescription, User
+from backend.database.search import _fts5_query, install_search, search_jobs
+
+
+@pytest.fixture
+def db(session_factory, sqlite_engine):
+    install_search(sqlite_engine)
+    with session_factory() as session:
+        recruiter = User(email="r@example.com", password_hash="x", role="recruiter")
+        session.add(recruiter)
+        session.commit()
+        session.info["recruiter_id"] = recruiter.id
+        yield session
+
+
+def add_job(db, title, description):
+    job = JobDescription(recruiter_id=db.info["recruiter_id"], title=title, description=description)
+    db.add(job)
+    db.commit()
+    return job.id
+
+
+def titles(db, query, **kwargs):
+    return [job.title for job, _ in search_jobs(db, query, **kwargs)[1]]
+
+
+def test_triggers_keep_the_index_in_sync(db):
+    job_id = add_job(db, "Backend engineer", "python services")
+    assert titles(db, "python") == ["Backend engineer"]
+
+    db.execute(update(JobDescription).where(JobDescription.id == job_id).values(description="rust services"))
+    db.commit()
+    assert titles(db, "python") == []
+    assert titles(db, "rust") == ["Backend engineer"]
+
+    db.execute(delete(JobDescription).where(JobDescription.id == job_id))
+    db.commit()
+    assert titles(db, "rust") == []
+
+
+def test_rows_written_before_install_are_indexed(session_factory, sqlite_engine):
+    with session_factory() as db:
+        recruiter = User(email="r@example.com", password_hash="x", role="recruiter")
+        db.add(recruiter)
+        db.commit()
+        db.add(JobDescription(recruiter_id=recruiter.id, title="Legacy", description="cobol"))
+        db.commit()
+        install_search(sqlite_engine)
+        assert titles(db, "cobol") == ["Legacy"]
+
+
+def test_title_matches_rank_above_description_matches(db):
+    add_job(db, "Data analyst", "python reporting")
+    add_job(db, "Python developer", "web services")
+    add_job(db, "Designer", "figma")
+    total, rows = search_jobs(db, "python")
+    assert total == 2
+    assert [job.title for job, _ in rows] == ["Python developer", "Data analyst"]
+    assert rows[0].rank > rows[1].rank
+
+
+def test_last_term_matches_as_a_prefix_and_pages(db):
+    for i in range(3):
+        add_job(db, f"Kubernetes operator {i}", "cluster work")
+    assert len(titles(db, "kube")) == 3
+    total, rows = search_jobs(db, "kube", limit=2, offset=2)
+    assert (total, len(rows)) == (3, 1)
+
+
+@pytest.mark.parametrize("query", ['"unbalanced', "python OR", "NEAR(python", "col:python", "-python", "*"])
+def test_user_input_cannot_inject_fts_syntax(db, query):
+    add_job(db, "Backend", "python")
+    search_jobs(db, query)
+
+
+def test_query_terms_are_quoted():
+    assert _fts5_query(["python", "or", "sq"]) == '"python" "or" "sq"*'
+
+
+def test_like_fallback(db, monkeypatch):
+    add_job(db, "Backend", "python services")
+    monkeypatch.setitem(search._search_modes, "sqlite", "like")
+    assert titles(db, "PYTHON") == ["Backend"]
+    assert titles(db, "!!!") == []
@@ -0,0 +1,53 @@
+from backend.services.skill_taxonomy import SkillMatcher, split_tokens
+
+TAXONOMY = {
+    "machine learning": ["ml"],
+    "machine  learning ops": ["mlops"],
+    "kubernetes": ["k8s", "kube"],
+    "c++": ["cpp"],
+    ".net": ["dotnet"],
+    "node.js": ["nodejs", "node js"],
+    "Go": ["golang"],
+}
+
+
+def extract(text):
+    return SkillMatcher(TAXONOMY).extract(text)
+
+
+def test_synonyms_become_the_canonical_skill():
+    assert extract("ML on k8s with cpp, dotnet and golang") == {
+        "machine learning", "kubernetes", "c++", ".net", "Go",
+    }
+
+
+def test_multi_word_phrases_are_one_keyword():
+    assert extract("Machine\nLearning engineer") == {"machine learning", "engineer"}
+    assert extract("node js developer") == {"node.js", "developer"}
+
+
+def test_longest_phrase_wins():
+    # The canonical name is reported with its spaces collapsed
+    assert extract("machine learning ops") == {"machine learning ops"}
+    assert extract("machine learning") == {"machine learning"}
+
+
+def test_partial_phrase_falls_back_to_plain_keywords():
+    assert extract("machine shop") == {"machine", "shop"}
+
+
+def test_edge_punctuation_keeps_skill_symbols():
+    assert split_tokens("(C++), .NET; node.js!") == ["c++", ".net", "node.js"]
+    assert extract("(C++), .NET; node.js!") == {"c++", ".net", "node.js"}
+
+
+def test_plain_tokens_lose_punctuation_and_stopwords():
+    assert extract("The e-mail and the re-use of it") == {"email", "reuse"}
+
+
+def test_canonical_terms_are_reported_once():
+    matcher = SkillMatcher(TAXONOMY)
+    assert matcher.canonical_terms() == sorted(
+        {"machine learning", "machine learning ops", "kubernetes", "c++", ".net", "node.js", "Go"}
+    )
+    assert matcher.max_phrase_tokens == 3
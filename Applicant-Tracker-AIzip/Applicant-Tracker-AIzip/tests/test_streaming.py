@@ -0,0 +1,50 @@
+import json
+from datetime import datetime
+
+from backend.utils import serialization
+from backend.utils.serialization import iter_json_array, iter_ndjson
+
+
+def test_json_array_encodes_rows_one_at_a_time(monkeypatch):
+    monkeypatch.setattr(serialization, "STREAM_CHUNK_SIZE", 16)
+    rows = [{"id": i, "created_at": datetime(2024, 1, i + 1)} for i in range(5)]
+    chunks = list(iter_json_array(iter(rows)))
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == [
+        {"id": i, "created_at": f"2024-01-0{i + 1}T00:00:00"} for i in range(5)
+    ]
+    assert b"".join(iter_json_array([])) == b"[]"
+
+
+def test_ndjson_writes_one_object_per_line():
+    body = b"".join(iter_ndjson([{"a": 1}, {"a": None}]))
+    assert body.splitlines() == [b'{"a":1}', b'{"a":null}']
+
+
+def test_streamed_applications_match_the_regular_response(client, signup):
+    recruiter = signup("recruiter")
+    job_id = client.post("/jobs/", json={"title": "Backend", "description": "python sql docker"},
+                         headers=recruiter).json()["id"]
+    candidates = [signup("candidate") for _ in range(3)]
+    for i, candidate in enumerate(candidates):
+        # The last candidate has no resume, so no match score
+        if i < 2:
+            resume_id = client.post("/resumes/", json={"content": "python" if i else "python sql"},
+                                    headers=candidate).json()["id"]
+            client.post("/match/", json={"resume_id": resume_id, "job_id": job_id}, headers=candidate)
+        assert client.post("/applications/", json={"job_id": job_id}, headers=candidate).status_code == 200
+
+    regular = client.get(f"/applications/job/{job_id}", headers=recruiter).json()
+    streamed = client.get(f"/applications/job/{job_id}?stream=true", headers=recruiter)
+    assert streamed.headers["content-type"] == "application/json"
+    assert streamed.json() == regular
+    assert [row["match_score"] for row in regular] == [66.67, 33.33, None]
+
+    mine = client.get("/applications/me", headers=candidates[0]).json()
+    assert client.get("/applications/me?stream=true", headers=candidates[0]).json() == mine
+
+
+def test_streaming_keeps_the_access_check(client, signup):
+    owner, other = signup("recruiter"), signup("recruiter")
+    job_id = client.post("/jobs/", json={"title": "Data", "description": "sql"}, headers=owner).json()["id"]
+    assert client.get(f"/applications/job/{job_id}?stream=true", headers=other).status_code == 403
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+from sqlalchemy import insert
+
+from backend.database.models import VocabularyTerm
+from backend.services.vocabulary import (
+    KeywordSet,
+    Vocabulary,
+    count_in,
+    difference,
+    intersection,
+    intersection_count,
+)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_set_operations_match_python_sets(seed):
+    rng = random.Random(seed)
+    a = set(rng.sample(range(10_000), 300))
+    b = set(rng.sample(range(10_000), 60)) | set(list(a)[:20])
+    ka, kb = KeywordSet.from_ids(a), KeywordSet.from_ids(b)
+
+    assert list(intersection(ka, kb)) == sorted(a & b)
+    assert list(difference(kb, ka)) == sorted(b - a)
+    assert intersection_count(ka, kb) == intersection_count(kb, ka) == len(a & b)
+    assert count_in(ka.probe(), kb) == len(a & b)
+
+
+def test_keyword_set_is_sorted_and_deduplicated():
+    keywords = KeywordSet.from_ids([5, 1, 5, 3])
+    assert list(keywords) == [1, 3, 5]
+    assert len(keywords) == 3
+    assert keywords.ids.itemsize == 4
+
+
+def test_intern_is_stable():
+    vocabulary = Vocabulary()
+    first = vocabulary.keyword_set(["python", "sql"])
+    again = vocabulary.keyword_set(["sql", "python", "go"])
+    assert set(first) < set(again)
+    assert vocabulary.terms(first) == ["python", "sql"]
+    assert vocabulary.term(vocabulary.lookup("go")) == "go"
+
+
+def test_known_set_does_not_intern():
+    vocabulary = Vocabulary()
+    vocabulary.intern("python")
+    known = vocabulary.known_set(["python", "one-off"])
+    assert vocabulary.terms(known) == ["python"]
+    assert len(vocabulary) == 1
+    assert vocabulary.lookup("one-off") is None
+
+
+def test_save_writes_a_snapshot_that_load_maps(sqlite_engine, tmp_path):
+    snapshot = tmp_path / "vocabulary.snapshot"
+    writer = Vocabulary()
+    writer.keyword_set(["python", "machine learning", "c++"])
+    writer.save(sqlite_engine, snapshot)
+    assert snapshot.read_text(encoding="utf-8").splitlines() == ["3", "python", "machine learning", "c++"]
+
+    # A term another worker saved after the snapshot is read from the table
+    with sqlite_engine.begin() as conn:
+        conn.execute(insert(VocabularyTerm).values(term="rust"))
+    reader = Vocabulary()
+    reader.load(sqlite_engine, snapshot)
+    assert [reader.term(i) for i in range(len(reader))] == ["python", "machine learning", "c++", "rust"]
+
+
+def test_load_without_snapshot_reads_the_table(sqlite_engine, tmp_path):
+    with sqlite_engine.begin() as conn:
+        conn.execute(insert(VocabularyTerm), [{"term": "go"}, {"term": "sql"}])
+    empty = tmp_path / "empty.snapshot"
+    empty.touch()
+    for snapshot in (tmp_path / "missing.snapshot", empty):
+        vocabulary = Vocabulary()
+        vocabulary.load(sqlite_engine, snapshot)
+        assert vocabulary.terms(KeywordSet.from_ids(range(len(vocabulary)))) == ["go", "sql"]
+
+
+def test_save_skips_terms_already_persisted(sqlite_engine, tmp_path):
+    snapshot = tmp_path / "vocabulary.snapshot"
+    first, second = Vocabulary(), Vocabulary()
+    first.keyword_set(["python"])
+    second.keyword_set(["python", "go"])
+    first.save(sqlite_engine, snapshot)
+    second.save(sqlite_engine, snapshot)
+    assert snapshot.read_text(encoding="utf-8").splitlines() == ["2", "python", "go"]